@@ -0,0 +1,436 @@
+# app/controllers/async_controllers.py
+"""
+Asynchronous controllers mirroring the synchronous ones on top of the
+async repositories. Permission and ownership rules are the same (and
+reuse the same helpers); only data access is awaited. Listings return
+read-only rows, streams and pages are async iterators.
+"""
+
+from datetime import datetime
+
+from app.controllers.contract_controller import ContractController
+from app.controllers.event_controller import EventController
+from app.models.client import Client
+from app.models.contract import Contract
+from app.models.employee import Employee
+from app.models.event import Event
+from app.repositories.async_repositories import (
+    AsyncClientRepository,
+    AsyncContractRepository,
+    AsyncEmployeeRepository,
+    AsyncEventRepository,
+)
+from app.repositories.base_repository import DEFAULT_PAGE_SIZE
+from app.utils.audit import audit
+from app.utils.auth import get_password_service
+from app.utils.decorators import require_auth
+
+
+class AsyncClientController:
+    """Manages client-related operations asynchronously."""
+
+    def __init__(self, repository: AsyncClientRepository, auth_controller):
+        self.repository = repository
+        self.auth_controller = auth_controller
+
+    @require_auth
+    async def list_all_clients(self, user_data: dict, stream: bool = False):
+        """
+        Fetch all clients if the user has the 'read_client' permission.
+        With stream=True, return an async row iterator instead of a list.
+        """
+        self.auth_controller.current_user_data = user_data
+        if not self.auth_controller.check_user_permission("read_client"):
+            return []
+        if stream:
+            return self.repository.stream_all_clients(rows=True)
+        return await self.repository.get_all_clients(rows=True)
+
+    @require_auth
+    async def paginate_clients(
+        self,
+        user_data: dict,
+        after_id: int = 0,
+        page_size: int = DEFAULT_PAGE_SIZE,
+    ):
+        """Return (total, async pages) for a keyset-paginated listing."""
+        self.auth_controller.current_user_data = user_data
+        if not self.auth_controller.check_user_permission("read_client"):
+            return None
+        total = await self.repository.count()
+        return total, self.repository.iter_pages(
+            after_id, page_size, rows=True
+        )
+
+    @require_auth
+    async def create_client(self, user_data: dict, client_data: dict):
+        """Create a new client and associate with the current sales person."""
+        self.auth_controller.current_user_data = user_data
+        if not self.auth_controller.check_user_permission("create_client"):
+            print("Access denied: You do not have permission to create a client.")
+            return None
+
+        client_data["sales_contact_id"] = user_data["id"]
+        if not client_data.get("last_contact"):
+            client_data["last_contact"] = datetime.now()
+
+        created_client = await self.repository.add(Client(**client_data))
+        if created_client:
+            print(f"Client '{created_client.full_name}' created.")
+        return created_client
+
+    @require_auth
+    async def update_client(self, user_data: dict, client_id: int, updates: dict):
+        """Update client if user is assigned sales contact or management."""
+        self.auth_controller.current_user_data = user_data
+        if not self.auth_controller.check_user_permission("update_client"):
+            print("Access denied: No update permission.")
+            return None
+
+        client = await self.repository.get_by_id(client_id)
+        if not client:
+            print("Client not found.")
+            return None
+
+        is_owner = client.sales_contact_id == user_data["id"]
+        is_management = user_data["department"] == "MANAGEMENT"
+        if not (is_owner or is_management):
+            print("Access denied: You are not the assigned sales contact.")
+            return None
+
+        updates["last_contact"] = datetime.now()
+        updated_client = await self.repository.update(client_id, updates)
+        if updated_client:
+            print(f"Client '{updated_client.full_name}' updated.")
+        return updated_client
+
+
+class AsyncContractController:
+    """Manages contract-related operations asynchronously."""
+
+    def __init__(self, repository: AsyncContractRepository, auth_controller):
+        self.repository = repository
+        self.auth_controller = auth_controller
+
+    @require_auth
+    async def list_all_contracts(self, user_data: dict, stream: bool = False):
+        """Fetch all contracts if allowed."""
+        self.auth_controller.current_user_data = user_data
+        if not self.auth_controller.check_user_permission("read_contract"):
+            return None
+        if stream:
+            return self.repository.stream_all_contracts(rows=True)
+        return await self.repository.get_all_contracts(rows=True)
+
+    @require_auth
+    async def paginate_contracts(
+        self,
+        user_data: dict,
+        after_id: int = 0,
+        page_size: int = DEFAULT_PAGE_SIZE,
+    ):
+        """Return (total, async pages) for a keyset-paginated listing."""
+        self.auth_controller.current_user_data = user_data
+        if not self.auth_controller.check_user_permission("read_contract"):
+            return None
+        total = await self.repository.count()
+        return total, self.repository.iter_pages(
+            after_id, page_size, rows=True
+        )
+
+    async def _list_owned(self, user_data: dict, stream: bool, kind: str):
+        """Shared body of the unsigned/unpaid listings."""
+        self.auth_controller.current_user_data = user_data
+        if not self.auth_controller.check_user_permission("read_contract"):
+            return None
+
+        owner_id = ContractController._sales_owner_id(user_data)
+        if user_data.get("department") == "SALES" and owner_id is None:
+            return []
+        if stream:
+            return getattr(self.repository, f"stream_{kind}_contracts")(
+                rows=True, owner_id=owner_id
+            )
+        return await getattr(self.repository, f"get_{kind}_contracts")(
+            rows=True, owner_id=owner_id
+        )
+
+    @require_auth
+    async def list_unsigned_contracts(self, user_data: dict, stream: bool = False):
+        """List unsigned contracts, filtered for sales ownership."""
+        return await self._list_owned(user_data, stream, "unsigned")
+
+    @require_auth
+    async def list_unpaid_contracts(self, user_data: dict, stream: bool = False):
+        """List unpaid contracts, filtered for sales ownership."""
+        return await self._list_owned(user_data, stream, "unpaid")
+
+    @require_auth
+    async def create_contract(self, user_data: dict, contract_data: dict):
+        """Create a new contract for a client."""
+        self.auth_controller.current_user_data = user_data
+        if not self.auth_controller.check_user_permission("create_contract"):
+            print("Access denied: You do not have permission to create a contract.")
+            return None
+
+        if "sales_contact_id" not in contract_data:
+            client_id = contract_data.get("client_id")
+            if client_id is None:
+                print("Client ID is required to create a contract.")
+                return None
+            owners = await AsyncClientRepository(
+                self.repository.session
+            ).get_sales_contacts([client_id])
+            if client_id not in owners:
+                print("Client not found.")
+                return None
+            contract_data["sales_contact_id"] = owners[client_id]
+
+        created_contract = await self.repository.add(Contract(**contract_data))
+        if created_contract:
+            print(f"Contract {created_contract.id} created successfully.")
+        return created_contract
+
+    @require_auth
+    async def update_contract(
+        self, user_data: dict, contract_id: int, updates: dict
+    ):
+        """Update contract details; audits the signature transition."""
+        self.auth_controller.current_user_data = user_data
+        if not self.auth_controller.check_user_permission("update_contract"):
+            print("Access denied: No update permission for contracts.")
+            return None
+
+        contract = await self.repository.get_by_id(contract_id)
+        if not contract:
+            print("Contract not found.")
+            return None
+
+        was_signed = bool(contract.is_signed)
+        is_owner = contract.sales_contact_id == user_data["id"]
+        is_management = user_data["department"] == "MANAGEMENT"
+        if not (is_owner or is_management):
+            print("Access denied: You are not the assigned sales contact.")
+            return None
+
+        updated_contract = await self.repository.update(contract_id, updates)
+        if updated_contract:
+            print(f"Contract {updated_contract.id} updated.")
+            if not was_signed and bool(updated_contract.is_signed):
+                ContractController._audit_signed(
+                    user_data, updated_contract.id, updated_contract.client_id
+                )
+        return updated_contract
+
+    @require_auth
+    async def bulk_update_contracts(
+        self, user_data: dict, contract_ids: list, updates: dict
+    ):
+        """Apply the same updates to many contracts in one UPDATE."""
+        self.auth_controller.current_user_data = user_data
+        if not self.auth_controller.check_user_permission("update_contract"):
+            print("Access denied: No update permission for contracts.")
+            return None
+
+        criteria = ContractController._ownership_criteria(user_data)
+        signing = {}
+        if updates.get("is_signed"):
+            signing = await self.repository.get_unsigned_clients(
+                contract_ids, criteria
+            )
+
+        count = await self.repository.bulk_update(contract_ids, updates, criteria)
+        print(f"{count} contract(s) updated.")
+
+        for contract_id, client_id in signing.items():
+            ContractController._audit_signed(user_data, contract_id, client_id)
+        return count
+
+
+class AsyncEventController:
+    """Manages event-related operations asynchronously."""
+
+    def __init__(self, repository: AsyncEventRepository, auth_controller):
+        self.repository = repository
+        self.auth_controller = auth_controller
+
+    @require_auth
+    async def list_all_events(self, user_data: dict, stream: bool = False):
+        """Fetch all events if allowed."""
+        self.auth_controller.current_user_data = user_data
+        if not self.auth_controller.check_user_permission("read_event"):
+            return None
+        if stream:
+            return self.repository.stream_all_events(rows=True)
+        return await self.repository.get_all_events(rows=True)
+
+    @require_auth
+    async def paginate_events(
+        self,
+        user_data: dict,
+        after_id: int = 0,
+        page_size: int = DEFAULT_PAGE_SIZE,
+    ):
+        """Return (total, async pages) for a keyset-paginated listing."""
+        self.auth_controller.current_user_data = user_data
+        if not self.auth_controller.check_user_permission("read_event"):
+            return None
+        total = await self.repository.count()
+        return total, self.repository.iter_pages(
+            after_id, page_size, rows=True
+        )
+
+    @require_auth
+    async def list_events_without_support(
+        self, user_data: dict, stream: bool = False
+    ):
+        """List events that have no support contact assigned."""
+        self.auth_controller.current_user_data = user_data
+        if not self.auth_controller.check_user_permission("read_event"):
+            return None
+        if stream:
+            return self.repository.stream_events_without_support(rows=True)
+        return await self.repository.get_events_without_support(rows=True)
+
+    @require_auth
+    async def list_my_events(self, user_data: dict, stream: bool = False):
+        """List events assigned to the current support user."""
+        self.auth_controller.current_user_data = user_data
+        if not self.auth_controller.check_user_permission("read_event"):
+            return None
+        support_id = user_data.get("id")
+        if support_id is None:
+            return None
+        if stream:
+            return self.repository.stream_my_events(support_id, rows=True)
+        return await self.repository.get_my_events(support_id, rows=True)
+
+    @require_auth
+    async def create_event(self, user_data: dict, event_data: dict, contract):
+        """Create a new event if the contract is signed and user is the owner."""
+        self.auth_controller.current_user_data = user_data
+        if not self.auth_controller.check_user_permission("create_event"):
+            print("Access denied: No permission to create events.")
+            return None
+
+        if contract.sales_contact_id != user_data["id"]:
+            print("Access denied: You are not the sales contact for this client.")
+            return None
+
+        if not contract.is_signed:
+            print("Access denied: Cannot create an event for an unsigned contract.")
+            return None
+
+        created_event = await self.repository.add(Event(**event_data))
+        if created_event:
+            print(f"Event '{created_event.name}' created successfully.")
+        return created_event
+
+    @require_auth
+    async def update_event(self, user_data: dict, event_id: int, updates: dict):
+        """Update event details if user is assigned support or management."""
+        self.auth_controller.current_user_data = user_data
+        if not self.auth_controller.check_user_permission("update_event"):
+            print("Access denied: No update permission for events.")
+            return None
+
+        event = await self.repository.get_by_id(event_id)
+        if not event:
+            print("Event not found.")
+            return None
+
+        is_assigned = event.support_contact_id == user_data["id"]
+        is_management = user_data["department"] == "MANAGEMENT"
+        if not (is_assigned or is_management):
+            print("Access denied: You are not the assigned support contact.")
+            return None
+
+        updated_event = await self.repository.update(event_id, updates)
+        if updated_event:
+            print(f"Event '{updated_event.name}' updated.")
+        return updated_event
+
+    @require_auth
+    async def bulk_update_events(
+        self, user_data: dict, event_ids: list, updates: dict
+    ):
+        """Apply the same updates to many events in one UPDATE."""
+        self.auth_controller.current_user_data = user_data
+        if not self.auth_controller.check_user_permission("update_event"):
+            print("Access denied: No update permission for events.")
+            return None
+
+        count = await self.repository.bulk_update(
+            event_ids, updates, EventController._ownership_criteria(user_data)
+        )
+        print(f"{count} event(s) updated.")
+        return count
+
+
+class AsyncEmployeeController:
+    """Manages employee-related operations asynchronously."""
+
+    def __init__(self, repository: AsyncEmployeeRepository, auth_controller):
+        self.repository = repository
+        self.auth_controller = auth_controller
+
+    @require_auth
+    async def list_all_employees(self, user_data: dict, stream: bool = False):
+        """Fetch all employees if the user has 'read_employee'."""
+        self.auth_controller.current_user_data = user_data
+        if not self.auth_controller.check_user_permission("read_employee"):
+            return []
+        if stream:
+            return self.repository.stream_all_employees(rows=True)
+        return await self.repository.get_all_employees(rows=True)
+
+    @require_auth
+    async def create_employee(self, user_data: dict, employee_data: dict):
+        """
+        Create a new employee. Password hashing is CPU-bound and runs on
+        the bounded Argon2 pool so it does not stall the event loop.
+        """
+        self.auth_controller.current_user_data = user_data
+        if not self.auth_controller.check_user_permission("create_employee"):
+            return None
+
+        employee_data["password"] = await get_password_service().hash_async(
+            employee_data["password"]
+        )
+        created_employee = await self.repository.add(Employee(**employee_data))
+
+        if created_employee:
+            audit(
+                "employee.created",
+                actor_id=user_data.get("id"),
+                target_employee_id=created_employee.id,
+                department_id=created_employee.department_id,
+            )
+        return created_employee
+
+    @require_auth
+    async def update_employee(
+        self, user_data: dict, emp_id: int, update_data: dict
+    ):
+        """Update an existing employee's data."""
+        self.auth_controller.current_user_data = user_data
+        if not self.auth_controller.check_user_permission("update_employee"):
+            return None
+
+        updated_fields = sorted(update_data.keys())
+        if "password" in update_data:
+            update_data["password"] = await get_password_service().hash_async(
+                update_data["password"]
+            )
+
+        updated_emp = await self.repository.update(emp_id, update_data)
+        if updated_emp:
+            audit(
+                "employee.updated",
+                actor_id=user_data.get("id"),
+                target_employee_id=emp_id,
+                updated_fields=[
+                    f for f in updated_fields if f != "password"
+                ],
+            )
+        return updated_emp
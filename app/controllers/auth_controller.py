@@ -2,43 +2,75 @@
 """
 This module handles the authentication logic, integrating JWT generation
 and local storage to provide persistent user sessions.
+Login and session restore build a SessionContext once; permission checks
+on it are set lookups that never touch the token again.
 """
 
-from typing import Optional
-import sentry_sdk
-from app.repositories.employee_repository import EmployeeRepository
-from app.utils.auth import verify_password
-from app.utils.permissions import has_permission
-from app.utils.jwt_handler import create_token, decode_token
+from typing import TYPE_CHECKING, Optional
+from app.utils.lazy import lazy_import
+from app.utils.permissions import has_permission, report_denial
+from app.utils.jwt_handler import create_token, decode_token, forget_token
+from app.utils.session import SessionContext
 from app.utils.token_storage import save_token, get_token, delete_token
 
+if TYPE_CHECKING:
+    from app.repositories.employee_repository import EmployeeRepository
+
+# Session restore and the login prompt must not pay for loading the SDK
+sentry_sdk = lazy_import("sentry_sdk")
+
 
 class AuthController:
     """
     Controller managing login, logout, and persistent session validation.
     """
 
-    def __init__(self, employee_repository: EmployeeRepository):
+    def __init__(self, employee_repository: Optional["EmployeeRepository"]):
+        # May be attached later: restoring a session never queries the DB
         self.repository = employee_repository
         self.current_user_data: Optional[dict] = None
 
-    def login(self, email: str, password: str) -> Optional[dict]:
+    @property
+    def session(self) -> Optional[SessionContext]:
+        """The SessionContext of the logged-in user, if any."""
+        if isinstance(self.current_user_data, SessionContext):
+            return self.current_user_data
+        return None
+
+    def login(self, email: str, password: str) -> Optional[SessionContext]:
         """
         Authenticate user and save a JWT locally if successful.
+        Returns the SessionContext to pass as user_data to controllers.
         """
-        employee = self.repository.get_by_email(email)
+        # Argon2 is only needed for an actual login
+        from app.utils.auth import get_password_service
+
+        # Department joined in: the token and session need its name
+        employee = self.repository.get_by_email(email, profile="login")
+        if not employee:
+            return None
+
+        # Verification waits for a hashing worker (bounded Argon2 pool)
+        valid, new_hash = get_password_service().verify_and_update(
+            employee.password, password
+        )
+        if valid:
+            if new_hash:
+                self._migrate_password_hash(employee, new_hash)
 
-        if employee and verify_password(employee.password, password):
             # Generate and save token locally
             token = create_token(employee.id, employee.department.name)
             save_token(token)
 
             # Return user data for main.py session management
-            user_data = {
-                "id": employee.id,
-                "full_name": employee.full_name,
-                "department": employee.department.name
-            }
+            user_data = SessionContext(
+                {
+                    "id": employee.id,
+                    "full_name": employee.full_name,
+                    "department": employee.department.name
+                },
+                employee=employee,
+            )
 
             # Attach user identity to Sentry scope for error tracking
             sentry_sdk.set_user({
@@ -52,18 +84,33 @@ class AuthController:
 
         return None
 
+    def _migrate_password_hash(self, employee, new_hash: str) -> None:
+        """
+        Store a hash made with the current Argon2 parameters. A failure
+        is reported but never blocks the login.
+        """
+        try:
+            self.repository.update(
+                employee.id, {"password": new_hash}, refresh=False
+            )
+        except Exception as e:
+            sentry_sdk.capture_exception(e)
+
     def logout(self) -> None:
         """
         Clear the session by deleting the local token.
         """
+        # Drop its cached claims (every cached token if none is stored)
+        forget_token(get_token())
         delete_token()
         # Clear Sentry user context to avoid cross-user error reporting
         sentry_sdk.set_user(None)
         self.current_user_data = None
 
-    def get_logged_in_user(self) -> Optional[dict]:
+    def get_logged_in_user(self) -> Optional[SessionContext]:
         """
-        Validate the local token and return user data if still valid.
+        Validate the local token and return its SessionContext if still
+        valid. The employee row is only queried if the context needs it.
         """
         token = get_token()
         if not token:
@@ -76,8 +123,13 @@ class AuthController:
                 "id": str(payload.get("id")),
                 "department": payload.get("department")
             })
-            self.current_user_data = payload
-            return payload
+            context = SessionContext(
+                payload,
+                claims=payload,
+                load_employee=lambda emp_id: self.repository.get_by_id(emp_id),
+            )
+            self.current_user_data = context
+            return context
 
         # Token expired or invalid
         delete_token()
@@ -90,5 +142,12 @@ class AuthController:
         if not self.current_user_data:
             return False
 
+        context = self.session
+        if context is not None:
+            if context.can(action):
+                return True
+            report_denial(action, context.department)
+            return False
+
         dept = self.current_user_data.get("department")
         return has_permission(action, dept)
\ No newline at end of file
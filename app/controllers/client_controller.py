@@ -6,6 +6,7 @@ Ensures authentication and permission checks before data access.
 
 from datetime import datetime
 from app.models.client import Client
+from app.repositories.base_repository import DEFAULT_PAGE_SIZE
 from app.repositories.client_repository import ClientRepository
 from app.utils.decorators import require_auth
 
@@ -18,8 +19,16 @@ class ClientController:
         self.auth_controller = auth_controller
 
     @require_auth
-    def list_all_clients(self, *args, user_data: dict | None = None):
-        """Fetch all clients if the user has the 'read_client' permission."""
+    def list_all_clients(
+        self,
+        *args,
+        user_data: dict | None = None,
+        stream: bool = False,
+    ):
+        """
+        Fetch all clients if the user has the 'read_client' permission.
+        With stream=True, return a lazy row iterator instead of a list.
+        """
         if user_data is None and args:
             if isinstance(args[0], dict) and "id" in args[0]:
                 user_data = args[0]
@@ -30,9 +39,30 @@ class ClientController:
         self.auth_controller.current_user_data = user_data
         permission = "read_client"
         if self.auth_controller.check_user_permission(permission):
-            return self.repository.get_all_clients()
+            if stream:
+                return self.repository.stream_all_clients(rows=True)
+            return self.repository.get_all_clients(rows=True)
         return []
 
+    @require_auth
+    def paginate_clients(
+        self,
+        user_data: dict,
+        after_id: int = 0,
+        page_size: int = DEFAULT_PAGE_SIZE,
+    ):
+        """
+        Return (total, pages) for a keyset-paginated client listing.
+        Pages are fetched lazily, one query per page.
+        """
+        self.auth_controller.current_user_data = user_data
+        if not self.auth_controller.check_user_permission("read_client"):
+            return None
+        total = self.repository.count()
+        return total, self.repository.iter_pages(
+            after_id, page_size, rows=True
+        )
+
     @require_auth
     def create_client(
         self,
@@ -64,7 +94,7 @@ class ClientController:
                 client_data["last_contact"] = datetime.now()
 
             new_client = Client(**client_data)
-            created_client = self.repository.add(new_client)
+            created_client = self.repository.add(new_client, refresh=False)
 
             if created_client:
                 print(f"Client '{created_client.full_name}' created.")
@@ -98,7 +128,9 @@ class ClientController:
         updates["last_contact"] = datetime.now()
 
         # FIXED: Pass 'updates' as a dict to match BaseRepository.update signature
-        updated_client = self.repository.update(client_id, updates)
+        updated_client = self.repository.update(
+            client_id, updates, refresh=False
+        )
         if updated_client:
             print(f"Client '{updated_client.full_name}' updated.")
         return updated_client
@@ -3,11 +3,12 @@
 Controller handling business logic for Contract management.
 """
 
-import sentry_sdk
-
 from app.models.client import Client
 from app.models.contract import Contract
+from app.repositories.base_repository import DEFAULT_PAGE_SIZE
 from app.repositories.contract_repository import ContractRepository
+from app.repositories.unit_of_work import UnitOfWork, after_commit
+from app.utils.audit import audit
 from app.utils.decorators import require_auth
 
 
@@ -18,45 +19,84 @@ class ContractController:
         self.repository = repository
         self.auth_controller = auth_controller
 
+    def unit_of_work(self) -> UnitOfWork:
+        """Open a transaction grouping several controller calls."""
+        return self.repository.unit_of_work()
+
     @require_auth
-    def list_all_contracts(self, user_data: dict):
+    def list_all_contracts(self, user_data: dict, stream: bool = False):
         """
         Fetch all contracts if allowed.
+        With stream=True, return a lazy row iterator instead of a list.
         """
         self.auth_controller.current_user_data = user_data
         if self.auth_controller.check_user_permission("read_contract"):
-            return self.repository.get_all_contracts()
+            if stream:
+                return self.repository.stream_all_contracts(rows=True)
+            return self.repository.get_all_contracts(rows=True)
         return None
 
     @require_auth
-    def list_unsigned_contracts(self, user_data: dict):
+    def paginate_contracts(
+        self,
+        user_data: dict,
+        after_id: int = 0,
+        page_size: int = DEFAULT_PAGE_SIZE,
+    ):
+        """
+        Return (total, pages) for a keyset-paginated contract listing.
+        Pages are fetched lazily, one query per page.
+        """
+        self.auth_controller.current_user_data = user_data
+        if not self.auth_controller.check_user_permission("read_contract"):
+            return None
+        total = self.repository.count()
+        return total, self.repository.iter_pages(
+            after_id, page_size, rows=True
+        )
+
+    @require_auth
+    def list_unsigned_contracts(self, user_data: dict, stream: bool = False):
         """List unsigned contracts, optionally filtered for sales ownership."""
         self.auth_controller.current_user_data = user_data
         if not self.auth_controller.check_user_permission("read_contract"):
             return None
 
-        contracts = self.repository.get_unsigned_contracts()
-        if user_data.get("department") == "SALES":
-            return [
-                c for c in contracts
-                if c.sales_contact_id == user_data.get("id")
-            ]
-        return contracts
+        owner_id = self._sales_owner_id(user_data)
+        if user_data.get("department") == "SALES" and owner_id is None:
+            return []
+        if stream:
+            return self.repository.stream_unsigned_contracts(
+                rows=True, owner_id=owner_id
+            )
+        return self.repository.get_unsigned_contracts(
+            rows=True, owner_id=owner_id
+        )
 
     @require_auth
-    def list_unpaid_contracts(self, user_data: dict):
+    def list_unpaid_contracts(self, user_data: dict, stream: bool = False):
         """List unpaid contracts, optionally filtered for sales ownership."""
         self.auth_controller.current_user_data = user_data
         if not self.auth_controller.check_user_permission("read_contract"):
             return None
 
-        contracts = self.repository.get_unpaid_contracts()
+        owner_id = self._sales_owner_id(user_data)
+        if user_data.get("department") == "SALES" and owner_id is None:
+            return []
+        if stream:
+            return self.repository.stream_unpaid_contracts(
+                rows=True, owner_id=owner_id
+            )
+        return self.repository.get_unpaid_contracts(
+            rows=True, owner_id=owner_id
+        )
+
+    @staticmethod
+    def _sales_owner_id(user_data: dict):
+        """Return the owner filter applied to SALES users (None otherwise)."""
         if user_data.get("department") == "SALES":
-            return [
-                c for c in contracts
-                if c.sales_contact_id == user_data.get("id")
-            ]
-        return contracts
+            return user_data.get("id")
+        return None
 
     @require_auth
     def create_contract(self, user_data: dict, contract_data: dict):
@@ -81,7 +121,7 @@ class ContractController:
                 contract_data["sales_contact_id"] = client.sales_contact_id
 
             new_contract = Contract(**contract_data)
-            created_contract = self.repository.add(new_contract)
+            created_contract = self.repository.add(new_contract, refresh=False)
 
             if created_contract:
                 print(f"Contract {created_contract.id} created successfully.")
@@ -95,8 +135,8 @@ class ContractController:
         """
         Update contract details if user has permission.
 
-        Sentry audit:
-        - Logs contract signature when is_signed.
+        Audit:
+        - Queues a contract.signed record when is_signed.
         """
         self.auth_controller.current_user_data = user_data
         if not self.auth_controller.check_user_permission("update_contract"):
@@ -119,7 +159,9 @@ class ContractController:
             print("Access denied: You are not the assigned sales contact.")
             return None
 
-        updated_contract = self.repository.update(contract_id, updates)
+        updated_contract = self.repository.update(
+            contract_id, updates, refresh=False
+        )
 
         if updated_contract:
             print(f"Contract {updated_contract.id} updated.")
@@ -127,16 +169,129 @@ class ContractController:
             # Audit signature only on state transition False -> True
             now_signed = bool(updated_contract.is_signed)
             if (not was_signed) and now_signed:
-                sentry_sdk.set_tag("audit", "contract")
-                sentry_sdk.capture_message("contract.signed", level="info")
-                sentry_sdk.set_context(
-                    "contract_action",
-                    {
-                        "action": "signed",
-                        "actor_id": user_data.get("id"),
-                        "contract_id": updated_contract.id,
-                        "client_id": updated_contract.client_id,
+                contract_id = updated_contract.id
+                client_id = updated_contract.client_id
+                # Only once the signature is committed
+                after_commit(
+                    self.repository.session,
+                    lambda: self._audit_signed(
+                        user_data, contract_id, client_id
+                    ),
+                )
+
+        return updated_contract
+
+    @require_auth
+    def create_signed_contract(
+        self,
+        user_data: dict,
+        contract_data: dict,
+        event_data: dict | None = None,
+        event_controller=None,
+    ):
+        """
+        Create a contract, sign it and, when event_data is given, plan its
+        event through event_controller, all in a single commit.
+        If any step is refused or fails, nothing is saved.
+        Opt-in workflow for scripted flows: main.py creates contracts
+        (signed or not) with a single create_contract call.
+        """
+        if event_data is not None and event_controller is None:
+            raise ValueError("event_data requires an event_controller")
+        contract_data = {**contract_data, "is_signed": False}
+        with self.unit_of_work() as uow:
+            contract = self.create_contract(
+                user_data=user_data, contract_data=contract_data
+            )
+            if contract:
+                contract = self.update_contract(
+                    user_data=user_data,
+                    contract_id=contract.id,
+                    updates={"is_signed": True},
+                )
+            if contract and event_data is not None:
+                event = event_controller.create_event(
+                    user_data=user_data,
+                    event_data={
+                        **event_data,
+                        "client_id": contract.client_id,
+                        "contract_id": contract.id,
                     },
+                    contract=contract,
                 )
+                if not event:
+                    contract = None
+            if not contract:
+                uow.cancel()
+                print("Contract not saved.")
+        return contract
+
+    @staticmethod
+    def _audit_signed(user_data: dict, contract_id: int, client_id: int):
+        """Queue the contract.signed audit record."""
+        audit(
+            "contract.signed",
+            actor_id=user_data.get("id"),
+            contract_id=contract_id,
+            client_id=client_id,
+        )
+
+    @staticmethod
+    def _ownership_criteria(user_data: dict) -> tuple:
+        """
+        Restrict bulk writes like update_contract: Management can update
+        all contracts, other users only the ones they are assigned to.
+        """
+        if user_data["department"] == "MANAGEMENT":
+            return ()
+        return (Contract.sales_contact_id == user_data["id"],)
+
+    @require_auth
+    def bulk_update_contracts(
+        self, user_data: dict, contract_ids: list, updates: dict
+    ):
+        """
+        Apply the same updates to many contracts in one UPDATE.
+        Contracts the user may not update are skipped.
+        Returns the number of updated contracts.
+        """
+        self.auth_controller.current_user_data = user_data
+        if not self.auth_controller.check_user_permission("update_contract"):
+            print("Access denied: No update permission for contracts.")
+            return None
+
+        criteria = self._ownership_criteria(user_data)
+        signing = {}
+        if updates.get("is_signed"):
+            signing = self.repository.get_unsigned_clients(contract_ids, criteria)
+
+        count = self.repository.bulk_update(contract_ids, updates, criteria)
+        print(f"{count} contract(s) updated.")
+
+        for contract_id, client_id in signing.items():
+            self._audit_signed(user_data, contract_id, client_id)
+        return count
+
+    @require_auth
+    def bulk_update_contract_mappings(self, user_data: dict, rows: list):
+        """
+        Apply per-contract updates given as dicts with an "id" key.
+        Contracts the user may not update are skipped.
+        Returns the number of updated contracts.
+        """
+        self.auth_controller.current_user_data = user_data
+        if not self.auth_controller.check_user_permission("update_contract"):
+            print("Access denied: No update permission for contracts.")
+            return None
+
+        criteria = self._ownership_criteria(user_data)
+        signing = self.repository.get_unsigned_clients(
+            [row.get("id") for row in rows if row.get("is_signed")], criteria
+        )
+
+        count = self.repository.bulk_update_mappings(rows, criteria)
+        print(f"{count} contract(s) updated.")
 
-        return updated_contract
\ No newline at end of file
+        for contract_id, client_id in signing.items():
+            self._audit_signed(user_data, contract_id, client_id)
+        return count
\ No newline at end of file
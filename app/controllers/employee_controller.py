@@ -3,12 +3,11 @@
 Controller handling business logic for Employee management.
 """
 
-import sentry_sdk
-
 from app.models.employee import Employee
 from app.repositories.employee_repository import EmployeeRepository
+from app.utils.audit import audit
 from app.utils.decorators import require_auth
-from app.utils.auth import hash_password
+from app.utils.auth import get_password_service
 
 
 class EmployeeController:
@@ -19,50 +18,50 @@ class EmployeeController:
         self.auth_controller = auth_controller
 
     @require_auth
-    def list_all_employees(self, user_data: dict):
+    def list_all_employees(self, user_data: dict, stream: bool = False):
         """
         Fetch all employees if the user has the 'read_employee' permission.
+        With stream=True, return a lazy row iterator instead of a list.
         """
         self.auth_controller.current_user_data = user_data
 
         if self.auth_controller.check_user_permission("read_employee"):
-            return self.repository.get_all()
+            if stream:
+                return self.repository.stream_all_employees(rows=True)
+            return self.repository.get_all_employees(rows=True)
 
-        return []
+        return None
 
     @require_auth
     def create_employee(self, user_data: dict, employee_data: dict):
         """
         Create a new employee after permission check and password hashing.
-        Sentry audit:
-        - Logs each successful employee creation as an informational event.
+        Audit:
+        - Queues an employee.created record for each successful creation.
         """
         self.auth_controller.current_user_data = user_data
 
         if not self.auth_controller.check_user_permission("create_employee"):
             return None
 
-        # Hash the password before storage
-        employee_data["password"] = hash_password(employee_data["password"])
+        # Hash the password before storage (bounded Argon2 pool)
+        employee_data["password"] = get_password_service().hash(
+            employee_data["password"]
+        )
 
         # Create the instance
         new_employee = Employee(**employee_data)
 
         # Pass the instance (not the dict) to the repository
-        created_employee = self.repository.add(new_employee)
+        created_employee = self.repository.add(new_employee, refresh=False)
 
         # Audit log only on success
         if created_employee:
-            sentry_sdk.set_tag("audit", "employee")
-            sentry_sdk.capture_message("employee.created", level="info")
-            sentry_sdk.set_context(
-                "employee_action",
-                {
-                    "action": "created",
-                    "actor_id": user_data.get("id"),
-                    "target_employee_id": created_employee.id,
-                    "department_id": getattr(created_employee, "department_id", None),
-                },
+            audit(
+                "employee.created",
+                actor_id=user_data.get("id"),
+                target_employee_id=created_employee.id,
+                department_id=getattr(created_employee, "department_id", None),
             )
 
         return created_employee
@@ -72,8 +71,8 @@ class EmployeeController:
         """
         Update an existing employee's data.
 
-        Sentry audit:
-        - Logs each successful employee update as an informational event.
+        Audit:
+        - Queues an employee.updated record for each successful update.
         - Records which fields were updated (excluding password).
         """
         self.auth_controller.current_user_data = user_data
@@ -85,23 +84,22 @@ class EmployeeController:
         updated_fields = sorted(list(update_data.keys()))
 
         if "password" in update_data:
-            update_data["password"] = hash_password(update_data["password"])
+            update_data["password"] = get_password_service().hash(
+                update_data["password"]
+            )
 
-        updated_emp = self.repository.update(emp_id, update_data)
+        updated_emp = self.repository.update(
+            emp_id, update_data, refresh=False
+        )
 
         # Audit log only on success
         if updated_emp:
             safe_fields = [f for f in updated_fields if f != "password"]
 
-            sentry_sdk.set_tag("audit", "employee")
-            sentry_sdk.capture_message("employee.updated", level="info")
-            sentry_sdk.set_context(
-                "employee_action",
-                {
-                    "action": "updated",
-                    "actor_id": user_data.get("id"),
-                    "target_employee_id": emp_id,
-                    "updated_fields": safe_fields,
-                },
+            audit(
+                "employee.updated",
+                actor_id=user_data.get("id"),
+                target_employee_id=emp_id,
+                updated_fields=safe_fields,
             )
         return updated_emp
\ No newline at end of file
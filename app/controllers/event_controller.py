@@ -3,6 +3,7 @@ Controller handling business logic for Event management.
 """
 
 from app.models.event import Event
+from app.repositories.base_repository import DEFAULT_PAGE_SIZE
 from app.repositories.event_repository import EventRepository
 from app.utils.decorators import require_auth
 
@@ -15,25 +16,51 @@ class EventController:
         self.auth_controller = auth_controller
 
     @require_auth
-    def list_all_events(self, user_data: dict):
+    def list_all_events(self, user_data: dict, stream: bool = False):
         """
         Fetch all events if allowed.
+        With stream=True, return a lazy row iterator instead of a list.
         """
         self.auth_controller.current_user_data = user_data
         if self.auth_controller.check_user_permission("read_event"):
-            return self.repository.get_all_events()
+            if stream:
+                return self.repository.stream_all_events(rows=True)
+            return self.repository.get_all_events(rows=True)
         return None
 
     @require_auth
-    def list_events_without_support(self, user_data: dict):
+    def paginate_events(
+        self,
+        user_data: dict,
+        after_id: int = 0,
+        page_size: int = DEFAULT_PAGE_SIZE,
+    ):
+        """
+        Return (total, pages) for a keyset-paginated event listing.
+        Pages are fetched lazily, one query per page.
+        """
+        self.auth_controller.current_user_data = user_data
+        if not self.auth_controller.check_user_permission("read_event"):
+            return None
+        total = self.repository.count()
+        return total, self.repository.iter_pages(
+            after_id, page_size, rows=True
+        )
+
+    @require_auth
+    def list_events_without_support(
+        self, user_data: dict, stream: bool = False
+    ):
         """List events that have no support contact assigned."""
         self.auth_controller.current_user_data = user_data
         if not self.auth_controller.check_user_permission("read_event"):
             return None
-        return self.repository.get_events_without_support()
+        if stream:
+            return self.repository.stream_events_without_support(rows=True)
+        return self.repository.get_events_without_support(rows=True)
 
     @require_auth
-    def list_my_events(self, user_data: dict):
+    def list_my_events(self, user_data: dict, stream: bool = False):
         """List events assigned to the current support user."""
         self.auth_controller.current_user_data = user_data
         if not self.auth_controller.check_user_permission("read_event"):
@@ -41,7 +68,9 @@ class EventController:
         support_id = user_data.get("id")
         if support_id is None:
             return None
-        return self.repository.get_my_events(support_id)
+        if stream:
+            return self.repository.stream_my_events(support_id, rows=True)
+        return self.repository.get_my_events(support_id, rows=True)
 
     @require_auth
     def create_event(self, user_data: dict, event_data: dict, contract):
@@ -62,7 +91,7 @@ class EventController:
             return None
 
         new_event = Event(**event_data)
-        created_event = self.repository.add(new_event)
+        created_event = self.repository.add(new_event, refresh=False)
 
         if created_event:
             print(f"Event '{created_event.name}' created successfully.")
@@ -89,7 +118,55 @@ class EventController:
             print("Access denied: You are not the assigned support contact.")
             return None
 
-        updated_event = self.repository.update(event_id, updates)
+        updated_event = self.repository.update(
+            event_id, updates, refresh=False
+        )
         if updated_event:
             print(f"Event '{updated_event.name}' updated.")
-        return updated_event
\ No newline at end of file
+        return updated_event
+
+    @staticmethod
+    def _ownership_criteria(user_data: dict) -> tuple:
+        """
+        Restrict bulk writes like update_event: Management can update
+        all events, other users only the ones they support.
+        """
+        if user_data["department"] == "MANAGEMENT":
+            return ()
+        return (Event.support_contact_id == user_data["id"],)
+
+    @require_auth
+    def bulk_update_events(self, user_data: dict, event_ids: list, updates: dict):
+        """
+        Apply the same updates to many events in one UPDATE
+        (e.g. reassigning a support contact). Events the user may not
+        update are skipped. Returns the number of updated events.
+        """
+        self.auth_controller.current_user_data = user_data
+        if not self.auth_controller.check_user_permission("update_event"):
+            print("Access denied: No update permission for events.")
+            return None
+
+        count = self.repository.bulk_update(
+            event_ids, updates, self._ownership_criteria(user_data)
+        )
+        print(f"{count} event(s) updated.")
+        return count
+
+    @require_auth
+    def bulk_update_event_mappings(self, user_data: dict, rows: list):
+        """
+        Apply per-event updates given as dicts with an "id" key.
+        Events the user may not update are skipped.
+        Returns the number of updated events.
+        """
+        self.auth_controller.current_user_data = user_data
+        if not self.auth_controller.check_user_permission("update_event"):
+            print("Access denied: No update permission for events.")
+            return None
+
+        count = self.repository.bulk_update_mappings(
+            rows, self._ownership_criteria(user_data)
+        )
+        print(f"{count} event(s) updated.")
+        return count
@@ -0,0 +1,311 @@
+# app/controllers/import_controller.py
+"""
+Controller handling bulk imports of clients, contracts and events.
+Records are validated with the same rules as the interactive
+controllers, then inserted in chunks with one executemany per chunk.
+Invalid rows are reported individually without aborting the load.
+"""
+
+from datetime import datetime
+from typing import Callable, Iterable, List, Optional, Tuple
+
+from sqlalchemy.exc import SQLAlchemyError
+
+from app.repositories.client_repository import ClientRepository
+from app.repositories.contract_repository import ContractRepository
+from app.repositories.event_repository import EventRepository
+from app.utils.decorators import require_auth
+from app.utils.validators import (
+    CLIENT_CONTACT_FORMATS,
+    EVENT_DATE_FORMATS,
+    is_valid_email,
+    parse_amount,
+    parse_datetime,
+    parse_yes_no,
+)
+
+# Default number of rows validated and inserted per round-trip
+DEFAULT_IMPORT_CHUNK = 1000
+
+CLIENT_FIELDS = ("full_name", "email", "phone", "company_name")
+EVENT_FIELDS = ("name", "location")
+
+
+class ImportReport:
+    """Outcome of a bulk import: counters and per-row errors."""
+
+    def __init__(self, entity: str):
+        self.entity = entity
+        self.processed = 0
+        self.inserted = 0
+        self.errors: List[Tuple[int, str]] = []
+
+    def add_error(self, line: int, message: str) -> None:
+        """Record a rejected row."""
+        self.errors.append((line, message))
+
+    @property
+    def failed(self) -> int:
+        return len(self.errors)
+
+
+class ImportController:
+    """Manages bulk import operations."""
+
+    def __init__(
+        self,
+        client_repository: ClientRepository,
+        contract_repository: ContractRepository,
+        event_repository: EventRepository,
+        auth_controller,
+    ):
+        self.client_repository = client_repository
+        self.contract_repository = contract_repository
+        self.event_repository = event_repository
+        self.auth_controller = auth_controller
+
+    @require_auth
+    def import_clients(
+        self,
+        user_data: dict,
+        records: Iterable,
+        chunk_size: int = DEFAULT_IMPORT_CHUNK,
+    ) -> Optional[ImportReport]:
+        """
+        Import clients assigned to the current sales person.
+        """
+        self.auth_controller.current_user_data = user_data
+        if not self.auth_controller.check_user_permission("create_client"):
+            print("Access denied: You do not have permission to create a client.")
+            return None
+        return self._run(
+            ImportReport("client"),
+            records,
+            chunk_size,
+            lambda chunk, report: self._validate_clients(chunk, report, user_data),
+            self.client_repository,
+        )
+
+    @require_auth
+    def import_contracts(
+        self,
+        user_data: dict,
+        records: Iterable,
+        chunk_size: int = DEFAULT_IMPORT_CHUNK,
+    ) -> Optional[ImportReport]:
+        """
+        Import contracts for existing clients.
+        """
+        self.auth_controller.current_user_data = user_data
+        if not self.auth_controller.check_user_permission("create_contract"):
+            print("Access denied: You do not have permission to create a contract.")
+            return None
+        return self._run(
+            ImportReport("contract"),
+            records,
+            chunk_size,
+            self._validate_contracts,
+            self.contract_repository,
+        )
+
+    @require_auth
+    def import_events(
+        self,
+        user_data: dict,
+        records: Iterable,
+        chunk_size: int = DEFAULT_IMPORT_CHUNK,
+    ) -> Optional[ImportReport]:
+        """
+        Import events for signed contracts owned by the current user.
+        """
+        self.auth_controller.current_user_data = user_data
+        if not self.auth_controller.check_user_permission("create_event"):
+            print("Access denied: No permission to create events.")
+            return None
+        return self._run(
+            ImportReport("event"),
+            records,
+            chunk_size,
+            lambda chunk, report: self._validate_events(chunk, report, user_data),
+            self.event_repository,
+        )
+
+    def _run(
+        self,
+        report: ImportReport,
+        records: Iterable,
+        chunk_size: int,
+        validate: Callable,
+        repository,
+    ) -> ImportReport:
+        """Stream records through validation and chunked inserts."""
+        chunk = []
+        for line, record in records:
+            report.processed += 1
+            if isinstance(record, Exception):
+                report.add_error(line, str(record))
+                continue
+            chunk.append((line, record))
+            if len(chunk) >= chunk_size:
+                self._flush(report, chunk, validate, repository)
+                chunk = []
+        if chunk:
+            self._flush(report, chunk, validate, repository)
+        # Batched lookups report errors out of file order
+        report.errors.sort(key=lambda error: error[0])
+        return report
+
+    def _flush(self, report, chunk, validate, repository) -> None:
+        """Validate one chunk and insert its valid rows."""
+        valid = validate(chunk, report)
+        if not valid:
+            return
+        try:
+            report.inserted += repository.bulk_insert([row for _, row in valid])
+        except SQLAlchemyError:
+            # Isolate the offending rows instead of losing the chunk:
+            # one savepoint per row, a single commit for the survivors
+            inserted = 0
+            with repository.unit_of_work() as uow:
+                for line, row in valid:
+                    try:
+                        with uow.savepoint():
+                            inserted += repository.bulk_insert([row])
+                    except SQLAlchemyError as e:
+                        report.add_error(line, f"Database error: {e.orig or e}")
+            report.inserted += inserted
+
+    def _validate_clients(self, chunk, report, user_data) -> list:
+        """Apply create_client rules to a chunk of records."""
+        candidates = []
+        emails = set()
+        for line, record in chunk:
+            values = {f: str(record.get(f) or "").strip() for f in CLIENT_FIELDS}
+            missing = [f for f, v in values.items() if not v]
+            if missing:
+                report.add_error(line, f"Missing field(s): {', '.join(missing)}")
+                continue
+            if not is_valid_email(values["email"]):
+                report.add_error(line, "Invalid email format.")
+                continue
+            if values["email"] in emails:
+                report.add_error(line, "Duplicate email in import file.")
+                continue
+
+            raw_contact = record.get("last_contact")
+            last_contact = parse_datetime(raw_contact, CLIENT_CONTACT_FORMATS)
+            if raw_contact and last_contact is None:
+                report.add_error(
+                    line, "Invalid last_contact (use YYYY-MM-DD HH:MM:SS)."
+                )
+                continue
+
+            emails.add(values["email"])
+            values["last_contact"] = last_contact or datetime.now()
+            values["sales_contact_id"] = user_data["id"]
+            candidates.append((line, values))
+
+        existing = self.client_repository.get_existing_emails(emails)
+        valid = []
+        for line, values in candidates:
+            if values["email"] in existing:
+                report.add_error(line, "A client with this email already exists.")
+                continue
+            valid.append((line, values))
+        return valid
+
+    def _validate_contracts(self, chunk, report) -> list:
+        """Apply create_contract rules to a chunk of records."""
+        candidates = []
+        for line, record in chunk:
+            client_id = str(record.get("client_id") or "").strip()
+            if not client_id.isdigit():
+                report.add_error(line, "Client ID is required to create a contract.")
+                continue
+            try:
+                total_amount = parse_amount(record.get("total_amount"))
+                remaining_amount = parse_amount(record.get("remaining_amount"))
+            except ValueError as e:
+                report.add_error(line, str(e))
+                continue
+            candidates.append((line, {
+                "client_id": int(client_id),
+                "total_amount": total_amount,
+                "remaining_amount": remaining_amount,
+                "is_signed": bool(parse_yes_no(record.get("is_signed"))),
+            }))
+
+        owners = self.client_repository.get_sales_contacts(
+            {values["client_id"] for _, values in candidates}
+        )
+        valid = []
+        for line, values in candidates:
+            if values["client_id"] not in owners:
+                report.add_error(line, "Client not found.")
+                continue
+            values["sales_contact_id"] = owners[values["client_id"]]
+            valid.append((line, values))
+        return valid
+
+    def _validate_events(self, chunk, report, user_data) -> list:
+        """Apply create_event rules to a chunk of records."""
+        candidates = []
+        for line, record in chunk:
+            contract_id = str(record.get("contract_id") or "").strip()
+            if not contract_id.isdigit():
+                report.add_error(line, "Invalid Contract ID. Please enter a numeric ID.")
+                continue
+
+            start_dt = parse_datetime(record.get("event_date_start"), EVENT_DATE_FORMATS)
+            end_dt = parse_datetime(record.get("event_date_end"), EVENT_DATE_FORMATS)
+            if not start_dt or not end_dt:
+                report.add_error(
+                    line,
+                    "Invalid date format. Use 'YYYY-MM-DD HH' "
+                    "or 'YYYY-MM-DD HH:MM:SS'.",
+                )
+                continue
+            if end_dt <= start_dt:
+                report.add_error(line, "Invalid dates: event end must be after event start.")
+                continue
+
+            try:
+                attendees = int(str(record.get("attendees", "")).strip())
+            except ValueError:
+                report.add_error(line, "Invalid attendees value. Please enter a number.")
+                continue
+
+            values = {f: str(record.get(f) or "").strip() for f in EVENT_FIELDS}
+            candidates.append((line, {
+                **values,
+                "notes": str(record.get("notes") or "").strip(),
+                "event_date_start": start_dt,
+                "event_date_end": end_dt,
+                "attendees": attendees,
+                "contract_id": int(contract_id),
+                "support_contact_id": None,
+            }))
+
+        contexts = self.contract_repository.get_event_contexts(
+            {values["contract_id"] for _, values in candidates}
+        )
+        valid = []
+        for line, values in candidates:
+            context = contexts.get(values["contract_id"])
+            if context is None:
+                report.add_error(line, "Contract not found.")
+                continue
+            client_id, sales_contact_id, is_signed = context
+            if sales_contact_id != user_data["id"]:
+                report.add_error(
+                    line, "Access denied: You are not the sales contact for this client."
+                )
+                continue
+            if not is_signed:
+                report.add_error(
+                    line, "Access denied: Cannot create an event for an unsigned contract."
+                )
+                continue
+            values["client_id"] = client_id
+            valid.append((line, values))
+        return valid
@@ -40,5 +40,10 @@ class Base(DeclarativeBase):
     """
     Base class for declarative models.
     Maintains a registry of all mapped classes.
+
+    Mappers keep the default eager_defaults="auto": server-generated
+    columns come back with the INSERT where the backend supports
+    RETURNING (SQLite, MariaDB, PostgreSQL); on MySQL they are left
+    expired and only loaded if read, so no write pays an extra SELECT.
     """
     pass
\ No newline at end of file
@@ -49,6 +49,7 @@ class Client(Base):
     sales_contact_id: Mapped[int | None] = mapped_column(
         ForeignKey("employee.id"),
         nullable=True,
+        index=True,
     )
 
     # Relationships
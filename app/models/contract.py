@@ -5,7 +5,7 @@ with clients, including amounts, payment status, and audit timestamps.
 """
 
 from typing import TYPE_CHECKING
-from sqlalchemy import ForeignKey, Boolean, Numeric
+from sqlalchemy import ForeignKey, Boolean, Index, Numeric
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.models.base import (
@@ -27,6 +27,18 @@ class Contract(Base):
     """
 
     __tablename__ = "contract"
+    __table_args__ = (
+        # Sales ownership listings (unsigned / unpaid per salesperson)
+        Index("ix_contract_sales_signed", "sales_contact_id", "is_signed"),
+        Index(
+            "ix_contract_sales_remaining",
+            "sales_contact_id",
+            "remaining_amount",
+        ),
+        # Company-wide unsigned / unpaid listings
+        Index("ix_contract_is_signed", "is_signed"),
+        Index("ix_contract_remaining_amount", "remaining_amount"),
+    )
 
     id: Mapped[pk_id]
     total_amount: Mapped[float] = mapped_column(Numeric(10, 2))
@@ -38,7 +50,9 @@ class Contract(Base):
     last_update: Mapped[timestamp_update]
 
     # Foreign Keys
-    client_id: Mapped[int] = mapped_column(ForeignKey("client.id"))
+    client_id: Mapped[int] = mapped_column(
+        ForeignKey("client.id"), index=True
+    )
     sales_contact_id: Mapped[int] = mapped_column(ForeignKey("employee.id"))
 
     # Relationships
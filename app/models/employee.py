@@ -32,7 +32,9 @@ class Employee(Base):
     employee_number: Mapped[str_20] = mapped_column(unique=True)
 
     # Foreign Key to Department
-    department_id: Mapped[int] = mapped_column(ForeignKey("department.id"))
+    department_id: Mapped[int] = mapped_column(
+        ForeignKey("department.id"), index=True
+    )
 
     # Relationships
     department: Mapped["Department"] = relationship(back_populates="employees")
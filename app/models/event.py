@@ -5,7 +5,7 @@ linked to a client, a contract, and potentially a support employee.
 """
 
 from typing import TYPE_CHECKING, Optional
-from sqlalchemy import ForeignKey
+from sqlalchemy import ForeignKey, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.models.base import (
@@ -29,6 +29,14 @@ class Event(Base):
     """
 
     __tablename__ = "event"
+    __table_args__ = (
+        # "My events" and "without support" listings, ordered by date
+        Index(
+            "ix_event_support_start",
+            "support_contact_id",
+            "event_date_start",
+        ),
+    )
 
     id: Mapped[pk_id]
     name: Mapped[str_50]
@@ -43,8 +51,12 @@ class Event(Base):
     last_update: Mapped[timestamp_update]
 
     # Foreign Keys
-    client_id: Mapped[int] = mapped_column(ForeignKey("client.id"))
-    contract_id: Mapped[int] = mapped_column(ForeignKey("contract.id"))
+    client_id: Mapped[int] = mapped_column(
+        ForeignKey("client.id"), index=True
+    )
+    contract_id: Mapped[int] = mapped_column(
+        ForeignKey("contract.id"), index=True
+    )
     support_contact_id: Mapped[Optional[int]] = mapped_column(
         ForeignKey("employee.id"), nullable=True
     )
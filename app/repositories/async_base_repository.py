@@ -0,0 +1,297 @@
+# app/repositories/async_base_repository.py
+"""
+This module defines the AsyncBaseRepository class, the asyncio
+counterpart of BaseRepository built on AsyncSession.
+It exposes the same read/write API as coroutines (and async generators
+for streaming), so one process can serve many concurrent callers.
+"""
+
+from typing import (
+    AsyncIterator, Dict, Generic, List, Optional, Sequence, Type, TypeVar
+)
+from sqlalchemy import Select, bindparam, func, insert, select, update
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+import sentry_sdk
+from app.models.base import Base
+from app.repositories.base_repository import (
+    DEFAULT_PAGE_SIZE,
+    DEFAULT_STREAM_BATCH,
+    BaseRepository,
+)
+from app.repositories.rows import Row
+
+T = TypeVar("T", bound=Base)
+
+
+class AsyncBaseRepository(Generic[T]):
+    """
+    Base class for asynchronous data access logic.
+
+    Statement building (load profiles, row statements, ordering) is
+    shared with BaseRepository; only execution differs. AsyncSession
+    cannot lazy-load, so list views must use a load profile or rows=True.
+    """
+
+    load_profiles: Dict[str, tuple] = {}
+    row_type: Optional[Type[Row]] = None
+
+    # Session-independent helpers shared with the synchronous layer
+    row_statement = BaseRepository.row_statement
+    _ordering = BaseRepository._ordering
+    _row_query = BaseRepository._row_query
+    _to_rows = BaseRepository._to_rows
+    _updatable = BaseRepository._updatable
+
+    def __init__(self, session: AsyncSession, model: Type[T]):
+        self.session = session
+        self.model = model
+
+    def _select(self, profile: Optional[str] = None) -> Select:
+        """Build a select() on the model with the requested load profile."""
+        statement = select(self.model)
+        if profile is None:
+            return statement
+        if profile not in self.load_profiles:
+            raise ValueError(
+                f"Unknown load profile '{profile}' "
+                f"for {self.model.__name__}"
+            )
+        return statement.options(*self.load_profiles[profile])
+
+    async def _scalars(self, statement: Select) -> List[T]:
+        """Execute an ORM statement and return the entities."""
+        result = await self.session.execute(statement)
+        return list(result.scalars().unique())
+
+    async def get_rows(
+        self, criteria: Sequence = (), order_by: Optional[Sequence] = None
+    ) -> List[Row]:
+        """Fetch matching records as lightweight read-only rows."""
+        result = await self.session.execute(self._row_query(criteria, order_by))
+        return self._to_rows(result)
+
+    async def get_by_id(self, obj_id: int) -> Optional[T]:
+        """Fetch a single record by its primary key."""
+        result = await self.session.execute(
+            select(self.model).where(self.model.id == obj_id)
+        )
+        return result.scalars().first()
+
+    async def get_all(
+        self, profile: Optional[str] = None, rows: bool = False
+    ) -> List[T]:
+        """
+        Fetch all records for this model.
+        With rows=True, return read-only rows instead of ORM instances.
+        """
+        if rows:
+            return await self.get_rows()
+        return await self._scalars(
+            self._select(profile).order_by(self.model.id)
+        )
+
+    async def stream(
+        self,
+        criteria: Sequence = (),
+        profile: Optional[str] = None,
+        batch_size: int = DEFAULT_STREAM_BATCH,
+        rows: bool = False,
+        order_by: Optional[Sequence] = None,
+    ) -> AsyncIterator[T]:
+        """
+        Asynchronously yield matching records one by one, fetched in
+        batches of `batch_size` from a server-side cursor.
+        """
+        if rows:
+            statement = self._row_query(criteria, order_by).execution_options(
+                yield_per=batch_size
+            )
+            row_type = self.row_type
+            result = await self.session.stream(statement)
+            async for values in result:
+                yield row_type(*values)
+            return
+
+        statement = self._select(profile).where(*criteria).order_by(
+            *self._ordering(order_by)
+        ).execution_options(yield_per=batch_size)
+        result = await self.session.stream_scalars(statement)
+        async for obj in result:
+            yield obj
+
+    async def count(self, criteria: Sequence = ()) -> int:
+        """Return the number of records matching the optional criteria."""
+        result = await self.session.execute(
+            select(func.count(self.model.id)).where(*criteria)
+        )
+        return result.scalar() or 0
+
+    async def get_page(
+        self,
+        after_id: int = 0,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        criteria: Sequence = (),
+        profile: Optional[str] = None,
+        rows: bool = False,
+    ) -> List[T]:
+        """Fetch one keyset page of records with id greater than after_id."""
+        if rows:
+            statement = self._row_query(
+                (self.model.id > after_id, *criteria)
+            ).limit(page_size)
+            return self._to_rows(await self.session.execute(statement))
+
+        return await self._scalars(
+            self._select(profile)
+            .where(self.model.id > after_id, *criteria)
+            .order_by(self.model.id)
+            .limit(page_size)
+        )
+
+    async def iter_pages(
+        self,
+        after_id: int = 0,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        criteria: Sequence = (),
+        profile: Optional[str] = None,
+        rows: bool = False,
+    ) -> AsyncIterator[List[T]]:
+        """Lazily yield successive keyset pages starting after after_id."""
+        while True:
+            page = await self.get_page(
+                after_id, page_size, criteria, profile, rows
+            )
+            if not page:
+                return
+            yield page
+            if len(page) < page_size:
+                return
+            after_id = page[-1].id
+
+    async def add(self, obj: T, refresh: bool = False) -> T:
+        """
+        Add a new object and commit the transaction.
+        Server-generated columns come back with the INSERT where the
+        backend supports RETURNING; refresh=True re-reads the whole row.
+        """
+        try:
+            self.session.add(obj)
+            await self.session.commit()
+            if refresh:
+                await self.session.refresh(obj)
+            return obj
+        except SQLAlchemyError as e:
+            await self.session.rollback()
+            sentry_sdk.capture_exception(e)
+            raise e
+
+    async def bulk_insert(self, rows: List[dict]) -> int:
+        """Insert many records with a single executemany INSERT and commit."""
+        if not rows:
+            return 0
+        try:
+            await self.session.execute(insert(self.model), rows)
+            await self.session.commit()
+            return len(rows)
+        except SQLAlchemyError as e:
+            await self.session.rollback()
+            sentry_sdk.capture_exception(e)
+            raise e
+
+    async def update(
+        self, obj_id: int, update_data: dict, refresh: bool = False
+    ) -> Optional[T]:
+        """Update a record and commit the transaction."""
+        obj = await self.get_by_id(obj_id)
+        if obj:
+            try:
+                for key, value in update_data.items():
+                    if hasattr(obj, key):
+                        setattr(obj, key, value)
+                await self.session.commit()
+                if refresh:
+                    await self.session.refresh(obj)
+                return obj
+            except SQLAlchemyError as e:
+                await self.session.rollback()
+                sentry_sdk.capture_exception(e)
+                raise e
+        return None
+
+    async def bulk_update(
+        self,
+        ids: Sequence[int],
+        values: dict,
+        criteria: Sequence = (),
+    ) -> int:
+        """
+        Apply the same values to many records with one UPDATE and commit.
+        Returns the number of affected rows.
+        """
+        values = self._updatable(values)
+        if not ids or not values:
+            return 0
+        stmt = (
+            update(self.model)
+            .where(self.model.id.in_(ids), *criteria)
+            .values(**values)
+            .execution_options(synchronize_session=False)
+        )
+        try:
+            result = await self.session.execute(stmt)
+            await self.session.commit()
+            self.session.expire_all()
+            return result.rowcount
+        except SQLAlchemyError as e:
+            await self.session.rollback()
+            sentry_sdk.capture_exception(e)
+            raise e
+
+    async def bulk_update_mappings(
+        self,
+        rows: List[dict],
+        criteria: Sequence = (),
+    ) -> int:
+        """
+        Apply per-record values given as dicts holding an "id" key,
+        one executemany UPDATE per set of columns, one commit.
+        """
+        groups: Dict[tuple, List[dict]] = {}
+        for row in rows:
+            values = self._updatable(row)
+            if row.get("id") is None or not values:
+                continue
+            params = {"_pk": row["id"], **values}
+            groups.setdefault(tuple(sorted(values)), []).append(params)
+        if not groups:
+            return 0
+
+        table = self.model.__table__
+        affected = 0
+        try:
+            for keys, params in groups.items():
+                stmt = (
+                    update(table)
+                    .where(table.c.id == bindparam("_pk"), *criteria)
+                    .values({key: bindparam(key) for key in keys})
+                )
+                result = await self.session.execute(stmt, params)
+                affected += result.rowcount
+            await self.session.commit()
+            self.session.expire_all()
+            return affected
+        except SQLAlchemyError as e:
+            await self.session.rollback()
+            sentry_sdk.capture_exception(e)
+            raise e
+
+    async def delete(self, obj: T) -> None:
+        """Remove an object and commit the transaction."""
+        try:
+            await self.session.delete(obj)
+            await self.session.commit()
+        except SQLAlchemyError as e:
+            await self.session.rollback()
+            sentry_sdk.capture_exception(e)
+            raise e
@@ -0,0 +1,333 @@
+# app/repositories/async_repositories.py
+"""
+Asynchronous counterparts of the model repositories, built on
+AsyncBaseRepository. Load profiles, row statements, orderings and
+ownership criteria are taken from the synchronous repositories so both
+layers always issue the same SQL.
+"""
+
+from typing import AsyncIterator, Dict, Iterable, List, Optional, Set
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.models.client import Client
+from app.models.contract import Contract
+from app.models.department import Department
+from app.models.employee import Employee
+from app.models.event import Event
+from app.repositories.async_base_repository import AsyncBaseRepository
+from app.repositories.client_repository import ClientRepository
+from app.repositories.contract_repository import ContractRepository
+from app.repositories.employee_repository import EmployeeRepository
+from app.repositories.event_repository import EventRepository
+
+
+class AsyncClientRepository(AsyncBaseRepository[Client]):
+    """
+    Async repository handling Client database queries.
+    """
+
+    row_type = ClientRepository.row_type
+
+    def __init__(self, session: AsyncSession):
+        super().__init__(session, Client)
+
+    async def get_all_clients(self, rows: bool = False) -> List[Client]:
+        """Fetch all clients."""
+        return await self.get_all(rows=rows)
+
+    def stream_all_clients(self, rows: bool = False) -> AsyncIterator[Client]:
+        """Stream all clients."""
+        return self.stream(rows=rows)
+
+    async def get_by_email(self, email: str) -> Optional[Client]:
+        """Fetch a client by its unique email."""
+        result = await self.session.execute(
+            select(self.model).where(self.model.email == email)
+        )
+        return result.scalars().first()
+
+    async def get_existing_emails(self, emails: Iterable[str]) -> Set[str]:
+        """Return which of the given emails are already used by a client."""
+        emails = list(emails)
+        if not emails:
+            return set()
+        result = await self.session.scalars(
+            select(self.model.email).where(self.model.email.in_(emails))
+        )
+        return set(result)
+
+    async def get_sales_contacts(
+        self, client_ids: Iterable[int]
+    ) -> Dict[int, int]:
+        """Map existing client ids to their sales contact id."""
+        client_ids = list(client_ids)
+        if not client_ids:
+            return {}
+        result = await self.session.execute(
+            select(self.model.id, self.model.sales_contact_id).where(
+                self.model.id.in_(client_ids)
+            )
+        )
+        return dict(result.all())
+
+
+class AsyncContractRepository(AsyncBaseRepository[Contract]):
+    """
+    Async repository handling Contract database queries.
+    """
+
+    load_profiles = ContractRepository.load_profiles
+    row_type = ContractRepository.row_type
+    ORDERINGS = ContractRepository.ORDERINGS
+
+    row_statement = ContractRepository.row_statement
+    _scoped_criteria = ContractRepository._scoped_criteria
+    _order_clauses = ContractRepository._order_clauses
+
+    def __init__(self, session: AsyncSession):
+        super().__init__(session, Contract)
+
+    async def get_all_contracts(
+        self, profile: Optional[str] = None, rows: bool = False
+    ) -> List[Contract]:
+        """Fetch all contracts."""
+        return await self.get_all(profile, rows)
+
+    def stream_all_contracts(
+        self, profile: Optional[str] = None, rows: bool = False
+    ) -> AsyncIterator[Contract]:
+        """Stream all contracts."""
+        return self.stream(profile=profile, rows=rows)
+
+    async def _list_scoped(
+        self, condition, profile, rows, owner_id, department_id, order_by
+    ) -> List[Contract]:
+        """Run a scoped, ordered contract listing as a list."""
+        criteria = self._scoped_criteria(condition, owner_id, department_id)
+        clauses = self._order_clauses(order_by)
+        if rows:
+            return await self.get_rows(criteria, clauses)
+        return await self._scalars(
+            self._select(profile).where(*criteria).order_by(*clauses)
+        )
+
+    async def get_unsigned_contracts(
+        self,
+        profile: Optional[str] = None,
+        rows: bool = False,
+        owner_id: Optional[int] = None,
+        department_id: Optional[int] = None,
+        order_by: str = "id",
+    ) -> List[Contract]:
+        """Fetch contracts that are not yet signed."""
+        return await self._list_scoped(
+            self.model.is_signed == False,  # noqa: E712
+            profile, rows, owner_id, department_id, order_by,
+        )
+
+    async def get_unpaid_contracts(
+        self,
+        profile: Optional[str] = None,
+        rows: bool = False,
+        owner_id: Optional[int] = None,
+        department_id: Optional[int] = None,
+        order_by: str = "id",
+    ) -> List[Contract]:
+        """Fetch contracts where remaining amount is greater than zero."""
+        return await self._list_scoped(
+            self.model.remaining_amount > 0,
+            profile, rows, owner_id, department_id, order_by,
+        )
+
+    def stream_unsigned_contracts(
+        self,
+        profile: Optional[str] = None,
+        rows: bool = False,
+        owner_id: Optional[int] = None,
+        department_id: Optional[int] = None,
+        order_by: str = "id",
+    ) -> AsyncIterator[Contract]:
+        """Stream contracts that are not yet signed."""
+        return self.stream(
+            self._scoped_criteria(
+                self.model.is_signed == False,  # noqa: E712
+                owner_id,
+                department_id,
+            ),
+            profile=profile,
+            rows=rows,
+            order_by=self._order_clauses(order_by),
+        )
+
+    def stream_unpaid_contracts(
+        self,
+        profile: Optional[str] = None,
+        rows: bool = False,
+        owner_id: Optional[int] = None,
+        department_id: Optional[int] = None,
+        order_by: str = "id",
+    ) -> AsyncIterator[Contract]:
+        """Stream contracts where remaining amount is greater than zero."""
+        return self.stream(
+            self._scoped_criteria(
+                self.model.remaining_amount > 0, owner_id, department_id
+            ),
+            profile=profile,
+            rows=rows,
+            order_by=self._order_clauses(order_by),
+        )
+
+    async def get_unsigned_clients(
+        self, contract_ids: Iterable[int], criteria: Iterable = ()
+    ) -> Dict[int, int]:
+        """Map the still unsigned contracts among contract_ids to client_id."""
+        contract_ids = list(contract_ids)
+        if not contract_ids:
+            return {}
+        result = await self.session.execute(
+            select(self.model.id, self.model.client_id).where(
+                self.model.id.in_(contract_ids),
+                self.model.is_signed.is_(False),
+                *criteria,
+            )
+        )
+        return dict(result.all())
+
+
+class AsyncEventRepository(AsyncBaseRepository[Event]):
+    """
+    Async repository handling Event database queries.
+    """
+
+    load_profiles = EventRepository.load_profiles
+    row_type = EventRepository.row_type
+
+    row_statement = EventRepository.row_statement
+
+    def __init__(self, session: AsyncSession):
+        super().__init__(session, Event)
+
+    async def get_all_events(
+        self, profile: Optional[str] = None, rows: bool = False
+    ) -> List[Event]:
+        """Fetch all events."""
+        return await self.get_all(profile, rows)
+
+    def stream_all_events(
+        self, profile: Optional[str] = None, rows: bool = False
+    ) -> AsyncIterator[Event]:
+        """Stream all events."""
+        return self.stream(profile=profile, rows=rows)
+
+    async def _list(self, criteria, profile, rows) -> List[Event]:
+        """Run a filtered event listing as a list."""
+        if rows:
+            return await self.get_rows(criteria)
+        return await self._scalars(
+            self._select(profile).where(*criteria).order_by(self.model.id)
+        )
+
+    async def get_events_without_support(
+        self, profile: Optional[str] = None, rows: bool = False
+    ) -> List[Event]:
+        """Fetch all events that have no support contact assigned."""
+        return await self._list(
+            (self.model.support_contact_id == None,),  # noqa: E711
+            profile, rows,
+        )
+
+    async def get_my_events(
+        self,
+        support_id: int,
+        profile: Optional[str] = None,
+        rows: bool = False,
+    ) -> List[Event]:
+        """Fetch events assigned to a specific support employee."""
+        return await self._list(
+            (self.model.support_contact_id == support_id,), profile, rows
+        )
+
+    def stream_events_without_support(
+        self, profile: Optional[str] = None, rows: bool = False
+    ) -> AsyncIterator[Event]:
+        """Stream events that have no support contact assigned."""
+        return self.stream(
+            (self.model.support_contact_id == None,),  # noqa: E711
+            profile=profile,
+            rows=rows,
+        )
+
+    def stream_my_events(
+        self,
+        support_id: int,
+        profile: Optional[str] = None,
+        rows: bool = False,
+    ) -> AsyncIterator[Event]:
+        """Stream events assigned to a specific support employee."""
+        return self.stream(
+            (self.model.support_contact_id == support_id,),
+            profile=profile,
+            rows=rows,
+        )
+
+
+class AsyncEmployeeRepository(AsyncBaseRepository[Employee]):
+    """
+    Async data access layer for Employee-specific operations.
+    """
+
+    load_profiles = EmployeeRepository.load_profiles
+    row_type = EmployeeRepository.row_type
+
+    row_statement = EmployeeRepository.row_statement
+
+    def __init__(self, session: AsyncSession):
+        super().__init__(session, Employee)
+
+    async def get_all_employees(
+        self, profile: Optional[str] = None, rows: bool = False
+    ) -> List[Employee]:
+        """Fetch all employees."""
+        return await self.get_all(profile, rows)
+
+    def stream_all_employees(
+        self, profile: Optional[str] = None, rows: bool = False
+    ) -> AsyncIterator[Employee]:
+        """Stream all employees."""
+        return self.stream(profile=profile, rows=rows)
+
+    async def get_by_email(self, email: str) -> Optional[Employee]:
+        """Fetch an employee by email, with the department loaded."""
+        result = await self.session.execute(
+            self._select("employee_list").where(self.model.email == email)
+        )
+        return result.scalars().first()
+
+    async def get_by_employee_number(
+        self, emp_number: str
+    ) -> Optional[Employee]:
+        """Fetch an employee by their unique employee number."""
+        result = await self.session.execute(
+            select(self.model).where(self.model.employee_number == emp_number)
+        )
+        return result.scalars().first()
+
+
+class AsyncDepartmentRepository(AsyncBaseRepository[Department]):
+    """
+    Async data access layer for Department-specific operations.
+    """
+
+    def __init__(self, session: AsyncSession):
+        super().__init__(session, Department)
+
+    async def get_all_departments(self) -> List[Department]:
+        """Fetch all departments."""
+        return await self.get_all()
+
+    async def get_by_name(self, name: str) -> Optional[Department]:
+        """Fetch a department by its unique name."""
+        result = await self.session.execute(
+            select(self.model).where(self.model.name == name)
+        )
+        return result.scalars().first()
@@ -5,75 +5,386 @@ It provides a standardized interface for common database operations (CRUD)
 shared across all specific repositories.
 """
 
-from typing import Generic, TypeVar, Type, Optional, List
-from sqlalchemy.orm import Session
+from typing import (
+    Dict, Generic, TypeVar, Type, Optional, List, Iterator, Sequence
+)
+from sqlalchemy import (
+    Select, bindparam, func, insert, inspect, select, update
+)
+from sqlalchemy.orm import Query, Session
+from sqlalchemy.orm.attributes import set_committed_value
 from sqlalchemy.exc import SQLAlchemyError, IntegrityError
 import sentry_sdk
 from app.models.base import Base
+from app.repositories.rows import Row
+from app.repositories.unit_of_work import UnitOfWork, in_unit_of_work
 
 T = TypeVar("T", bound=Base)
 
+# Default number of rows fetched per keyset page
+DEFAULT_PAGE_SIZE = 50
+
+# Default number of rows buffered per fetch when streaming results
+DEFAULT_STREAM_BATCH = 500
+
 
 class BaseRepository(Generic[T]):
     """
     Base class for data access logic.
     """
 
+    # Named relationship-loading profiles (e.g. "contract_list").
+    # Each maps to a tuple of loader options applied per call, so that
+    # list views read related rows without one lazy SELECT per row.
+    load_profiles: Dict[str, tuple] = {}
+
+    # Slotted read-only row type returned when rows=True is requested.
+    # Listings use it to skip ORM hydration and identity-map tracking.
+    row_type: Optional[Type[Row]] = None
+
     def __init__(self, session: Session, model: Type[T]):
         self.session = session
         self.model = model
 
+    def unit_of_work(self) -> UnitOfWork:
+        """Open a unit of work grouping several writes in one commit."""
+        return UnitOfWork(self.session)
+
+    def _commit(self, keep: Optional[T] = None) -> None:
+        """
+        Commit, or only flush when a unit of work owns the transaction.
+        When `keep` is given, its column values (as written, plus the
+        server defaults returned by the flush) stay loaded after commit:
+        the session still expires every other object, but reading back
+        the object just written costs no SELECT.
+        """
+        if in_unit_of_work(self.session):
+            self.session.flush()
+            return
+        if keep is None:
+            self.session.commit()
+            return
+        self.session.flush()
+        loaded = inspect(keep).dict
+        values = {
+            key: loaded[key]
+            for key in self.model.__mapper__.column_attrs.keys()
+            if key in loaded
+        }
+        self.session.commit()
+        for key, value in values.items():
+            set_committed_value(keep, key, value)
+
+    def _rollback(self) -> None:
+        """Roll back unless a unit of work (or its savepoint) will."""
+        if not in_unit_of_work(self.session):
+            self.session.rollback()
+
+    def _query(self, profile: Optional[str] = None) -> Query:
+        """Build a query on the model with the requested load profile."""
+        query = self.session.query(self.model)
+        if profile is None:
+            return query
+        if profile not in self.load_profiles:
+            raise ValueError(
+                f"Unknown load profile '{profile}' "
+                f"for {self.model.__name__}"
+            )
+        return query.options(*self.load_profiles[profile])
+
+    def row_statement(self) -> Select:
+        """
+        Column-only select() producing values in row_type.__slots__ order.
+        Override to join related tables for flat name columns.
+        """
+        return select(
+            *(getattr(self.model, name) for name in self.row_type.__slots__)
+        )
+
+    def _ordering(self, order_by: Optional[Sequence] = None) -> tuple:
+        """Return the ORDER BY clauses, defaulting to the primary key."""
+        return tuple(order_by) if order_by else (self.model.id,)
+
+    def _row_query(
+        self, criteria: Sequence = (), order_by: Optional[Sequence] = None
+    ) -> Select:
+        """Apply criteria and ordering to the row statement."""
+        return self.row_statement().where(*criteria).order_by(
+            *self._ordering(order_by)
+        )
+
+    def _to_rows(self, result) -> List[Row]:
+        """Wrap raw result tuples into row_type instances."""
+        row_type = self.row_type
+        return [row_type(*values) for values in result]
+
+    def get_rows(
+        self, criteria: Sequence = (), order_by: Optional[Sequence] = None
+    ) -> List[Row]:
+        """Fetch matching records as lightweight read-only rows."""
+        return self._to_rows(
+            self.session.execute(self._row_query(criteria, order_by))
+        )
+
     def get_by_id(self, obj_id: int) -> Optional[T]:
         """Fetch a single record by its primary key."""
         return self.session.query(self.model).filter(
             self.model.id == obj_id
         ).first()
 
-    def get_all(self) -> List[T]:
-        """Fetch all records for this model."""
-        return self.session.query(self.model).all()
+    def get_all(
+        self, profile: Optional[str] = None, rows: bool = False
+    ) -> List[T]:
+        """
+        Fetch all records for this model.
+        With rows=True, return read-only rows instead of ORM instances.
+        """
+        if rows:
+            return self.get_rows()
+        return self._query(profile).all()
+
+    def stream(
+        self,
+        criteria: Sequence = (),
+        profile: Optional[str] = None,
+        batch_size: int = DEFAULT_STREAM_BATCH,
+        rows: bool = False,
+        order_by: Optional[Sequence] = None,
+    ) -> Iterator[T]:
+        """
+        Yield matching records one by one, ordered by primary key
+        unless explicit `order_by` clauses are given.
+        Rows are fetched in batches of `batch_size` (yield_per, which
+        enables server-side cursors where the driver supports them),
+        so memory stays flat and the first row is available immediately.
+        """
+        if rows:
+            statement = self._row_query(criteria, order_by).execution_options(
+                yield_per=batch_size
+            )
+            row_type = self.row_type
+            for values in self.session.execute(statement):
+                yield row_type(*values)
+            return
+
+        query = self._query(profile).filter(*criteria).order_by(
+            *self._ordering(order_by)
+        )
+        yield from query.yield_per(batch_size)
+
+    def count(self, criteria: Sequence = ()) -> int:
+        """
+        Return the number of records matching the optional criteria.
+        Used as a total-count hint by paginated listings.
+        """
+        return self.session.query(func.count(self.model.id)).filter(
+            *criteria
+        ).scalar() or 0
 
-    def add(self, obj: T) -> T:
-        """Add a new object and commit the transaction."""
+    def get_page(
+        self,
+        after_id: int = 0,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        criteria: Sequence = (),
+        profile: Optional[str] = None,
+        rows: bool = False,
+    ) -> List[T]:
+        """
+        Fetch one keyset page: the next `page_size` records whose primary
+        key is strictly greater than `after_id`, ordered by primary key.
+        Seeking on the indexed key (no OFFSET) keeps the cost of a page
+        constant however deep the listing goes.
+        """
+        if rows:
+            statement = self._row_query(
+                (self.model.id > after_id, *criteria)
+            ).limit(page_size)
+            return self._to_rows(self.session.execute(statement))
+
+        return self._query(profile).filter(
+            self.model.id > after_id, *criteria
+        ).order_by(self.model.id).limit(page_size).all()
+
+    def iter_pages(
+        self,
+        after_id: int = 0,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        criteria: Sequence = (),
+        profile: Optional[str] = None,
+        rows: bool = False,
+    ) -> Iterator[List[T]]:
+        """
+        Lazily yield successive keyset pages starting after `after_id`.
+        Each page is only queried when the consumer asks for it.
+        """
+        while True:
+            page = self.get_page(after_id, page_size, criteria, profile, rows)
+            if not page:
+                return
+            yield page
+            if len(page) < page_size:
+                return
+            after_id = page[-1].id
+
+    def add(self, obj: T, refresh: Optional[bool] = None) -> T:
+        """
+        Add a new object and commit the transaction.
+        - refresh=None: commit as the session is configured; an expired
+          object is read back on the next attribute access.
+        - refresh=True: re-read the whole row after commit.
+        - refresh=False: keep the written values (and the server defaults
+          returned by the INSERT) loaded, so reading the object back
+          costs no SELECT. Controllers write this way.
+        """
         try:
             self.session.add(obj)
-            self.session.commit()
-            self.session.refresh(obj)
+            self._commit(keep=obj if refresh is False else None)
+            if refresh:
+                self.session.refresh(obj)
             return obj
         except IntegrityError as e:
             # Capture database constraint violations (e.g., duplicate email)
-            self.session.rollback()
+            self._rollback()
             sentry_sdk.capture_exception(e)
             raise e
         except SQLAlchemyError as e:
             # Capture any other database-related errors
-            self.session.rollback()
+            self._rollback()
+            sentry_sdk.capture_exception(e)
+            raise e
+
+    def bulk_insert(self, rows: List[dict]) -> int:
+        """
+        Insert many records with a single executemany INSERT and commit.
+        Returns the number of inserted rows.
+        """
+        if not rows:
+            return 0
+        try:
+            self.session.execute(insert(self.model), rows)
+            self._commit()
+            return len(rows)
+        except SQLAlchemyError as e:
+            self._rollback()
             sentry_sdk.capture_exception(e)
             raise e
 
-    def update(self, obj_id: int, update_data: dict) -> Optional[T]:
-        """Update a record and commit the transaction."""
-        obj = self.get_by_id(obj_id)
+    def update(
+        self, obj_id: int, update_data: dict, refresh: Optional[bool] = None
+    ) -> Optional[T]:
+        """
+        Update a record and commit the transaction.
+        refresh works as in add(). Unless refreshed, relationships are
+        expired so that a moved foreign key is seen; server-side update
+        values (last_update) are only read if accessed.
+        """
+        # Identity map first: callers often loaded the record to check it
+        obj = self.session.get(self.model, obj_id)
         if obj:
             try:
                 for key, value in update_data.items():
                     if hasattr(obj, key):
                         setattr(obj, key, value)
-                self.session.commit()
-                self.session.refresh(obj)
+                self._commit(keep=obj if refresh is False else None)
+                if refresh:
+                    self.session.refresh(obj)
+                else:
+                    # Reload relationships lazily in case a foreign key moved
+                    self.session.expire(obj, self._relationship_keys())
                 return obj
             except SQLAlchemyError as e:
-                self.session.rollback()
+                self._rollback()
                 sentry_sdk.capture_exception(e)
                 raise e
         return None
 
+    def _relationship_keys(self) -> List[str]:
+        """Names of the model relationships."""
+        return self.model.__mapper__.relationships.keys()
+
+    def _updatable(self, values: dict) -> dict:
+        """Keep only mapped, non primary key columns (like update())."""
+        columns = self.model.__mapper__.column_attrs.keys()
+        return {
+            key: value for key, value in values.items()
+            if key in columns and key != "id"
+        }
+
+    def bulk_update(
+        self,
+        ids: Sequence[int],
+        values: dict,
+        criteria: Sequence = (),
+    ) -> int:
+        """
+        Apply the same values to many records with one UPDATE ... WHERE
+        id IN (...) and commit. Extra criteria restrict the rows further
+        (e.g. ownership). Returns the number of affected rows.
+        """
+        values = self._updatable(values)
+        if not ids or not values:
+            return 0
+        stmt = (
+            update(self.model)
+            .where(self.model.id.in_(ids), *criteria)
+            .values(**values)
+            .execution_options(synchronize_session=False)
+        )
+        try:
+            result = self.session.execute(stmt)
+            self._commit()
+            # Loaded instances may be stale when commit does not expire them
+            self.session.expire_all()
+            return result.rowcount
+        except SQLAlchemyError as e:
+            self._rollback()
+            sentry_sdk.capture_exception(e)
+            raise e
+
+    def bulk_update_mappings(
+        self,
+        rows: List[dict],
+        criteria: Sequence = (),
+    ) -> int:
+        """
+        Apply per-record values given as dicts holding an "id" key.
+        Rows updating the same set of columns share one executemany
+        UPDATE; everything commits once. Returns the affected row count.
+        """
+        groups: Dict[tuple, List[dict]] = {}
+        for row in rows:
+            values = self._updatable(row)
+            if row.get("id") is None or not values:
+                continue
+            params = {"_pk": row["id"], **values}
+            groups.setdefault(tuple(sorted(values)), []).append(params)
+        if not groups:
+            return 0
+
+        table = self.model.__table__
+        affected = 0
+        try:
+            for keys, params in groups.items():
+                stmt = (
+                    update(table)
+                    .where(table.c.id == bindparam("_pk"), *criteria)
+                    .values({key: bindparam(key) for key in keys})
+                )
+                affected += self.session.execute(stmt, params).rowcount
+            self._commit()
+            self.session.expire_all()
+            return affected
+        except SQLAlchemyError as e:
+            self._rollback()
+            sentry_sdk.capture_exception(e)
+            raise e
+
     def delete(self, obj: T) -> None:
         """Remove an object and commit the transaction."""
         try:
             self.session.delete(obj)
-            self.session.commit()
+            self._commit()
         except SQLAlchemyError as e:
-            self.session.rollback()
+            self._rollback()
             sentry_sdk.capture_exception(e)
             raise e
\ No newline at end of file
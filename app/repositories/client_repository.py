@@ -3,10 +3,12 @@
 Data access layer for Client-specific operations.
 """
 
-from typing import Optional, List
+from typing import Dict, Iterable, Iterator, Optional, List, Set
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 from app.models.client import Client
 from app.repositories.base_repository import BaseRepository
+from app.repositories.rows import ClientRow
 
 
 class ClientRepository(BaseRepository[Client]):
@@ -14,14 +16,22 @@ class ClientRepository(BaseRepository[Client]):
     Repository handling Client database queries.
     """
 
+    row_type = ClientRow
+
     def __init__(self, session: Session):
         super().__init__(session, Client)
 
-    def get_all_clients(self) -> List[Client]:
+    def get_all_clients(self, rows: bool = False) -> List[Client]:
         """
         Fetch all clients by calling the inherited get_all method.
         """
-        return self.get_all()
+        return self.get_all(rows=rows)
+
+    def stream_all_clients(self, rows: bool = False) -> Iterator[Client]:
+        """
+        Stream all clients by calling the inherited stream method.
+        """
+        return self.stream(rows=rows)
 
     def get_by_email(self, email: str) -> Optional[Client]:
         """
@@ -29,4 +39,28 @@ class ClientRepository(BaseRepository[Client]):
         """
         return self.session.query(self.model).filter(
             self.model.email == email
-        ).first()
\ No newline at end of file
+        ).first()
+
+    def get_existing_emails(self, emails: Iterable[str]) -> Set[str]:
+        """
+        Return which of the given emails are already used by a client.
+        """
+        emails = list(emails)
+        if not emails:
+            return set()
+        return set(self.session.scalars(
+            select(self.model.email).where(self.model.email.in_(emails))
+        ))
+
+    def get_sales_contacts(self, client_ids: Iterable[int]) -> Dict[int, int]:
+        """
+        Map existing client ids to their sales contact id.
+        """
+        client_ids = list(client_ids)
+        if not client_ids:
+            return {}
+        return dict(self.session.execute(
+            select(self.model.id, self.model.sales_contact_id).where(
+                self.model.id.in_(client_ids)
+            )
+        ).all())
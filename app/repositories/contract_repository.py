@@ -3,10 +3,14 @@
 Data access layer for Contract-specific operations.
 """
 
-from typing import List, Optional
-from sqlalchemy.orm import Session
+from typing import Dict, Iterable, Iterator, List, Optional
+from sqlalchemy import Select, select
+from sqlalchemy.orm import Session, aliased, joinedload
+from app.models.client import Client
 from app.models.contract import Contract
+from app.models.employee import Employee
 from app.repositories.base_repository import BaseRepository
+from app.repositories.rows import ContractRow
 
 
 class ContractRepository(BaseRepository[Contract]):
@@ -14,27 +18,220 @@ class ContractRepository(BaseRepository[Contract]):
     Repository handling Contract database queries.
     """
 
+    load_profiles = {
+        # Contract lists display the client and sales contact names
+        "contract_list": (
+            joinedload(Contract.client),
+            joinedload(Contract.sales_contact),
+        ),
+    }
+    row_type = ContractRow
+
+    # Named orderings: (column, descending) pairs, id last for stability
+    ORDERINGS = {
+        "id": (("id", False),),
+        "newest": (("creation_date", True), ("id", True)),
+        "remaining_desc": (("remaining_amount", True), ("id", False)),
+        "total_desc": (("total_amount", True), ("id", False)),
+    }
+
     def __init__(self, session: Session):
         super().__init__(session, Contract)
 
-    def get_all_contracts(self) -> List[Contract]:
+    def row_statement(self) -> Select:
+        """
+        Select contract columns plus client and sales contact names.
+        """
+        sales_contact = aliased(Employee)
+        return (
+            select(
+                Contract.id,
+                Contract.total_amount,
+                Contract.remaining_amount,
+                Contract.is_signed,
+                Contract.client_id,
+                Client.full_name,
+                Contract.sales_contact_id,
+                sales_contact.full_name,
+            )
+            .outerjoin(Client, Contract.client_id == Client.id)
+            .outerjoin(
+                sales_contact, Contract.sales_contact_id == sales_contact.id
+            )
+        )
+
+    def get_all_contracts(
+        self, profile: Optional[str] = None, rows: bool = False
+    ) -> List[Contract]:
         """
         Fetch all contracts by calling the inherited get_all method.
         """
-        return self.get_all()
+        return self.get_all(profile, rows)
 
-    def get_unsigned_contracts(self) -> List[Contract]:
+    def stream_all_contracts(
+        self, profile: Optional[str] = None, rows: bool = False
+    ) -> Iterator[Contract]:
+        """
+        Stream all contracts by calling the inherited stream method.
         """
-        Fetch all contracts that are not yet signed.
+        return self.stream(profile=profile, rows=rows)
+
+    def _scoped_criteria(
+        self,
+        condition,
+        owner_id: Optional[int] = None,
+        department_id: Optional[int] = None,
+    ) -> tuple:
         """
-        return self.session.query(self.model).filter(
-            self.model.is_signed == False  # noqa: E712
+        Combine a status condition with optional ownership filters.
+        owner_id restricts to one sales contact, department_id to the
+        sales contacts of one department; both run in SQL and use the
+        (sales_contact_id, ...) composite indexes.
+        """
+        criteria = [condition]
+        if owner_id is not None:
+            criteria.append(self.model.sales_contact_id == owner_id)
+        if department_id is not None:
+            criteria.append(
+                self.model.sales_contact_id.in_(
+                    select(Employee.id).where(
+                        Employee.department_id == department_id
+                    )
+                )
+            )
+        return tuple(criteria)
+
+    def _order_clauses(self, order_by: str) -> tuple:
+        """Resolve a named ordering into ORDER BY clauses."""
+        if order_by not in self.ORDERINGS:
+            raise ValueError(f"Unknown contract ordering '{order_by}'")
+        return tuple(
+            getattr(self.model, column).desc() if desc
+            else getattr(self.model, column)
+            for column, desc in self.ORDERINGS[order_by]
+        )
+
+    def _list_scoped(
+        self, condition, profile, rows, owner_id, department_id, order_by
+    ) -> List[Contract]:
+        """Run a scoped, ordered contract listing as a list."""
+        criteria = self._scoped_criteria(condition, owner_id, department_id)
+        clauses = self._order_clauses(order_by)
+        if rows:
+            return self.get_rows(criteria, clauses)
+        return self._query(profile).filter(*criteria).order_by(
+            *clauses
         ).all()
 
-    def get_unpaid_contracts(self) -> List[Contract]:
+    def get_unsigned_contracts(
+        self,
+        profile: Optional[str] = None,
+        rows: bool = False,
+        owner_id: Optional[int] = None,
+        department_id: Optional[int] = None,
+        order_by: str = "id",
+    ) -> List[Contract]:
+        """
+        Fetch contracts that are not yet signed, optionally scoped to an
+        owner or a department.
+        """
+        return self._list_scoped(
+            self.model.is_signed == False,  # noqa: E712
+            profile, rows, owner_id, department_id, order_by,
+        )
+
+    def get_unpaid_contracts(
+        self,
+        profile: Optional[str] = None,
+        rows: bool = False,
+        owner_id: Optional[int] = None,
+        department_id: Optional[int] = None,
+        order_by: str = "id",
+    ) -> List[Contract]:
+        """
+        Fetch contracts where remaining amount is greater than zero,
+        optionally scoped to an owner or a department.
+        """
+        return self._list_scoped(
+            self.model.remaining_amount > 0,
+            profile, rows, owner_id, department_id, order_by,
+        )
+
+    def stream_unsigned_contracts(
+        self,
+        profile: Optional[str] = None,
+        rows: bool = False,
+        owner_id: Optional[int] = None,
+        department_id: Optional[int] = None,
+        order_by: str = "id",
+    ) -> Iterator[Contract]:
+        """
+        Stream contracts that are not yet signed.
+        """
+        return self.stream(
+            self._scoped_criteria(
+                self.model.is_signed == False,  # noqa: E712
+                owner_id,
+                department_id,
+            ),
+            profile=profile,
+            rows=rows,
+            order_by=self._order_clauses(order_by),
+        )
+
+    def stream_unpaid_contracts(
+        self,
+        profile: Optional[str] = None,
+        rows: bool = False,
+        owner_id: Optional[int] = None,
+        department_id: Optional[int] = None,
+        order_by: str = "id",
+    ) -> Iterator[Contract]:
+        """
+        Stream contracts where remaining amount is greater than zero.
+        """
+        return self.stream(
+            self._scoped_criteria(
+                self.model.remaining_amount > 0, owner_id, department_id
+            ),
+            profile=profile,
+            rows=rows,
+            order_by=self._order_clauses(order_by),
+        )
+
+    def get_event_contexts(self, contract_ids: Iterable[int]) -> Dict[int, tuple]:
+        """
+        Map existing contract ids to (client_id, sales_contact_id,
+        is_signed), the fields needed to validate new events.
+        """
+        contract_ids = list(contract_ids)
+        if not contract_ids:
+            return {}
+        result = self.session.execute(
+            select(
+                self.model.id,
+                self.model.client_id,
+                self.model.sales_contact_id,
+                self.model.is_signed,
+            ).where(self.model.id.in_(contract_ids))
+        )
+        return {row[0]: tuple(row[1:]) for row in result}
+
+    def get_unsigned_clients(
+        self, contract_ids: Iterable[int], criteria: Iterable = ()
+    ) -> Dict[int, int]:
         """
-        Fetch contracts where remaining amount is greater than zero.
+        Map the still unsigned contracts among contract_ids to their
+        client_id, so bulk signatures can be audited per contract.
         """
-        return self.session.query(self.model).filter(
-            self.model.remaining_amount > 0
-        ).all()
\ No newline at end of file
+        contract_ids = list(contract_ids)
+        if not contract_ids:
+            return {}
+        result = self.session.execute(
+            select(self.model.id, self.model.client_id).where(
+                self.model.id.in_(contract_ids),
+                self.model.is_signed.is_(False),
+                *criteria,
+            )
+        )
+        return dict(result.all())
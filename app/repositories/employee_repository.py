@@ -5,10 +5,13 @@ It provides specific lookup methods necessary for authentication
 and staff management.
 """
 
-from typing import Optional
-from sqlalchemy.orm import Session
+from typing import Iterator, Optional, List
+from sqlalchemy import Select, select
+from sqlalchemy.orm import Session, joinedload
+from app.models.department import Department
 from app.models.employee import Employee
 from app.repositories.base_repository import BaseRepository
+from app.repositories.rows import EmployeeRow
 
 
 class EmployeeRepository(BaseRepository[Employee]):
@@ -16,21 +19,55 @@ class EmployeeRepository(BaseRepository[Employee]):
     Data access layer for Employee-specific operations.
     """
 
+    load_profiles = {
+        # Employee lists display the department name
+        "employee_list": (joinedload(Employee.department),),
+        # Login reads the department name for the token and session
+        "login": (joinedload(Employee.department),),
+    }
+    row_type = EmployeeRow
+
     def __init__(self, session: Session):
         super().__init__(session, Employee)
 
-    def get_all_employees(self):
+    def row_statement(self) -> Select:
+        """
+        Select employee columns plus the department name.
+        The password hash is never part of listing rows.
+        """
+        return select(
+            Employee.id,
+            Employee.employee_number,
+            Employee.full_name,
+            Employee.email,
+            Employee.department_id,
+            Department.name,
+        ).outerjoin(Department, Employee.department_id == Department.id)
+
+    def get_all_employees(
+        self, profile: Optional[str] = None, rows: bool = False
+    ) -> List[Employee]:
         """
         Fetch all employees using the base repository method.
         """
-        return self.get_all()
+        return self.get_all(profile, rows)
 
-    def get_by_email(self, email: str) -> Optional[Employee]:
+    def stream_all_employees(
+        self, profile: Optional[str] = None, rows: bool = False
+    ) -> Iterator[Employee]:
+        """
+        Stream all employees by calling the inherited stream method.
+        """
+        return self.stream(profile=profile, rows=rows)
+
+    def get_by_email(
+        self, email: str, profile: Optional[str] = None
+    ) -> Optional[Employee]:
         """
         Fetch an employee by their unique email address.
-        Used for authentication.
+        Used for authentication (with the "login" profile).
         """
-        return self.session.query(self.model).filter(
+        return self._query(profile).filter(
             self.model.email == email
         ).first()
 
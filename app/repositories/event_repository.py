@@ -3,10 +3,13 @@
 Data access layer for Event-specific operations.
 """
 
-from typing import List, Optional
-from sqlalchemy.orm import Session
+from typing import Iterator, List, Optional
+from sqlalchemy import Select, select
+from sqlalchemy.orm import Session, joinedload
+from app.models.employee import Employee
 from app.models.event import Event
 from app.repositories.base_repository import BaseRepository
+from app.repositories.rows import EventRow
 
 
 class EventRepository(BaseRepository[Event]):
@@ -14,27 +17,97 @@ class EventRepository(BaseRepository[Event]):
     Repository handling Event database queries.
     """
 
+    load_profiles = {
+        # Event lists display the support contact name
+        "event_list": (joinedload(Event.support_contact),),
+    }
+    row_type = EventRow
+
     def __init__(self, session: Session):
         super().__init__(session, Event)
 
-    def get_all_events(self) -> List[Event]:
+    def row_statement(self) -> Select:
+        """
+        Select event columns plus the support contact name.
+        """
+        return select(
+            Event.id,
+            Event.name,
+            Event.event_date_start,
+            Event.event_date_end,
+            Event.location,
+            Event.attendees,
+            Event.notes,
+            Event.client_id,
+            Event.contract_id,
+            Event.support_contact_id,
+            Employee.full_name,
+        ).outerjoin(Employee, Event.support_contact_id == Employee.id)
+
+    def get_all_events(
+        self, profile: Optional[str] = None, rows: bool = False
+    ) -> List[Event]:
         """
         Fetch all events by calling the inherited get_all method.
         """
-        return self.get_all()
+        return self.get_all(profile, rows)
+
+    def stream_all_events(
+        self, profile: Optional[str] = None, rows: bool = False
+    ) -> Iterator[Event]:
+        """
+        Stream all events by calling the inherited stream method.
+        """
+        return self.stream(profile=profile, rows=rows)
 
-    def get_events_without_support(self) -> List[Event]:
+    def get_events_without_support(
+        self, profile: Optional[str] = None, rows: bool = False
+    ) -> List[Event]:
         """
         Fetch all events that have no support contact assigned.
         """
-        return self.session.query(self.model).filter(
-            self.model.support_contact_id == None  # noqa: E711
-        ).all()
+        criteria = (self.model.support_contact_id == None,)  # noqa: E711
+        if rows:
+            return self.get_rows(criteria)
+        return self._query(profile).filter(*criteria).all()
 
-    def get_my_events(self, support_id: int) -> List[Event]:
+    def get_my_events(
+        self,
+        support_id: int,
+        profile: Optional[str] = None,
+        rows: bool = False,
+    ) -> List[Event]:
         """
         Fetch events assigned to a specific support employee.
         """
-        return self.session.query(self.model).filter(
-            self.model.support_contact_id == support_id
-        ).all()
\ No newline at end of file
+        criteria = (self.model.support_contact_id == support_id,)
+        if rows:
+            return self.get_rows(criteria)
+        return self._query(profile).filter(*criteria).all()
+
+    def stream_events_without_support(
+        self, profile: Optional[str] = None, rows: bool = False
+    ) -> Iterator[Event]:
+        """
+        Stream events that have no support contact assigned.
+        """
+        return self.stream(
+            (self.model.support_contact_id == None,),  # noqa: E711
+            profile=profile,
+            rows=rows,
+        )
+
+    def stream_my_events(
+        self,
+        support_id: int,
+        profile: Optional[str] = None,
+        rows: bool = False,
+    ) -> Iterator[Event]:
+        """
+        Stream events assigned to a specific support employee.
+        """
+        return self.stream(
+            (self.model.support_contact_id == support_id,),
+            profile=profile,
+            rows=rows,
+        )
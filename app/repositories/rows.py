@@ -0,0 +1,92 @@
+# app/repositories/rows.py
+"""
+This module defines lightweight read-only row types for listings.
+Rows are built from column-only select() queries: they use __slots__,
+carry no identity-map or relationship state, and expose flat fields
+(e.g. client_name) instead of lazy relationships.
+"""
+
+
+class Row:
+    """
+    Base class for slotted read-only rows.
+    Values are assigned positionally in __slots__ order.
+    """
+
+    __slots__ = ()
+
+    def __init__(self, *values):
+        for name, value in zip(self.__slots__, values):
+            setattr(self, name, value)
+
+    def as_dict(self) -> dict:
+        """Return the row as a plain dictionary."""
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __eq__(self, other) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return self.as_dict() == other.as_dict()
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__}(id={getattr(self, 'id', None)})>"
+
+
+class ClientRow(Row):
+    """Client listing row."""
+
+    __slots__ = (
+        "id",
+        "full_name",
+        "email",
+        "phone",
+        "company_name",
+        "last_contact",
+        "sales_contact_id",
+    )
+
+
+class ContractRow(Row):
+    """Contract listing row with client and sales contact names."""
+
+    __slots__ = (
+        "id",
+        "total_amount",
+        "remaining_amount",
+        "is_signed",
+        "client_id",
+        "client_name",
+        "sales_contact_id",
+        "sales_contact_name",
+    )
+
+
+class EventRow(Row):
+    """Event listing row with the support contact name."""
+
+    __slots__ = (
+        "id",
+        "name",
+        "event_date_start",
+        "event_date_end",
+        "location",
+        "attendees",
+        "notes",
+        "client_id",
+        "contract_id",
+        "support_contact_id",
+        "support_name",
+    )
+
+
+class EmployeeRow(Row):
+    """Employee listing row with the department name (no password)."""
+
+    __slots__ = (
+        "id",
+        "employee_number",
+        "full_name",
+        "email",
+        "department_id",
+        "department_name",
+    )
@@ -0,0 +1,114 @@
+# app/repositories/unit_of_work.py
+"""
+This module defines the UnitOfWork transaction context.
+While a unit of work is open on a session, repository writes only flush:
+the whole block commits once on exit, or rolls back on error (or when
+cancelled). Savepoints let a block recover from a failed step without
+losing earlier steps. Side effects of a step (audit records) can wait for
+the commit with after_commit(), so a rolled back step leaves no trace.
+"""
+
+from contextlib import contextmanager
+from typing import Callable, Iterator
+
+import sentry_sdk
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+# Session.info key holding the number of open (nested) units of work
+UOW_DEPTH_KEY = "unit_of_work_depth"
+
+# Session.info key holding the callbacks waiting for the outermost commit
+UOW_CALLBACKS_KEY = "unit_of_work_after_commit"
+
+# Session.info key set when a unit of work was cancelled
+UOW_CANCELLED_KEY = "unit_of_work_cancelled"
+
+
+def in_unit_of_work(session: Session) -> bool:
+    """Return True when a unit of work owns the session's transaction."""
+    return session.info.get(UOW_DEPTH_KEY, 0) > 0
+
+
+def after_commit(session: Session, callback: Callable[[], None]) -> None:
+    """
+    Run callback once the unit of work open on the session commits, and
+    never if it rolls back. Outside a unit of work the caller's write is
+    already committed, so the callback runs right away.
+    """
+    if in_unit_of_work(session):
+        session.info.setdefault(UOW_CALLBACKS_KEY, []).append(callback)
+    else:
+        callback()
+
+
+class UnitOfWork:
+    """
+    Group several repository calls into a single transaction.
+
+    with UnitOfWork(session) as uow:
+        contract = contract_ctrl.create_contract(...)
+        with uow.savepoint():
+            event_ctrl.create_event(...)
+
+    Nested units of work join the outermost one, which alone commits.
+    """
+
+    def __init__(self, session: Session):
+        self.session = session
+
+    def cancel(self) -> None:
+        """
+        Roll the whole unit of work back on exit instead of committing.
+        Cancelling a nested unit cancels the outermost one.
+        """
+        self.session.info[UOW_CANCELLED_KEY] = True
+
+    def __enter__(self) -> "UnitOfWork":
+        self.session.info[UOW_DEPTH_KEY] = (
+            self.session.info.get(UOW_DEPTH_KEY, 0) + 1
+        )
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        depth = self.session.info[UOW_DEPTH_KEY] - 1
+        self.session.info[UOW_DEPTH_KEY] = depth
+        if depth:
+            # Joined an outer unit of work: it decides the outcome
+            return False
+
+        callbacks = self.session.info.pop(UOW_CALLBACKS_KEY, [])
+        cancelled = self.session.info.pop(UOW_CANCELLED_KEY, False)
+        if exc_type is not None or cancelled:
+            self.session.rollback()
+            return False
+        try:
+            self.session.commit()
+        except SQLAlchemyError as e:
+            self.session.rollback()
+            sentry_sdk.capture_exception(e)
+            raise e
+        for callback in callbacks:
+            callback()
+        return False
+
+    @contextmanager
+    def savepoint(self) -> Iterator[None]:
+        """
+        Run a block inside a SAVEPOINT. On error only the block is
+        rolled back, and the exception propagates to the caller, who can
+        handle it and carry on with the rest of the unit of work.
+        """
+        nested = self.session.begin_nested()
+        pending = len(self.session.info.get(UOW_CALLBACKS_KEY, []))
+        try:
+            yield
+        except Exception:
+            # Also needed after a failed flush deactivated the savepoint
+            nested.rollback()
+            # Forget the side effects of the rolled back block
+            del self.session.info.get(UOW_CALLBACKS_KEY, [])[pending:]
+            raise
+        else:
+            if nested.is_active:
+                nested.commit()
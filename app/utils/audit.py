@@ -0,0 +1,254 @@
+# app/utils/audit.py
+"""
+Asynchronous audit pipeline.
+- Controllers call audit(event, actor_id, **details): the record is put
+  on an in-process queue and the call returns immediately.
+- A background worker drains the queue in batches and hands each batch
+  to the sinks: an append-only JSON Lines file (always written first)
+  and, optionally, Sentry.
+- A failing sink never affects the others, so audit records stay on disk
+  during a Sentry outage. Sentry events are built on an isolated scope
+  and no longer leak tags or context into the global scope.
+"""
+
+import atexit
+import json
+import logging
+import os
+import queue
+import threading
+import time
+from datetime import datetime, timezone
+from typing import List, Optional, Sequence
+
+import sentry_sdk
+
+from config.config import Config
+
+logger = logging.getLogger(__name__)
+
+# Queue marker asking the worker to write what it holds and stop
+_STOP = object()
+
+
+class AuditRecord:
+    """One audited business action."""
+
+    def __init__(
+        self,
+        event: str,
+        actor_id: Optional[int] = None,
+        details: Optional[dict] = None,
+        timestamp: Optional[datetime] = None,
+    ):
+        self.event = event
+        self.actor_id = actor_id
+        self.details = details or {}
+        self.timestamp = timestamp or datetime.now(timezone.utc)
+
+    @property
+    def category(self) -> str:
+        """Audit tag: the event prefix ("contract.signed" -> "contract")."""
+        return self.event.split(".", 1)[0]
+
+    def as_dict(self) -> dict:
+        return {
+            "timestamp": self.timestamp.isoformat(),
+            "event": self.event,
+            "actor_id": self.actor_id,
+            "details": self.details,
+        }
+
+
+class FileAuditSink:
+    """Append records as JSON lines to a local file."""
+
+    def __init__(self, path: str, fsync: bool = True):
+        self.path = path
+        self.fsync = fsync
+
+    def write(self, records: Sequence[AuditRecord]) -> None:
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        lines = "".join(
+            json.dumps(record.as_dict(), default=str) + "\n"
+            for record in records
+        )
+        # One append and at most one fsync per batch
+        with open(self.path, "a", encoding="utf-8") as handle:
+            handle.write(lines)
+            handle.flush()
+            if self.fsync:
+                os.fsync(handle.fileno())
+
+
+class SentryAuditSink:
+    """Send each record as an informational Sentry message."""
+
+    def write(self, records: Sequence[AuditRecord]) -> None:
+        for record in records:
+            # A forked scope keeps the tag and context off the global scope
+            with sentry_sdk.new_scope() as scope:
+                scope.set_tag("audit", record.category)
+                scope.set_context("audit", record.as_dict())
+                scope.capture_message(record.event, level="info")
+
+
+class AuditPipeline:
+    """
+    Queue audit records and write them from a background thread.
+
+    The worker starts on the first emit(). Records are written when
+    `batch_size` of them are waiting or `flush_interval` seconds after
+    the first one of a batch arrived, whichever comes first.
+    """
+
+    def __init__(
+        self,
+        sinks: Sequence,
+        batch_size: int = 100,
+        flush_interval: float = 1.0,
+        max_queue: int = 10_000,
+    ):
+        self.sinks = list(sinks)
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.dropped = 0
+        self.failures = 0
+        self._queue: queue.Queue = queue.Queue(maxsize=max_queue)
+        self._lock = threading.Lock()
+        self._worker: Optional[threading.Thread] = None
+        self._closed = False
+
+    def emit(self, record: AuditRecord) -> None:
+        """Queue a record without waiting for any sink."""
+        # Checked and queued under the lock close() takes, so a record is
+        # either queued ahead of the stop marker or written below
+        with self._lock:
+            closed = self._closed
+            if not closed:
+                self._ensure_worker()
+                try:
+                    self._queue.put_nowait(record)
+                except queue.Full:
+                    self.dropped += 1
+                    logger.warning(
+                        "Audit queue full, dropped %s", record.event
+                    )
+        if closed:
+            # Late records (e.g. during interpreter shutdown) are written
+            # synchronously rather than lost
+            self._write([record])
+
+    def flush(self) -> None:
+        """Block until every queued record has been handed to the sinks."""
+        if self._worker is not None and self._worker.is_alive():
+            self._queue.join()
+
+    def close(self, timeout: Optional[float] = 5.0) -> None:
+        """Write the pending records and stop the worker."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            worker = self._worker
+        if worker is not None and worker.is_alive():
+            self._queue.put(_STOP)
+            worker.join(timeout)
+
+    def _ensure_worker(self) -> None:
+        # Called with self._lock held
+        if self._worker is None:
+            self._worker = threading.Thread(
+                target=self._run, name="audit-writer", daemon=True
+            )
+            self._worker.start()
+
+    def _run(self) -> None:
+        while True:
+            batch: List[AuditRecord] = []
+            taken = 0
+            stop = False
+
+            item = self._queue.get()
+            taken += 1
+            if item is _STOP:
+                stop = True
+            else:
+                batch.append(item)
+                deadline = time.monotonic() + self.flush_interval
+                while len(batch) < self.batch_size:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    try:
+                        item = self._queue.get(timeout=remaining)
+                    except queue.Empty:
+                        break
+                    taken += 1
+                    if item is _STOP:
+                        stop = True
+                        break
+                    batch.append(item)
+
+            if batch:
+                self._write(batch)
+            for _ in range(taken):
+                self._queue.task_done()
+            if stop:
+                return
+
+    def _write(self, batch: List[AuditRecord]) -> None:
+        for sink in self.sinks:
+            try:
+                sink.write(batch)
+            except Exception:
+                # Other sinks still get the batch
+                self.failures += 1
+                logger.exception(
+                    "Audit sink %s failed on %d record(s)",
+                    type(sink).__name__, len(batch),
+                )
+
+
+_pipeline: Optional[AuditPipeline] = None
+_pipeline_lock = threading.Lock()
+
+
+def create_audit_pipeline() -> AuditPipeline:
+    """Build the pipeline described by the AUDIT_* settings."""
+    sinks = [FileAuditSink(Config.AUDIT_LOG_PATH)]
+    if Config.AUDIT_TO_SENTRY:
+        sinks.append(SentryAuditSink())
+    return AuditPipeline(
+        sinks,
+        batch_size=Config.AUDIT_BATCH_SIZE,
+        flush_interval=Config.AUDIT_FLUSH_INTERVAL,
+        max_queue=Config.AUDIT_QUEUE_SIZE,
+    )
+
+
+def get_audit_pipeline() -> AuditPipeline:
+    """Return the process-wide pipeline, creating it on first use."""
+    global _pipeline
+    if _pipeline is None:
+        with _pipeline_lock:
+            if _pipeline is None:
+                _pipeline = create_audit_pipeline()
+                atexit.register(_pipeline.close)
+    return _pipeline
+
+
+def set_audit_pipeline(pipeline: Optional[AuditPipeline]) -> None:
+    """Replace the process-wide pipeline, closing the previous one."""
+    global _pipeline
+    with _pipeline_lock:
+        previous, _pipeline = _pipeline, pipeline
+    if previous is not None and previous is not pipeline:
+        previous.close()
+
+
+def audit(event: str, actor_id: Optional[int] = None, **details) -> None:
+    """Queue an audit record on the process-wide pipeline."""
+    get_audit_pipeline().emit(AuditRecord(event, actor_id, details))
@@ -3,20 +3,50 @@
 This module handles secure password management using the Argon2 hashing
 algorithm. It provides utilities for hashing plain text passwords and
 verifying them against stored hashes.
+
+Argon2 is deliberately expensive, so interactive paths (login, employee
+creation and password changes) go through a PasswordService: a bounded
+pool of worker threads (argon2 releases the GIL while hashing) with
+queueing metrics. When many people log in at once, at most AUTH_WORKERS
+hashes run in parallel and further requests wait their turn instead of
+saturating every CPU. The cost parameters come from the ARGON2_* settings;
+a stored hash created with other parameters is reported by
+verify_and_update so the caller can store the migrated hash.
 """
 
+import asyncio
+import atexit
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Optional, Tuple
+
 from argon2 import PasswordHasher
 from argon2.exceptions import VerifyMismatchError, InvalidHashError
 
-# Initialize the hasher with default secure parameters
-ph = PasswordHasher()
+from config.config import Config
+
+
+def create_hasher() -> PasswordHasher:
+    """Build the hasher described by the ARGON2_* settings."""
+    return PasswordHasher(
+        time_cost=Config.ARGON2_TIME_COST,
+        memory_cost=Config.ARGON2_MEMORY_COST,
+        parallelism=Config.ARGON2_PARALLELISM,
+    )
 
 
-def hash_password(password: str) -> str:
+# Hasher shared by the inline helpers and the default PasswordService
+ph = create_hasher()
+
+
+def hash_password(password: str, salt: Optional[bytes] = None) -> str:
     """
     Hash a password using Argon2.
+    A fixed salt is only meant for reproducible generated data; by
+    default a random salt is drawn for every hash.
     """
-    return ph.hash(password)
+    return ph.hash(password, salt=salt)
 
 
 def verify_password(hashed_password: str, plain_password: str) -> bool:
@@ -26,4 +56,158 @@ def verify_password(hashed_password: str, plain_password: str) -> bool:
     try:
         return ph.verify(hashed_password, plain_password)
     except (VerifyMismatchError, InvalidHashError):
-        return False
\ No newline at end of file
+        return False
+
+
+class PasswordService:
+    """
+    Runs Argon2 jobs on `workers` threads. At most `max_pending` jobs may
+    wait for a worker; callers beyond that block until a slot frees up.
+    """
+
+    def __init__(
+        self,
+        hasher: Optional[PasswordHasher] = None,
+        workers: int = 2,
+        max_pending: int = 32,
+    ):
+        self.hasher = hasher or ph
+        self.workers = max(1, workers)
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.workers, thread_name_prefix="argon2"
+        )
+        self._slots = threading.BoundedSemaphore(self.workers + max_pending)
+        self._lock = threading.Lock()
+
+        # Queueing metrics
+        self.submitted = 0
+        self.completed = 0
+        self.queued = 0
+        self.running = 0
+        self.peak_queued = 0
+        self.rehashed = 0
+        self.total_wait_ms = 0.0
+        self.max_wait_ms = 0.0
+
+    def _submit(self, fn: Callable, *args) -> Future:
+        self._slots.acquire()
+        queued_at = time.monotonic()
+        with self._lock:
+            self.submitted += 1
+            self.queued += 1
+            self.peak_queued = max(self.peak_queued, self.queued)
+
+        def job():
+            waited_ms = (time.monotonic() - queued_at) * 1000
+            with self._lock:
+                self.queued -= 1
+                self.running += 1
+                self.total_wait_ms += waited_ms
+                self.max_wait_ms = max(self.max_wait_ms, waited_ms)
+            try:
+                return fn(*args)
+            finally:
+                with self._lock:
+                    self.running -= 1
+                    self.completed += 1
+                self._slots.release()
+
+        try:
+            return self._executor.submit(job)
+        except RuntimeError:
+            # Executor shut down: the job will never release its slot
+            with self._lock:
+                self.queued -= 1
+            self._slots.release()
+            raise
+
+    def _verify_and_update(
+        self, hashed_password: str, plain_password: str
+    ) -> Tuple[bool, Optional[str]]:
+        try:
+            self.hasher.verify(hashed_password, plain_password)
+        except (VerifyMismatchError, InvalidHashError):
+            return False, None
+        if not self.hasher.check_needs_rehash(hashed_password):
+            return True, None
+        with self._lock:
+            self.rehashed += 1
+        return True, self.hasher.hash(plain_password)
+
+    def hash(self, password: str) -> str:
+        """Hash a password on the pool."""
+        return self._submit(self.hasher.hash, password).result()
+
+    def verify_and_update(
+        self, hashed_password: str, plain_password: str
+    ) -> Tuple[bool, Optional[str]]:
+        """
+        Verify a password on the pool. Returns (valid, new_hash), where
+        new_hash is set when the stored hash used other cost parameters
+        and should be replaced.
+        """
+        return self._submit(
+            self._verify_and_update, hashed_password, plain_password
+        ).result()
+
+    async def hash_async(self, password: str) -> str:
+        """Hash a password on the pool without blocking the event loop."""
+        future = await asyncio.to_thread(
+            self._submit, self.hasher.hash, password
+        )
+        return await asyncio.wrap_future(future)
+
+    def metrics(self) -> dict:
+        """Snapshot of the queueing metrics."""
+        with self._lock:
+            started = self.completed + self.running
+            return {
+                "workers": self.workers,
+                "submitted": self.submitted,
+                "completed": self.completed,
+                "queued": self.queued,
+                "running": self.running,
+                "peak_queued": self.peak_queued,
+                "rehashed": self.rehashed,
+                "avg_wait_ms": (
+                    round(self.total_wait_ms / started, 3) if started else 0.0
+                ),
+                "max_wait_ms": round(self.max_wait_ms, 3),
+            }
+
+    def close(self) -> None:
+        """Finish the pending jobs and stop the workers."""
+        self._executor.shutdown(wait=True)
+
+
+_service: Optional[PasswordService] = None
+_service_lock = threading.Lock()
+
+
+def create_password_service() -> PasswordService:
+    """Build the service described by the AUTH_* settings."""
+    return PasswordService(
+        ph,
+        workers=Config.AUTH_WORKERS,
+        max_pending=Config.AUTH_QUEUE_SIZE,
+    )
+
+
+def get_password_service() -> PasswordService:
+    """Return the process-wide service, creating it on first use."""
+    global _service
+    if _service is None:
+        with _service_lock:
+            if _service is None:
+                _service = create_password_service()
+                atexit.register(_service.close)
+    return _service
+
+
+def set_password_service(service: Optional[PasswordService]) -> None:
+    """Replace the process-wide service, closing the previous one."""
+    global _service
+    with _service_lock:
+        previous, _service = _service, service
+    if previous is not None and previous is not service:
+        previous.close()
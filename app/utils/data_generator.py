@@ -0,0 +1,308 @@
+# app/utils/data_generator.py
+"""
+Deterministic synthetic data generator for load testing and benchmarks.
+- The same seed and profile always produce the same rows, down to the
+  audit timestamps and the password hash salt: nothing is left to
+  server defaults or random salts.
+- Clients are spread over sales people with a Zipf-like skew, contracts
+  follow a signed / fully paid / partially paid mix, and events are only
+  planned for signed contracts, inside a configurable date window.
+- Rows are produced chunk by chunk and written with executemany INSERTs
+  on an autoflush-free session, committing once per chunk, so memory
+  stays flat even for tens of millions of rows.
+"""
+
+import random
+from datetime import datetime, timedelta
+from itertools import accumulate
+from typing import Callable, Dict, List, Optional
+
+from sqlalchemy import Engine, func, insert, select
+from sqlalchemy.orm import Session
+
+from app.models.client import Client
+from app.models.contract import Contract
+from app.models.department import Department
+from app.models.employee import Employee
+from app.models.event import Event
+from app.utils.auth import hash_password
+
+# Fixed seed so that repeated runs produce the same dataset
+DEFAULT_SEED = 12
+
+# Clients generated (with their contracts and events) per INSERT batch
+DEFAULT_BATCH_SIZE = 10_000
+
+# Password shared by every generated employee
+DEFAULT_PASSWORD = "LoadTest123!"
+
+FIRST_NAMES = (
+    "Alice", "Bruno", "Chloé", "David", "Emma", "Farid", "Gabriel", "Hugo",
+    "Inès", "Jules", "Karim", "Léa", "Manon", "Nathan", "Olivia", "Paul",
+    "Quentin", "Rose", "Sofia", "Thomas", "Ugo", "Victor", "Yasmine", "Zoé",
+)
+LAST_NAMES = (
+    "Martin", "Bernard", "Dubois", "Durand", "Lefebvre", "Moreau", "Laurent",
+    "Simon", "Michel", "Garcia", "Roux", "Fournier", "Girard", "Bonnet",
+    "Mercier", "Blanc", "Guerin", "Muller", "Faure", "Andre", "Chevalier",
+)
+COMPANY_WORDS = (
+    "Atlas", "Boreal", "Cobalt", "Delta", "Etoile", "Fusion", "Granit",
+    "Helios", "Iris", "Jade", "Kappa", "Lumen", "Mistral", "Nova", "Orion",
+)
+COMPANY_SUFFIXES = ("SA", "SAS", "SARL", "Group", "Events", "Studio")
+EVENT_KINDS = (
+    "Wedding", "Seminar", "Product launch", "Gala", "Conference",
+    "Team building", "Concert", "Birthday", "Trade show",
+)
+LOCATIONS = (
+    "Paris", "Lyon", "Marseille", "Bordeaux", "Lille", "Nantes", "Nice",
+    "Strasbourg", "Toulouse", "Rennes", "Montpellier", "Annecy",
+)
+
+
+class DatasetProfile:
+    """Volumes and distributions of a generated dataset."""
+
+    def __init__(
+        self,
+        clients: int = 1000,
+        sales: int = 20,
+        support: int = 10,
+        management: int = 2,
+        contracts_per_client: float = 1.0,
+        signed_ratio: float = 0.7,
+        paid_ratio: float = 0.4,
+        partial_ratio: float = 0.4,
+        event_ratio: float = 0.9,
+        unassigned_ratio: float = 0.15,
+        skew: float = 1.0,
+        start: datetime = datetime(2024, 1, 1),
+        span_days: int = 730,
+    ):
+        self.clients = clients
+        self.sales = sales
+        self.support = support
+        self.management = management
+        # Average contracts per client (1.5: every client has one,
+        # half of them a second one)
+        self.contracts_per_client = contracts_per_client
+        # Share of contracts that are signed
+        self.signed_ratio = signed_ratio
+        # Among signed contracts: fully paid, partially paid, rest unpaid
+        self.paid_ratio = paid_ratio
+        self.partial_ratio = partial_ratio
+        # Share of signed contracts with a planned event
+        self.event_ratio = event_ratio
+        # Share of events still waiting for a support contact
+        self.unassigned_ratio = unassigned_ratio
+        # Zipf exponent of the clients-per-salesperson distribution
+        # (0 spreads clients evenly)
+        self.skew = skew
+        # Activity window for contact, creation and event dates
+        self.start = start
+        self.span_days = span_days
+
+
+class DataGenerator:
+    """Bulk-load a DatasetProfile into the database bound to `engine`."""
+
+    def __init__(
+        self,
+        engine: Engine,
+        profile: Optional[DatasetProfile] = None,
+        seed: int = DEFAULT_SEED,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        password: str = DEFAULT_PASSWORD,
+        progress: Optional[Callable[[Dict[str, int]], None]] = None,
+    ):
+        self.engine = engine
+        self.profile = profile or DatasetProfile()
+        self.rng = random.Random(seed)
+        self.batch_size = batch_size
+        self.password = password
+        self.progress = progress
+        self.counts = {"employee": 0, "client": 0, "contract": 0, "event": 0}
+        self._next_ids: Dict[type, int] = {}
+        self._window_end = self.profile.start + timedelta(
+            days=self.profile.span_days
+        )
+
+    def run(self) -> Dict[str, int]:
+        """
+        Append the dataset to the existing tables and return the number
+        of rows inserted per table. Primary keys continue after the
+        current maximum so a database can be grown in several runs.
+        """
+        with Session(self.engine, autoflush=False) as session:
+            self._next_ids = {
+                model: (session.execute(
+                    select(func.max(model.id))
+                ).scalar() or 0) + 1
+                for model in (Employee, Client, Contract, Event)
+            }
+            staff = self._load_staff(session)
+            session.commit()
+
+            sales_weights = list(accumulate(
+                1 / (rank + 1) ** self.profile.skew
+                for rank in range(len(staff["SALES"]))
+            ))
+            for offset in range(0, self.profile.clients, self.batch_size):
+                size = min(self.batch_size, self.profile.clients - offset)
+                self._load_batch(session, size, staff, sales_weights)
+                session.commit()
+                if self.progress:
+                    self.progress(dict(self.counts))
+        return dict(self.counts)
+
+    def _take_ids(self, model, count: int) -> range:
+        first = self._next_ids[model]
+        self._next_ids[model] = first + count
+        return range(first, first + count)
+
+    def _moment(self, after: Optional[datetime] = None) -> datetime:
+        """Random instant in the activity window (after `after` if set)."""
+        start = after or self.profile.start
+        seconds = max(0.0, (self._window_end - start).total_seconds())
+        return start + timedelta(seconds=int(self.rng.random() * seconds))
+
+    def _person(self) -> str:
+        return (
+            f"{self.rng.choice(FIRST_NAMES)} {self.rng.choice(LAST_NAMES)}"
+        )
+
+    def _load_staff(self, session: Session) -> Dict[str, List[int]]:
+        """Reuse or create the departments, then add their employees."""
+        # Salt drawn from the seed so that the hash is reproducible
+        password = hash_password(self.password, salt=self.rng.randbytes(16))
+        staff = {}
+        for name, headcount in (
+            ("MANAGEMENT", self.profile.management),
+            ("SALES", self.profile.sales),
+            ("SUPPORT", self.profile.support),
+        ):
+            department_id = session.execute(
+                select(Department.id).where(Department.name == name)
+            ).scalar()
+            if department_id is None:
+                department_id = session.execute(
+                    insert(Department).values(name=name)
+                ).inserted_primary_key[0]
+
+            ids = self._take_ids(Employee, headcount)
+            if headcount:
+                session.execute(insert(Employee.__table__), [
+                    {
+                        "id": emp_id,
+                        "full_name": self._person(),
+                        "email": f"{name.lower()}{emp_id}@loadtest.local",
+                        "password": password,
+                        "employee_number": f"LT{emp_id:07d}",
+                        "department_id": department_id,
+                    }
+                    for emp_id in ids
+                ])
+            self.counts["employee"] += headcount
+            staff[name] = list(ids)
+
+        if not staff["SALES"]:
+            raise ValueError("The dataset needs at least one sales person")
+        return staff
+
+    def _amounts(self, signed: bool) -> tuple:
+        """Return (total, remaining) following the payment mix."""
+        total = self.rng.randint(50_000, 5_000_000) / 100
+        if not signed:
+            return total, total
+        draw = self.rng.random()
+        if draw < self.profile.paid_ratio:
+            return total, 0.0
+        if draw < self.profile.paid_ratio + self.profile.partial_ratio:
+            share = self.rng.randint(10, 90) / 100
+            return total, round(total * share, 2)
+        return total, total
+
+    def _load_batch(
+        self,
+        session: Session,
+        size: int,
+        staff: Dict[str, List[int]],
+        sales_weights: List[float],
+    ) -> None:
+        """Generate and insert one batch of clients with their children."""
+        profile = self.profile
+        rng = self.rng
+        owners = rng.choices(
+            staff["SALES"], cum_weights=sales_weights, k=size
+        )
+        whole, extra = divmod(profile.contracts_per_client, 1)
+
+        clients, contracts, events = [], [], []
+        for client_id, owner in zip(self._take_ids(Client, size), owners):
+            created = self._moment()
+            last_contact = self._moment(created)
+            clients.append({
+                "id": client_id,
+                "full_name": self._person(),
+                "email": f"client{client_id}@loadtest.local",
+                "phone": f"0{rng.randint(600000000, 799999999)}",
+                "company_name": (
+                    f"{rng.choice(COMPANY_WORDS)} "
+                    f"{rng.choice(COMPANY_SUFFIXES)}"
+                ),
+                "last_contact": last_contact,
+                "creation_date": created,
+                "last_update": last_contact,
+                "sales_contact_id": owner,
+            })
+
+            n_contracts = int(whole) + (rng.random() < extra)
+            for contract_id in self._take_ids(Contract, n_contracts):
+                signed = rng.random() < profile.signed_ratio
+                total, remaining = self._amounts(signed)
+                signed_at = self._moment(created)
+                contracts.append({
+                    "id": contract_id,
+                    "total_amount": total,
+                    "remaining_amount": remaining,
+                    "is_signed": signed,
+                    "creation_date": signed_at,
+                    "last_update": signed_at,
+                    "client_id": client_id,
+                    "sales_contact_id": owner,
+                })
+                if not signed or rng.random() >= profile.event_ratio:
+                    continue
+
+                begins = self._moment(signed_at)
+                support = staff["SUPPORT"]
+                events.append({
+                    "id": self._take_ids(Event, 1)[0],
+                    "name": f"{rng.choice(EVENT_KINDS)} {contract_id}",
+                    "event_date_start": begins,
+                    "event_date_end": begins + timedelta(
+                        hours=rng.randint(2, 72)
+                    ),
+                    "location": rng.choice(LOCATIONS),
+                    "attendees": int(rng.lognormvariate(4, 0.8)) + 5,
+                    "notes": "",
+                    "creation_date": signed_at,
+                    "last_update": signed_at,
+                    "client_id": client_id,
+                    "contract_id": contract_id,
+                    "support_contact_id": (
+                        None
+                        if not support
+                        or rng.random() < profile.unassigned_ratio
+                        else rng.choice(support)
+                    ),
+                })
+
+        for model, rows in ((Client, clients), (Contract, contracts),
+                            (Event, events)):
+            if rows:
+                # Core table INSERT: plain executemany, no ORM bookkeeping
+                # or RETURNING of server defaults
+                session.execute(insert(model.__table__), rows)
+            self.counts[model.__tablename__] += len(rows)
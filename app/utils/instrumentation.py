@@ -0,0 +1,192 @@
+# app/utils/instrumentation.py
+"""
+SQL instrumentation hooks on the SQLAlchemy engine.
+- QueryProfiler attaches before/after_cursor_execute listeners and
+  aggregates, per named action (e.g. a menu choice), the statement
+  count, total database time, rows returned and the slowest statements.
+- Rows come from the cursor's rowcount: affected rows for writes, and
+  returned rows for SELECTs on drivers that buffer results (MySQL).
+  SQLite and server-side (streaming) cursors report no SELECT rows.
+- Each action runs in a Sentry transaction; statements slower than
+  DB_SLOW_QUERY_MS are recorded in it as "db.sql.slow" spans.
+- Transaction control statements (BEGIN, SAVEPOINT, ...) are ignored.
+"""
+
+import heapq
+import time
+from contextlib import contextmanager
+from typing import Iterator, List, Optional, Tuple
+
+import sentry_sdk
+from sqlalchemy import Engine, event
+
+from config.config import Config
+
+# Transaction control statements left out of the statistics
+CONTROL_PREFIXES = ("BEGIN", "SAVEPOINT", "RELEASE", "ROLLBACK", "COMMIT")
+
+# Statistics bucket for statements issued outside any action
+IDLE_ACTION = "(outside actions)"
+
+# Longest statement text kept in reports and Sentry spans
+MAX_STATEMENT_LENGTH = 500
+
+_START_KEY = "query_profiler_start"
+
+
+class ActionStats:
+    """SQL statistics of one action."""
+
+    def __init__(self, name: str, keep_slowest: int = 5):
+        self.name = name
+        self.statements = 0
+        self.total_ms = 0.0
+        self.rows = 0
+        self._keep_slowest = keep_slowest
+        self._slowest: List[Tuple[float, int, str]] = []
+
+    def record(self, statement: str, elapsed_ms: float) -> None:
+        """Account for one executed statement."""
+        self.statements += 1
+        self.total_ms += elapsed_ms
+        if not self._keep_slowest:
+            return
+        # The counter breaks ties so statements are never compared
+        entry = (elapsed_ms, self.statements, statement)
+        if len(self._slowest) < self._keep_slowest:
+            heapq.heappush(self._slowest, entry)
+        else:
+            heapq.heappushpop(self._slowest, entry)
+
+    @property
+    def slowest(self) -> List[Tuple[float, str]]:
+        """(elapsed_ms, statement) pairs, slowest first."""
+        return [
+            (elapsed_ms, statement)
+            for elapsed_ms, _, statement in sorted(self._slowest, reverse=True)
+        ]
+
+    def as_dict(self) -> dict:
+        return {
+            "action": self.name,
+            "statements": self.statements,
+            "db_ms": round(self.total_ms, 3),
+            "rows": self.rows,
+            "slowest": [
+                {"ms": round(ms, 3), "statement": statement}
+                for ms, statement in self.slowest
+            ],
+        }
+
+
+class QueryProfiler:
+    """
+    Collect per-action SQL statistics from an engine.
+
+    Usage:
+        with QueryProfiler(engine) as profiler:
+            with profiler.action("list clients") as stats:
+                ...
+            print(stats.statements, stats.total_ms)
+    """
+
+    def __init__(
+        self,
+        engine: Engine,
+        slow_ms: Optional[float] = None,
+        keep_slowest: int = 5,
+    ):
+        self.engine = engine
+        self.slow_ms = Config.DB_SLOW_QUERY_MS if slow_ms is None else slow_ms
+        self.keep_slowest = keep_slowest
+        self.actions: List[ActionStats] = []
+        self.idle = ActionStats(IDLE_ACTION, keep_slowest)
+        self.current = self.idle
+        self._transaction = None
+        self._attached = False
+        # Several profilers may share an engine: each times statements
+        # under its own conn.info key
+        self._start_key = (_START_KEY, id(self))
+
+    def attach(self) -> "QueryProfiler":
+        if not self._attached:
+            event.listen(self.engine, "before_cursor_execute", self._before)
+            event.listen(self.engine, "after_cursor_execute", self._after)
+            self._attached = True
+        return self
+
+    def detach(self) -> None:
+        if self._attached:
+            event.remove(self.engine, "before_cursor_execute", self._before)
+            event.remove(self.engine, "after_cursor_execute", self._after)
+            self._attached = False
+
+    def __enter__(self) -> "QueryProfiler":
+        return self.attach()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.detach()
+
+    def start_action(self, name: str, op: str = "cli.action") -> ActionStats:
+        """
+        Start collecting into a new action (ending the current one).
+        `op` is the Sentry transaction op, used for trace sampling.
+        """
+        self.end_action()
+        self.current = ActionStats(name, self.keep_slowest)
+        self.actions.append(self.current)
+        self._transaction = sentry_sdk.start_transaction(op=op, name=name)
+        self._transaction.__enter__()
+        return self.current
+
+    def end_action(self) -> Optional[ActionStats]:
+        """Close the current action and return it (None when idle)."""
+        if self.current is self.idle:
+            return None
+        stats = self.current
+        self._transaction.set_data("db.statements", stats.statements)
+        self._transaction.set_data("db.total_ms", round(stats.total_ms, 3))
+        self._transaction.__exit__(None, None, None)
+        self.current = self.idle
+        return stats
+
+    @contextmanager
+    def action(
+        self, name: str, op: str = "cli.action"
+    ) -> Iterator[ActionStats]:
+        """Collect the statements issued by the block under `name`."""
+        stats = self.start_action(name, op)
+        try:
+            yield stats
+        finally:
+            self.end_action()
+
+    def _before(self, conn, cursor, statement, parameters, context, many):
+        # One statement at a time runs on a connection
+        conn.info[self._start_key] = (time.perf_counter(), time.time())
+
+    def _after(self, conn, cursor, statement, parameters, context, many):
+        # Nothing recorded when attached while the statement was running
+        start = conn.info.pop(self._start_key, None)
+        if start is None:
+            return
+        started, wall_started = start
+        if statement.lstrip().upper().startswith(CONTROL_PREFIXES):
+            return
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        text = statement.strip()[:MAX_STATEMENT_LENGTH]
+        stats = self.current
+        stats.record(text, elapsed_ms)
+
+        # Rows affected, or returned when the driver buffers the result
+        # (mysql-connector's default cursor); -1 when it does not know yet
+        if cursor.rowcount > 0:
+            stats.rows += cursor.rowcount
+
+        if elapsed_ms >= self.slow_ms:
+            span = sentry_sdk.start_span(
+                op="db.sql.slow", name=text, start_timestamp=wall_started
+            )
+            span.set_data("db.duration_ms", round(elapsed_ms, 3))
+            span.set_data("db.executemany", many)
+            span.finish()
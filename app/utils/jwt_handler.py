@@ -3,19 +3,89 @@
 This module handles JSON Web Token (JWT) generation and validation.
 It ensures that user sessions are persistent, secure, and include
 expiration logic as required by the technical specifications.
+Decoded claims are kept in a small in-process cache until the token
+expires, so repeated checks of the same token skip signature verification.
 """
 
 import os
 import datetime
+import hashlib
+import threading
+import time
+from collections import OrderedDict
 from typing import Optional
-import jwt
-import sentry_sdk
+
+from app.utils.lazy import lazy_import
+
+# Loaded when a token is first created or decoded, not at CLI start
+jwt = lazy_import("jwt")
+sentry_sdk = lazy_import("sentry_sdk")
 
 
 # Configuration from environment variables
 SECRET_KEY = os.getenv("JWT_SECRET", "default-secret-key-to-change")
 ALGORITHM = os.getenv("JWT_ALGORITHM", "HS256")
 TOKEN_EXPIRATION_HOURS = 12
+# Decoded tokens kept in memory (0 disables the cache)
+TOKEN_CACHE_SIZE = int(os.getenv("JWT_CACHE_SIZE", "64"))
+
+
+class TokenCache:
+    """
+    Thread-safe LRU cache of decoded claims, keyed by the SHA-256 digest
+    of the token. An entry is only returned while its `exp` claim has not
+    passed; expired entries are evicted on access.
+    """
+
+    def __init__(self, maxsize: int = TOKEN_CACHE_SIZE):
+        self.maxsize = maxsize
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(token: str) -> bytes:
+        return hashlib.sha256(token.encode("utf-8")).digest()
+
+    def get(self, token: str) -> Optional[dict]:
+        """Return a copy of the cached claims, or None."""
+        key = self._key(token)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, claims = entry
+            if time.time() >= expires_at:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return dict(claims)
+
+    def put(self, token: str, claims: dict) -> None:
+        """Cache claims until their `exp`; tokens without one are skipped."""
+        expires_at = claims.get("exp")
+        if self.maxsize <= 0 or not isinstance(expires_at, (int, float)):
+            return
+        key = self._key(token)
+        with self._lock:
+            self._entries[key] = (expires_at, dict(claims))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def discard(self, token: str) -> None:
+        with self._lock:
+            self._entries.pop(self._key(token), None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+token_cache = TokenCache()
 
 
 def create_token(employee_id: int, department_name: str) -> str:
@@ -40,9 +110,13 @@ def decode_token(token: str) -> Optional[dict]:
     """
     Decode and validate a JWT token.
     Returns the payload if valid, or None if expired/invalid.
+    A token seen before and not yet expired is served from token_cache.
     """
+    claims = token_cache.get(token)
+    if claims is not None:
+        return claims
     try:
-        return jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+        claims = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
     except jwt.ExpiredSignatureError as e:
         sentry_sdk.capture_exception(e)
         return None
@@ -50,4 +124,17 @@ def decode_token(token: str) -> Optional[dict]:
         # Debug print for development phase
         print(f"DEBUG Decode Error: {e}")
         sentry_sdk.capture_exception(e)
-        return None
\ No newline at end of file
+        return None
+    token_cache.put(token, claims)
+    return claims
+
+
+def forget_token(token: Optional[str] = None) -> None:
+    """
+    Evict a token from the decoded-token cache (every token if None).
+    Called on logout so a discarded session is verified again.
+    """
+    if token is None:
+        token_cache.clear()
+    else:
+        token_cache.discard(token)
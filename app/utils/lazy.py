@@ -0,0 +1,48 @@
+# app/utils/lazy.py
+"""
+Deferred imports for modules that are expensive to load (sentry_sdk,
+jwt, ...) but not needed on every CLI start.
+- lazy_import returns a module object whose code only runs on the first
+  attribute access (importlib.util.LazyLoader).
+- is_loaded tells whether a module has actually been executed, so
+  optional integrations can be skipped while nobody has loaded them.
+"""
+
+import importlib.util
+import sys
+from types import ModuleType
+from typing import Dict
+
+# Class of each module returned by lazy_import before its first use; the
+# loader swaps it for the module's real class once the code has run
+_pending_types: Dict[str, type] = {}
+
+
+def lazy_import(name: str) -> ModuleType:
+    """Return module `name`, executing it on first attribute access."""
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+
+    spec = importlib.util.find_spec(name)
+    if spec is None:
+        raise ModuleNotFoundError(f"No module named '{name}'", name=name)
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    _pending_types[name] = type(module)
+    return module
+
+
+def is_loaded(name: str) -> bool:
+    """True once module `name` has been imported and executed."""
+    module = sys.modules.get(name)
+    if module is None:
+        return False
+    # type() does not go through the lazy module's attribute hook
+    if type(module) is _pending_types.get(name):
+        return False
+    _pending_types.pop(name, None)
+    return True
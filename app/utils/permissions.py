@@ -2,9 +2,20 @@
 """
 This module provides a centralized authorization system mapping
 specific actions to departments to determine user permissions.
+- PERMISSIONS is compiled into frozensets at import time and decisions
+  are memoized, so a check is a cached set lookup.
+- Denials are reported to Sentry through a deduplicated, rate-limited
+  path so bursts of denied calls do not flood the monitoring service.
 """
 
-import sentry_sdk
+import threading
+import time
+from functools import lru_cache
+
+from app.utils.lazy import lazy_import
+
+# Loaded on the first reported denial
+sentry_sdk = lazy_import("sentry_sdk")
 
 # Mapping of permissions per department
 PERMISSIONS = {
@@ -39,19 +50,80 @@ PERMISSIONS = {
 }
 
 
+# Immutable per-department permission sets, compiled once at import
+COMPILED_PERMISSIONS = {
+    department: frozenset(actions)
+    for department, actions in PERMISSIONS.items()
+}
+NO_PERMISSIONS: frozenset = frozenset()
+
+# Minimum delay (seconds) between two Sentry reports of the same denial
+DENIAL_REPORT_INTERVAL = 60.0
+
+_denial_lock = threading.Lock()
+_last_denial_report: dict = {}
+_suppressed_denials: dict = {}
+
+
+def permissions_for(department_name: str) -> frozenset:
+    """
+    Return the frozenset of actions allowed for a department.
+    """
+    return COMPILED_PERMISSIONS.get(department_name, NO_PERMISSIONS)
+
+
+@lru_cache(maxsize=256)
+def is_allowed(action: str, department_name: str) -> bool:
+    """
+    Memoized (action, department) decision without denial reporting.
+    """
+    return action in permissions_for(department_name)
+
+
+def report_denial(action: str, department_name: str) -> bool:
+    """
+    Report an access denial to Sentry, at most once per
+    DENIAL_REPORT_INTERVAL for each (department, action) pair.
+    Suppressed repeats are counted and included in the next report.
+    Returns True when a report was actually sent.
+    """
+    key = (department_name, action)
+    now = time.monotonic()
+
+    with _denial_lock:
+        last = _last_denial_report.get(key)
+        if last is not None and now - last < DENIAL_REPORT_INTERVAL:
+            _suppressed_denials[key] = _suppressed_denials.get(key, 0) + 1
+            return False
+        _last_denial_report[key] = now
+        suppressed = _suppressed_denials.pop(key, 0)
+
+    message = (
+        f"Access denied: Department '{department_name}' "
+        f"tried to perform action '{action}'"
+    )
+    if suppressed:
+        message += f" ({suppressed} similar denials suppressed)"
+
+    # Log unauthorized access attempts to Sentry as a warning
+    sentry_sdk.capture_message(message, level="warning")
+    return True
+
+
+def reset_denial_reports() -> None:
+    """Forget rate-limit state (e.g. between tests)."""
+    with _denial_lock:
+        _last_denial_report.clear()
+        _suppressed_denials.clear()
+
+
 def has_permission(action: str, department_name: str) -> bool:
     """
     Check if a specific department has the required permission.
     """
-    allowed_actions = PERMISSIONS.get(department_name, [])
-    is_allowed = action in allowed_actions
+    allowed = is_allowed(action, department_name)
 
-    if not is_allowed:
-        # Log unauthorized access attempts to Sentry as a warning
-        sentry_sdk.capture_message(
-            f"Access denied: Department '{department_name}' "
-            f"tried to perform action '{action}'",
-            level="warning"
-        )
+    if not allowed:
+        report_denial(action, department_name)
 
-    return is_allowed
\ No newline at end of file
+    return allowed
\ No newline at end of file
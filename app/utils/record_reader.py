@@ -0,0 +1,86 @@
+# app/utils/record_reader.py
+"""
+This module streams records from CSV or JSONL files for bulk imports,
+and id lists for batch commands. Records are yielded one at a time with
+their source line number, so arbitrarily large files can be processed
+with flat memory.
+"""
+
+import csv
+import json
+import os
+from itertools import islice
+from typing import IO, Iterable, Iterator, Optional, Tuple
+
+SUPPORTED_FORMATS = ("csv", "jsonl")
+
+
+def detect_format(path: str) -> str:
+    """Infer the record format from the file extension."""
+    extension = os.path.splitext(path)[1].lower().lstrip(".")
+    if extension == "json":
+        extension = "jsonl"
+    if extension not in SUPPORTED_FORMATS:
+        raise ValueError(
+            f"Unsupported file format '{extension}' "
+            f"(expected one of: {', '.join(SUPPORTED_FORMATS)})"
+        )
+    return extension
+
+
+def read_records(
+    path: str, fmt: Optional[str] = None
+) -> Iterator[Tuple[int, object]]:
+    """
+    Yield (line_number, record) pairs from a CSV or JSONL file.
+    A JSONL line that cannot be decoded is yielded as a ValueError
+    instead of a dict so the caller can report it and carry on.
+    """
+    fmt = fmt or detect_format(path)
+    with open(path, "r", encoding="utf-8", newline="") as f:
+        if fmt == "csv":
+            reader = csv.DictReader(f)
+            for record in reader:
+                # line_num points at the last physical line read
+                yield reader.line_num, record
+            return
+
+        for line_number, line in enumerate(f, start=1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError as e:
+                yield line_number, ValueError(f"Invalid JSON: {e.msg}")
+                continue
+            if not isinstance(record, dict):
+                record = ValueError("Each JSONL line must be an object.")
+            yield line_number, record
+
+
+def read_ids(source: IO[str]) -> Iterator[int]:
+    """
+    Yield integer ids from a text stream, one per line.
+    Blank lines and lines starting with "#" are skipped.
+    """
+    for line_number, line in enumerate(source, start=1):
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        try:
+            yield int(line)
+        except ValueError:
+            raise ValueError(
+                f"Line {line_number}: '{line}' is not a numeric id"
+            ) from None
+
+
+def chunked(values: Iterable, size: int) -> Iterator[list]:
+    """Yield successive lists of at most `size` values."""
+    iterator = iter(values)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
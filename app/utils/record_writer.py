@@ -0,0 +1,54 @@
+# app/utils/record_writer.py
+"""
+This module streams listing rows to CSV or JSONL for batch commands.
+Rows are written one at a time as they are read from the repository,
+so exports of any size run with flat memory and the first line is
+available to the consumer immediately.
+"""
+
+import csv
+import json
+from datetime import date, datetime
+from decimal import Decimal
+from typing import IO, Iterable
+
+WRITE_FORMATS = ("jsonl", "csv")
+
+
+def _plain(value):
+    """Convert a column value to a JSON/CSV friendly scalar."""
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return float(value)
+    return value
+
+
+def row_to_dict(row) -> dict:
+    """Return a listing row (read-only Row or dict) as a plain dict."""
+    values = row if isinstance(row, dict) else row.as_dict()
+    return {key: _plain(value) for key, value in values.items()}
+
+
+def write_records(rows: Iterable, fmt: str, out: IO[str]) -> int:
+    """Write rows to `out` in the given format and return their count."""
+    if fmt not in WRITE_FORMATS:
+        raise ValueError(
+            f"Unsupported output format '{fmt}' "
+            f"(expected one of: {', '.join(WRITE_FORMATS)})"
+        )
+
+    count = 0
+    writer = None
+    for row in rows or ():
+        record = row_to_dict(row)
+        if fmt == "jsonl":
+            out.write(json.dumps(record, ensure_ascii=False) + "\n")
+        else:
+            if writer is None:
+                # The header comes from the first row's fields
+                writer = csv.DictWriter(out, fieldnames=list(record))
+                writer.writeheader()
+            writer.writerow(record)
+        count += 1
+    return count
@@ -0,0 +1,53 @@
+# app/utils/session.py
+"""
+This module defines the authenticated context of one CLI session.
+A SessionContext is built once, at login or session restore, and is
+then passed as `user_data` to every controller call:
+- it is a dict holding the same user data as before (id, department,
+  ...), so controllers and views read it unchanged;
+- the department's permission set is resolved once, so permission
+  checks are a frozenset lookup without reading or verifying the token;
+- the Employee row is resolved on first use and kept.
+"""
+
+from typing import Callable, Optional
+
+from app.utils.permissions import permissions_for
+
+
+class SessionContext(dict):
+    """Authenticated user data with its claims, permissions and employee."""
+
+    def __init__(
+        self,
+        user_data: dict,
+        claims: Optional[dict] = None,
+        employee=None,
+        load_employee: Optional[Callable[[int], object]] = None,
+    ):
+        super().__init__(user_data)
+        # Decoded JWT claims (the user data itself right after login)
+        self.claims = dict(claims) if claims is not None else dict(user_data)
+        self.permissions = permissions_for(self.get("department"))
+        self._employee = employee
+        self._load_employee = load_employee
+
+    @property
+    def user_id(self) -> Optional[int]:
+        return self.get("id")
+
+    @property
+    def department(self) -> Optional[str]:
+        return self.get("department")
+
+    @property
+    def employee(self):
+        """The logged-in Employee, loaded once on first access."""
+        if self._employee is None and self._load_employee is not None:
+            self._employee = self._load_employee(self.user_id)
+            self._load_employee = None
+        return self._employee
+
+    def can(self, action: str) -> bool:
+        """True if the user's department may perform `action`."""
+        return action in self.permissions
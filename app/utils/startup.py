@@ -0,0 +1,77 @@
+# app/utils/startup.py
+"""
+Startup helpers for the CLI entry point.
+- Preloader builds the heavy part of the application (Sentry, database
+  engine, repositories, controllers) in a background thread, so the
+  login prompt or session restore does not wait for SQLAlchemy, argon2
+  or sentry_sdk to be imported.
+- StartupReport records when the entry point reached each milestone
+  and which top-level packages the preload imported: a coarse,
+  always-available companion to `python -X importtime`.
+"""
+
+import sys
+import threading
+import time
+from typing import Callable, List, Optional, Set, Tuple
+
+
+def _packages(modules: Set[str]) -> Set[str]:
+    """Top-level names of `modules`, without the standard library."""
+    return {
+        top for top in (name.split(".", 1)[0] for name in modules)
+        if not top.startswith("_") and top not in sys.stdlib_module_names
+    }
+
+
+class Preloader:
+    """Run `build` in a daemon thread; result() waits for it."""
+
+    def __init__(self, build: Callable):
+        self._build = build
+        self._result = None
+        self._error: Optional[BaseException] = None
+        self.elapsed_ms: Optional[float] = None
+        # Third-party and application packages imported by the build
+        self.packages: List[str] = []
+        self._thread = threading.Thread(
+            target=self._run, name="preload", daemon=True
+        )
+
+    def start(self) -> "Preloader":
+        self._thread.start()
+        return self
+
+    def _run(self) -> None:
+        before = _packages(set(sys.modules))
+        started = time.perf_counter()
+        try:
+            self._result = self._build()
+        except BaseException as e:
+            self._error = e
+        finally:
+            self.elapsed_ms = (time.perf_counter() - started) * 1000
+            # Approximate: imports made meanwhile by the main thread
+            # are counted too
+            self.packages = sorted(_packages(set(sys.modules)) - before)
+
+    def result(self):
+        """Wait for the build and return it (or raise its error)."""
+        self._thread.join()
+        if self._error is not None:
+            raise self._error
+        return self._result
+
+
+class StartupReport:
+    """Milestones of one CLI start, in ms since the report was created."""
+
+    def __init__(self):
+        self._started = time.perf_counter()
+        self.marks: List[Tuple[str, float, int]] = []
+
+    def mark(self, name: str) -> float:
+        """Record milestone `name` and return its time in ms."""
+        elapsed_ms = (time.perf_counter() - self._started) * 1000
+        self.marks.append((name, elapsed_ms, len(sys.modules)))
+        return elapsed_ms
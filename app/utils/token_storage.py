@@ -3,35 +3,120 @@
 This module manages the local persistence of the JWT token.
 It provides functions to save, retrieve, and delete the token from
 a local file to maintain user sessions across CLI executions.
+
+The file lives in a per-user location (CRM_TOKEN_FILE, by default
+<config dir>/epic_events/token) and is replaced atomically: the token is
+written to a private (0600) temporary file in the same directory, then
+renamed over the previous one, so a concurrent CLI process reads either
+the old or the new token, never a partial one. The last token read or
+written is mirrored in memory and only re-read when the file changes.
 """
 
 import os
+import tempfile
+import threading
 from typing import Optional
 
-TOKEN_FILE = ".token"
+
+def default_token_path() -> str:
+    """Return the per-user token location."""
+    base = os.getenv("XDG_CONFIG_HOME")
+    if not base and os.name == "nt":
+        base = os.getenv("APPDATA")
+    if not base:
+        base = os.path.join(os.path.expanduser("~"), ".config")
+    return os.path.join(base, "epic_events", "token")
+
+
+TOKEN_FILE = os.getenv("CRM_TOKEN_FILE") or default_token_path()
+
+
+class TokenStorage:
+    """Token file with atomic replacement and an in-memory mirror."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        # (file signature, token) of the last token read or written
+        self._mirror: Optional[tuple] = None
+
+    @staticmethod
+    def _signature(stat: os.stat_result) -> tuple:
+        # A rename gives the file a new inode, even within the same mtime
+        return (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+    def save(self, token: str) -> None:
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+
+        # mkstemp creates the file readable by its owner only (0600)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".token-")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(token)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+        with self._lock:
+            self._mirror = (self._signature(os.stat(self.path)), token)
+
+    def load(self) -> Optional[str]:
+        try:
+            signature = self._signature(os.stat(self.path))
+        except FileNotFoundError:
+            with self._lock:
+                self._mirror = None
+            return None
+
+        with self._lock:
+            if self._mirror is not None and self._mirror[0] == signature:
+                return self._mirror[1]
+
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                # Signature of the file actually read, if replaced meanwhile
+                signature = self._signature(os.fstat(f.fileno()))
+                token = f.read().strip()
+        except FileNotFoundError:
+            return None
+
+        with self._lock:
+            self._mirror = (signature, token)
+        return token
+
+    def delete(self) -> None:
+        with self._lock:
+            self._mirror = None
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+
+
+storage = TokenStorage(TOKEN_FILE)
 
 
 def save_token(token: str) -> None:
     """
-    Save the JWT token to a local hidden file.
+    Save the JWT token to the per-user token file.
     """
-    with open(TOKEN_FILE, "w", encoding="utf-8") as f:
-        f.write(token)
+    storage.save(token)
 
 
 def get_token() -> Optional[str]:
     """
-    Retrieve the JWT token from the local file if it exists.
+    Retrieve the JWT token, from memory unless the file has changed.
     """
-    if os.path.exists(TOKEN_FILE):
-        with open(TOKEN_FILE, "r", encoding="utf-8") as f:
-            return f.read().strip()
-    return None
+    return storage.load()
 
 
 def delete_token() -> None:
     """
-    Remove the local token file to log out the user.
+    Remove the token file to log out the user.
     """
-    if os.path.exists(TOKEN_FILE):
-        os.remove(TOKEN_FILE)
\ No newline at end of file
+    storage.delete()
@@ -0,0 +1,72 @@
+# app/utils/validators.py
+"""
+This module centralizes the parsing and validation rules applied to
+user-provided values (CLI prompts and bulk imports), so every entry
+point accepts and rejects data the same way.
+"""
+
+import re
+from datetime import datetime
+from typing import Iterable, Optional
+
+EMAIL_PATTERN = re.compile(r"^[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+$")
+
+# Accepted date formats
+CLIENT_CONTACT_FORMATS = ("%Y-%m-%d %H:%M:%S",)
+EVENT_DATE_FORMATS = ("%Y-%m-%d %H", "%Y-%m-%d %H:%M:%S")
+
+YES_VALUES = ("y", "yes", "true", "1")
+NO_VALUES = ("n", "no", "false", "0")
+
+
+def is_valid_email(email: str) -> bool:
+    """Check if the email format is valid."""
+    return bool(EMAIL_PATTERN.match(email or ""))
+
+
+def parse_datetime(
+    value, formats: Iterable[str] = EVENT_DATE_FORMATS
+) -> Optional[datetime]:
+    """
+    Parse a datetime using the first matching format.
+    Returns None for empty or invalid values.
+    """
+    if isinstance(value, datetime):
+        return value
+    value = str(value or "").strip()
+    if not value:
+        return None
+    for fmt in formats:
+        try:
+            return datetime.strptime(value, fmt)
+        except ValueError:
+            continue
+    return None
+
+
+def parse_amount(value) -> float:
+    """
+    Parse a non-negative monetary amount.
+    Raises ValueError with a user-facing message when invalid.
+    """
+    try:
+        amount = float(str(value).strip())
+    except (TypeError, ValueError):
+        raise ValueError("Amount must be a numeric value.")
+    if amount < 0:
+        raise ValueError("Amount must be a positive value.")
+    return amount
+
+
+def parse_yes_no(value) -> Optional[bool]:
+    """
+    Parse a yes/no flag. Returns None when the value is empty or unknown.
+    """
+    if isinstance(value, bool):
+        return value
+    value = str(value or "").strip().lower()
+    if value in YES_VALUES:
+        return True
+    if value in NO_VALUES:
+        return False
+    return None
@@ -4,8 +4,10 @@ Base class for all views in the application.
 Provides common display methods and input validation for CLI interaction.
 """
 
-import re
 from datetime import datetime
+from typing import Callable, Iterable, Optional
+
+from app.utils.validators import is_valid_email
 
 
 class BaseView:
@@ -23,10 +25,64 @@ class BaseView:
         """Helper to get user input."""
         return input(f"{prompt}: ").strip()
 
+    def ask_next_page(self) -> bool:
+        """Ask whether the next page of a listing should be displayed."""
+        answer = input("\n[Enter] Next page | [q] Stop: ").strip().lower()
+        return answer != "q"
+
+    def display_rows(
+        self,
+        title: str,
+        rows: Iterable,
+        format_row: Callable[[object], str],
+        empty_message: str = "No records found.",
+    ):
+        """
+        Print a listing row by row as it is consumed.
+        Works with lists as well as lazy iterators streamed from a
+        repository, so the first line shows before the last is fetched.
+        """
+        print(f"\n=== {title} ===")
+        shown = 0
+        for row in rows or ():
+            print(format_row(row))
+            shown += 1
+        if not shown:
+            print(empty_message)
+
+    def display_pages(
+        self,
+        title: str,
+        pages: Iterable[list],
+        format_row: Callable[[object], str],
+        total: Optional[int] = None,
+        empty_message: str = "No records found.",
+    ):
+        """
+        Print a paginated listing page by page.
+        The next page is only requested once the user asks for it.
+        """
+        print(f"\n=== {title} ===")
+        if total is not None:
+            print(f"Total: {total}")
+
+        shown = 0
+        for page in pages:
+            for row in page:
+                print(format_row(row))
+            shown += len(page)
+
+            if total is not None and shown >= total:
+                break
+            if not self.ask_next_page():
+                break
+
+        if not shown:
+            print(empty_message)
+
     def validate_email(self, email: str) -> bool:
         """Check if the email format is valid."""
-        pattern = r"^[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+$"
-        if re.match(pattern, email):
+        if is_valid_email(email):
             return True
         self.display_error("Invalid email format (ex: name@domain.com).")
         return False
@@ -7,18 +7,32 @@ from app.views.base_view import BaseView
 class ClientView(BaseView):
     """Handles client display and inputs."""
 
-    def display_clients(self, clients: list):
-        """Print the list of all clients."""
-        print("\n=== Clients List ===")
-        if not clients:
-            print("No clients found.")
-            return
-        for client in clients:
-            print(
-                f"ID: {client.id} | Name: {client.full_name} | "
-                f"Email: {client.email} | Company: {client.company_name} | "
-                f"Last Contact: {client.last_contact}"
-            )
+    def format_client(self, client) -> str:
+        """Build the display line of a single client."""
+        return (
+            f"ID: {client.id} | Name: {client.full_name} | "
+            f"Email: {client.email} | Company: {client.company_name} | "
+            f"Last Contact: {client.last_contact}"
+        )
+
+    def display_clients(self, clients):
+        """Print the list of all clients (list or streamed iterator)."""
+        self.display_rows(
+            "Clients List",
+            clients,
+            self.format_client,
+            empty_message="No clients found.",
+        )
+
+    def display_client_pages(self, pages, total: int | None = None):
+        """Print a keyset-paginated list of clients, page by page."""
+        self.display_pages(
+            "Clients List",
+            pages,
+            self.format_client,
+            total=total,
+            empty_message="No clients found.",
+        )
 
     def ask_client_details(self) -> dict:
         """Prompt user for new client information."""
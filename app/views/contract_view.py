@@ -7,19 +7,33 @@ from app.views.base_view import BaseView
 class ContractView(BaseView):
     """Handles contract display and inputs."""
 
-    def display_contracts(self, contracts: list):
-        """Print the list of all contracts."""
-        print("\n=== Contracts List ===")
-        if not contracts:
-            print("No contracts found.")
-            return
-        for contract in contracts:
-            status = "Signed" if contract.is_signed else "Not Signed"
-            print(
-                f"ID: {contract.id} | Client: {contract.client.full_name} | "
-                f"Sales Contact: {contract.sales_contact.full_name} | "
-                f"Total: {contract.total_amount} | Status: {status}"
-            )
+    def format_contract(self, contract) -> str:
+        """Build the display line of a single contract."""
+        status = "Signed" if contract.is_signed else "Not Signed"
+        return (
+            f"ID: {contract.id} | Client: {contract.client_name} | "
+            f"Sales Contact: {contract.sales_contact_name} | "
+            f"Total: {contract.total_amount} | Status: {status}"
+        )
+
+    def display_contracts(self, contracts):
+        """Print the list of all contracts (list or streamed iterator)."""
+        self.display_rows(
+            "Contracts List",
+            contracts,
+            self.format_contract,
+            empty_message="No contracts found.",
+        )
+
+    def display_contract_pages(self, pages, total: int | None = None):
+        """Print a keyset-paginated list of contracts, page by page."""
+        self.display_pages(
+            "Contracts List",
+            pages,
+            self.format_contract,
+            total=total,
+            empty_message="No contracts found.",
+        )
 
     def ask_contract_details(self) -> dict:
         """Prompt user for new contract information."""
@@ -8,19 +8,23 @@ from app.views.base_view import BaseView
 class EmployeeView(BaseView):
     """Handles employee display and inputs."""
 
-    def display_employees(self, employees: list):
-        """Print the list of all employees."""
-        print("\n=== Employees List ===")
-        if not employees:
-            print("No employees found.")
-            return
-        for emp in employees:
-            dept_name = emp.department.name if emp.department else "N/A"
-            print(
-                f"ID: {emp.id} | No: {emp.employee_number} | "
-                f"Name: {emp.full_name} | Email: {emp.email} | "
-                f"Dept: {dept_name}"
-            )
+    def format_employee(self, emp) -> str:
+        """Build the display line of a single employee."""
+        dept_name = emp.department_name or "N/A"
+        return (
+            f"ID: {emp.id} | No: {emp.employee_number} | "
+            f"Name: {emp.full_name} | Email: {emp.email} | "
+            f"Dept: {dept_name}"
+        )
+
+    def display_employees(self, employees):
+        """Print the list of all employees (list or streamed iterator)."""
+        self.display_rows(
+            "Employees List",
+            employees,
+            self.format_employee,
+            empty_message="No employees found.",
+        )
 
     def ask_employee_details(self) -> dict:
         """Prompt user for new employee information."""
@@ -7,28 +7,37 @@ from app.views.base_view import BaseView
 class EventView(BaseView):
     """Handles event display and inputs."""
 
-    def display_events(self, events: list):
-        """Print the list of all events."""
-        print("\n=== Events List ===")
-        if not events:
-            print("No events found.")
-            return
-
-        for event in events:
-            support = (
-                event.support_contact.full_name
-                if event.support_contact
-                else "TBD"
-            )
-            notes = (event.notes or "").strip()
-            short_notes = notes if len(notes) <= 60 else f"{notes[:60]}..."
-
-            print(
-                f"ID: {event.id} | Name: {event.name} | "
-                f"From: {event.event_date_start} To: {event.event_date_end} | "
-                f"Location: {event.location} | Attendees: {event.attendees} | "
-                f"Support: {support} | Notes: {short_notes}"
-            )
+    def format_event(self, event) -> str:
+        """Build the display line of a single event."""
+        support = event.support_name or "TBD"
+        notes = (event.notes or "").strip()
+        short_notes = notes if len(notes) <= 60 else f"{notes[:60]}..."
+
+        return (
+            f"ID: {event.id} | Name: {event.name} | "
+            f"From: {event.event_date_start} To: {event.event_date_end} | "
+            f"Location: {event.location} | Attendees: {event.attendees} | "
+            f"Support: {support} | Notes: {short_notes}"
+        )
+
+    def display_events(self, events):
+        """Print the list of all events (list or streamed iterator)."""
+        self.display_rows(
+            "Events List",
+            events,
+            self.format_event,
+            empty_message="No events found.",
+        )
+
+    def display_event_pages(self, pages, total: int | None = None):
+        """Print a keyset-paginated list of events, page by page."""
+        self.display_pages(
+            "Events List",
+            pages,
+            self.format_event,
+            total=total,
+            empty_message="No events found.",
+        )
 
     def ask_event_details(self) -> dict:
         """Prompt user for new event information."""
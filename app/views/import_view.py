@@ -0,0 +1,21 @@
+# app/views/import_view.py
+"""
+View for bulk import results.
+"""
+from app.views.base_view import BaseView
+
+
+class ImportView(BaseView):
+    """Handles bulk import reporting."""
+
+    def display_report(self, report, max_errors: int = 50):
+        """Print import counters and the first rejected rows."""
+        print(f"\n=== Import {report.entity}s ===")
+        print(
+            f"Processed: {report.processed} | Inserted: {report.inserted} | "
+            f"Rejected: {report.failed}"
+        )
+        for line, message in report.errors[:max_errors]:
+            print(f"Line {line}: {message}")
+        if report.failed > max_errors:
+            print(f"... {report.failed - max_errors} more error(s) not shown.")
@@ -0,0 +1,39 @@
+# app/views/profile_view.py
+"""
+View for the SQL statistics printed by `main.py --profile` and the
+startup timings printed by `main.py --startup-report`.
+"""
+from app.views.base_view import BaseView
+
+
+class ProfileView(BaseView):
+    """Handles query profiling and startup reports."""
+
+    def display_action(self, stats, max_slowest: int = 3):
+        """Print the SQL summary of one action and its slowest statements."""
+        print(
+            f"\n[profile] {stats.name}: {stats.statements} statement(s), "
+            f"{stats.total_ms:.1f} ms in DB, {stats.rows} row(s)"
+        )
+        for elapsed_ms, statement in stats.slowest[:max_slowest]:
+            print(f"  {elapsed_ms:8.1f} ms  {' '.join(statement.split())[:120]}")
+
+    def display_summary(self, actions):
+        """Print totals over every profiled action."""
+        statements = sum(a.statements for a in actions)
+        total_ms = sum(a.total_ms for a in actions)
+        print(
+            f"\n[profile] {len(actions)} action(s): {statements} statement(s), "
+            f"{total_ms:.1f} ms in DB"
+        )
+
+    def display_startup(self, report, preloader=None):
+        """Print the startup milestones and the background preload."""
+        print("\n[startup]")
+        for name, elapsed_ms, modules in report.marks:
+            print(f"  {elapsed_ms:8.1f} ms  {name} ({modules} modules loaded)")
+        if preloader is not None and preloader.elapsed_ms is not None:
+            print(
+                f"  preload took {preloader.elapsed_ms:.1f} ms in the "
+                f"background, importing: {', '.join(preloader.packages)}"
+            )
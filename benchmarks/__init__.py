@@ -0,0 +1,6 @@
+# benchmarks/__init__.py
+"""
+Performance benchmarks for the repository and controller hot paths.
+Run them with `python run_benchmarks.py`; results are written as JSON so
+that two commits can be compared with `--compare`.
+"""
@@ -0,0 +1,392 @@
+# benchmarks/cases.py
+"""
+Benchmark cases for the repository and controller hot paths.
+Every case receives a BenchContext and returns the number of rows it
+read or wrote, which the harness turns into rows per second.
+Write cases run against the seeded dataset; the runner rolls their
+changes back once a dataset size is done.
+"""
+
+import itertools
+from datetime import datetime
+from typing import Callable, List
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from app.controllers.auth_controller import AuthController
+from app.controllers.client_controller import ClientController
+from app.controllers.contract_controller import ContractController
+from app.controllers.event_controller import EventController
+from app.models.client import Client
+from app.models.contract import Contract
+from app.models.department import Department
+from app.models.employee import Employee
+from app.models.event import Event
+from app.repositories.client_repository import ClientRepository
+from app.repositories.contract_repository import ContractRepository
+from app.repositories.employee_repository import EmployeeRepository
+from app.repositories.event_repository import EventRepository
+
+# Records touched by each bulk write case
+BULK_ROWS = 1000
+
+
+class BenchContext:
+    """Repositories, controllers and users shared by the cases."""
+
+    def __init__(self, session: Session):
+        self.session = session
+        self.clients = ClientRepository(session)
+        self.contracts = ContractRepository(session)
+        self.events = EventRepository(session)
+        self.employees = EmployeeRepository(session)
+
+        auth = AuthController(self.employees)
+        self.client_ctrl = ClientController(self.clients, auth)
+        self.contract_ctrl = ContractController(self.contracts, auth)
+        self.event_ctrl = EventController(self.events, auth)
+
+        self.size = self.clients.count()
+        self.last_ids = {
+            model: session.execute(select(func.max(model.id))).scalar()
+            for model in (Client, Contract, Event)
+        }
+        self.staff = {
+            name: list(session.execute(
+                select(Employee.id)
+                .join(Department)
+                .where(Department.name == name)
+                .order_by(Employee.id)
+            ).scalars())
+            for name in ("MANAGEMENT", "SALES", "SUPPORT")
+        }
+        self.signed_contract = session.execute(
+            select(Contract).where(Contract.is_signed == True)  # noqa: E712
+            .order_by(Contract.id).limit(1)
+        ).scalar_one()
+        self._sequence = itertools.count(1)
+
+    def user(self, department: str, index: int = 0) -> dict:
+        """Return user_data for one employee of a department."""
+        return {"id": self.staff[department][index], "department": department}
+
+    def unique(self) -> int:
+        """Return a number never handed out before in this run."""
+        return next(self._sequence)
+
+    def target_id(self, model=Client) -> int:
+        """Cycle through existing primary keys of a model."""
+        return (self.unique() * 7919) % self.last_ids[model] + 1
+
+    def target_ids(self, model, count: int = BULK_ROWS) -> List[int]:
+        """Return `count` consecutive existing primary keys of a model."""
+        start = self.target_id(model)
+        return [(start + i) % self.last_ids[model] + 1 for i in range(count)]
+
+    def new_client(self) -> Client:
+        n = self.unique()
+        return Client(
+            full_name=f"Bench {n}",
+            email=f"bench{n}@bench.local",
+            phone="0600000000",
+            company_name="Bench",
+            sales_contact_id=self.staff["SALES"][0],
+        )
+
+
+class Case:
+    """A named benchmark: group, name and the function to time."""
+
+    def __init__(self, group: str, name: str, func: Callable):
+        self.group = group
+        self.name = name
+        self.func = func
+
+    @property
+    def key(self) -> str:
+        return f"{self.group}.{self.name}"
+
+
+CASES: List[Case] = []
+
+
+def case(group: str, name: str):
+    """Register the decorated function as a benchmark case."""
+    def decorator(func):
+        CASES.append(Case(group, name, func))
+        return func
+    return decorator
+
+
+def _count(result) -> int:
+    """Number of rows in a list, an iterator or a single object."""
+    if result is None:
+        return 0
+    if isinstance(result, list):
+        return len(result)
+    if hasattr(result, "__next__"):
+        return sum(1 for _ in result)
+    return 1
+
+
+# ---------------------------------------------------------------------------
+# Repositories
+# ---------------------------------------------------------------------------
+
+@case("repository", "client.get_all")
+def _client_get_all(ctx):
+    return len(ctx.clients.get_all_clients())
+
+
+@case("repository", "client.get_all_rows")
+def _client_get_all_rows(ctx):
+    return len(ctx.clients.get_all_clients(rows=True))
+
+
+@case("repository", "client.stream_rows")
+def _client_stream_rows(ctx):
+    return _count(ctx.clients.stream_all_clients(rows=True))
+
+
+@case("repository", "client.get_page_deep")
+def _client_get_page_deep(ctx):
+    return len(ctx.clients.get_page(after_id=ctx.size // 2, rows=True))
+
+
+@case("repository", "client.count")
+def _client_count(ctx):
+    ctx.clients.count()
+    return 1
+
+
+@case("repository", "client.get_by_id")
+def _client_get_by_id(ctx):
+    return _count(ctx.clients.get_by_id(ctx.target_id()))
+
+
+@case("repository", "client.get_by_email")
+def _client_get_by_email(ctx):
+    email = f"client{ctx.target_id()}@loadtest.local"
+    return _count(ctx.clients.get_by_email(email))
+
+
+@case("repository", "client.add")
+def _client_add(ctx):
+    ctx.clients.add(ctx.new_client())
+    return 1
+
+
+@case("repository", "client.update")
+def _client_update(ctx):
+    return _count(ctx.clients.update(ctx.target_id(), {"phone": "0700000000"}))
+
+
+@case("repository", "client.bulk_insert")
+def _client_bulk_insert(ctx):
+    sales_id = ctx.staff["SALES"][0]
+    rows = []
+    for _ in range(BULK_ROWS):
+        n = ctx.unique()
+        rows.append({
+            "full_name": f"Bulk {n}",
+            "email": f"bulk{n}@bench.local",
+            "phone": "0600000000",
+            "company_name": "Bulk",
+            "sales_contact_id": sales_id,
+        })
+    return ctx.clients.bulk_insert(rows)
+
+
+@case("repository", "contract.get_all_contract_list")
+def _contract_get_all_profile(ctx):
+    return len(ctx.contracts.get_all_contracts(profile="contract_list"))
+
+
+@case("repository", "contract.get_unsigned_rows_owner")
+def _contract_unsigned_owner(ctx):
+    return len(ctx.contracts.get_unsigned_contracts(
+        rows=True, owner_id=ctx.staff["SALES"][0]
+    ))
+
+
+@case("repository", "contract.get_unpaid_rows")
+def _contract_unpaid(ctx):
+    return len(ctx.contracts.get_unpaid_contracts(rows=True))
+
+
+@case("repository", "contract.bulk_update")
+def _contract_bulk_update(ctx):
+    return ctx.contracts.bulk_update(
+        ctx.target_ids(Contract), {"remaining_amount": 10}
+    )
+
+
+@case("repository", "contract.bulk_update_mappings")
+def _contract_bulk_update_mappings(ctx):
+    return ctx.contracts.bulk_update_mappings([
+        {"id": contract_id, "remaining_amount": i}
+        for i, contract_id in enumerate(ctx.target_ids(Contract))
+    ])
+
+
+@case("repository", "event.get_all_event_list")
+def _event_get_all_profile(ctx):
+    return len(ctx.events.get_all_events(profile="event_list"))
+
+
+@case("repository", "event.get_without_support_rows")
+def _event_without_support(ctx):
+    return len(ctx.events.get_events_without_support(rows=True))
+
+
+@case("repository", "event.get_my_events_rows")
+def _event_my_events(ctx):
+    return len(ctx.events.get_my_events(ctx.staff["SUPPORT"][0], rows=True))
+
+
+@case("repository", "employee.get_all_employee_list")
+def _employee_get_all(ctx):
+    return len(ctx.employees.get_all_employees(profile="employee_list"))
+
+
+# ---------------------------------------------------------------------------
+# Controllers
+# ---------------------------------------------------------------------------
+
+@case("controller", "clients.list_all")
+def _ctrl_list_clients(ctx):
+    return _count(ctx.client_ctrl.list_all_clients(
+        user_data=ctx.user("SALES")
+    ))
+
+
+@case("controller", "clients.paginate_first_page")
+def _ctrl_paginate_clients(ctx):
+    _, pages = ctx.client_ctrl.paginate_clients(user_data=ctx.user("SALES"))
+    return len(next(pages, []))
+
+
+@case("controller", "clients.create")
+def _ctrl_create_client(ctx):
+    n = ctx.unique()
+    return _count(ctx.client_ctrl.create_client(
+        user_data=ctx.user("SALES"),
+        client_data={
+            "full_name": f"Ctrl {n}",
+            "email": f"ctrl{n}@bench.local",
+            "phone": "0600000000",
+            "company_name": "Ctrl",
+        },
+    ))
+
+
+@case("controller", "clients.update")
+def _ctrl_update_client(ctx):
+    return _count(ctx.client_ctrl.update_client(
+        ctx.user("MANAGEMENT"), ctx.target_id(), {"company_name": "Updated"}
+    ))
+
+
+@case("controller", "contracts.list_all")
+def _ctrl_list_contracts(ctx):
+    return _count(ctx.contract_ctrl.list_all_contracts(
+        user_data=ctx.user("MANAGEMENT")
+    ))
+
+
+@case("controller", "contracts.list_unsigned_sales")
+def _ctrl_unsigned_contracts(ctx):
+    return _count(ctx.contract_ctrl.list_unsigned_contracts(
+        user_data=ctx.user("SALES")
+    ))
+
+
+@case("controller", "contracts.list_unpaid_management")
+def _ctrl_unpaid_contracts(ctx):
+    return _count(ctx.contract_ctrl.list_unpaid_contracts(
+        user_data=ctx.user("MANAGEMENT")
+    ))
+
+
+@case("controller", "contracts.create")
+def _ctrl_create_contract(ctx):
+    return _count(ctx.contract_ctrl.create_contract(
+        user_data=ctx.user("MANAGEMENT"),
+        contract_data={
+            "client_id": ctx.target_id(),
+            "total_amount": 1000,
+            "remaining_amount": 1000,
+        },
+    ))
+
+
+@case("controller", "contracts.update")
+def _ctrl_update_contract(ctx):
+    return _count(ctx.contract_ctrl.update_contract(
+        ctx.user("MANAGEMENT"),
+        ctx.target_id(Contract),
+        {"remaining_amount": 5},
+    ))
+
+
+@case("controller", "events.list_all")
+def _ctrl_list_events(ctx):
+    return _count(ctx.event_ctrl.list_all_events(
+        user_data=ctx.user("MANAGEMENT")
+    ))
+
+
+@case("controller", "events.list_without_support")
+def _ctrl_events_without_support(ctx):
+    return _count(ctx.event_ctrl.list_events_without_support(
+        user_data=ctx.user("MANAGEMENT")
+    ))
+
+
+@case("controller", "events.list_my_events")
+def _ctrl_my_events(ctx):
+    return _count(ctx.event_ctrl.list_my_events(
+        user_data=ctx.user("SUPPORT")
+    ))
+
+
+@case("controller", "events.create")
+def _ctrl_create_event(ctx):
+    contract = ctx.signed_contract
+    start = datetime(2026, 6, 1)
+    return _count(ctx.event_ctrl.create_event(
+        user_data={"id": contract.sales_contact_id, "department": "SALES"},
+        event_data={
+            "name": f"Bench {ctx.unique()}",
+            "event_date_start": start,
+            "event_date_end": start,
+            "location": "Lyon",
+            "attendees": 50,
+            "notes": "",
+            "client_id": contract.client_id,
+            "contract_id": contract.id,
+        },
+        contract=contract,
+    ))
+
+
+@case("controller", "events.update")
+def _ctrl_update_event(ctx):
+    return _count(ctx.event_ctrl.update_event(
+        ctx.user("MANAGEMENT"), ctx.target_id(Event), {"attendees": 75}
+    ))
+
+
+@case("controller", "events.bulk_update")
+def _ctrl_bulk_update_events(ctx):
+    return ctx.event_ctrl.bulk_update_events(
+        ctx.user("MANAGEMENT"), ctx.target_ids(Event), {"notes": "bench"}
+    ) or 0
+
+
+def select_cases(patterns: List[str] | None = None) -> List[Case]:
+    """Return the cases whose key contains any of the patterns."""
+    if not patterns:
+        return list(CASES)
+    return [c for c in CASES if any(p in c.key for p in patterns)]
@@ -0,0 +1,49 @@
+# benchmarks/dataset.py
+"""
+Synthetic datasets used by the benchmark suite.
+A dataset of size N holds N clients generated by DataGenerator with its
+default profile and a fixed seed, so every run benchmarks the same data.
+"""
+
+from sqlalchemy import Engine, func, select
+from sqlalchemy.exc import SQLAlchemyError
+
+from app.models import Base
+from app.models.client import Client
+from app.utils.data_generator import DataGenerator, DatasetProfile
+
+# Named dataset sizes (number of clients)
+SIZES = {"1k": 1_000, "100k": 100_000, "1m": 1_000_000}
+
+
+def parse_size(value: str) -> int:
+    """Resolve a named size ("100k") or a plain integer ("5000")."""
+    key = value.lower()
+    if key in SIZES:
+        return SIZES[key]
+    try:
+        size = int(key)
+    except ValueError:
+        raise ValueError(
+            f"Unknown dataset size '{value}' "
+            f"(expected one of: {', '.join(SIZES)} or an integer)"
+        ) from None
+    if size < 1:
+        raise ValueError("Dataset size must be positive")
+    return size
+
+
+def seed_dataset(engine: Engine, size: int) -> None:
+    """(Re)create the schema and generate `size` clients."""
+    Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+    DataGenerator(engine, DatasetProfile(clients=size)).run()
+
+
+def dataset_size(engine: Engine) -> int:
+    """Return the number of clients already loaded, 0 without a schema."""
+    try:
+        with engine.connect() as conn:
+            return conn.execute(select(func.count(Client.id))).scalar() or 0
+    except SQLAlchemyError:
+        return 0
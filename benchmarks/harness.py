@@ -0,0 +1,73 @@
+# benchmarks/harness.py
+"""
+Timing harness for the benchmark suite.
+- Each case is timed over several repetitions after a warm-up run and
+  summarised as p50/p95 latency and rows per second.
+- One extra run is traced separately to collect its SQL statistics
+  (QueryProfiler) and peak Python memory, so tracing never skews the
+  latency figures.
+"""
+
+import contextlib
+import io
+import math
+import time
+import tracemalloc
+from typing import Callable, Dict, List
+
+from sqlalchemy import Engine
+
+from app.utils.instrumentation import QueryProfiler
+
+
+def percentile(samples: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of the samples (fraction in 0..1)."""
+    ordered = sorted(samples)
+    rank = max(1, math.ceil(fraction * len(ordered)))
+    return ordered[rank - 1]
+
+
+def _quiet(func: Callable[[], int]) -> int:
+    """Run func with the controllers' console messages silenced."""
+    with contextlib.redirect_stdout(io.StringIO()):
+        return func()
+
+
+def measure(
+    engine: Engine, func: Callable[[], int], repeat: int = 5, warmup: int = 1
+) -> Dict[str, float]:
+    """
+    Time func, which returns the number of rows it produced or touched.
+    Returns latency percentiles in milliseconds, throughput, the SQL
+    statement count, DB time and peak traced memory of a single call.
+    """
+    for _ in range(warmup):
+        _quiet(func)
+
+    timings = []
+    rows = 0
+    for _ in range(repeat):
+        started = time.perf_counter()
+        rows = _quiet(func)
+        timings.append(time.perf_counter() - started)
+
+    tracemalloc.start()
+    try:
+        with QueryProfiler(engine, keep_slowest=0) as profiler:
+            with profiler.action("benchmark") as sql:
+                _quiet(func)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    p50 = percentile(timings, 0.5)
+    return {
+        "p50_ms": round(p50 * 1000, 3),
+        "p95_ms": round(percentile(timings, 0.95) * 1000, 3),
+        "mean_ms": round(sum(timings) / len(timings) * 1000, 3),
+        "rows": rows,
+        "rows_per_sec": round(rows / p50, 1) if p50 > 0 else None,
+        "peak_memory_kb": round(peak / 1024, 1),
+        "queries": sql.statements,
+        "db_ms": round(sql.total_ms, 3),
+    }
@@ -6,8 +6,19 @@ from dotenv import load_dotenv
 load_dotenv()
 
 
+# Database backends selectable with DB_BACKEND
+SUPPORTED_BACKENDS = ("mysql", "sqlite")
+
+# DB_SQLITE_PATH value selecting a private in-memory database
+SQLITE_MEMORY = ":memory:"
+
+
 class Config:
     """Configuration loader for environment variables."""
+    # "mysql" (default) or "sqlite" (file or in-memory, no server needed)
+    DB_BACKEND = os.getenv("DB_BACKEND", "mysql").lower()
+    DB_SQLITE_PATH = os.getenv("DB_SQLITE_PATH", "epic_events.db")
+
     DB_USER = os.getenv("DB_USER")
     DB_PASSWORD = os.getenv("DB_PASSWORD")
     DB_HOST = os.getenv("DB_HOST")
@@ -15,11 +26,93 @@ class Config:
     DB_NAME = os.getenv("DB_NAME")
     SECRET_KEY = os.getenv("SECRET_KEY")
     SENTRY_DSN = os.getenv("SENTRY_DSN")
+    SENTRY_ENVIRONMENT = os.getenv("SENTRY_ENVIRONMENT", "development")
+    # Share of read actions traced (see config/sentry.py)
+    SENTRY_TRACES_SAMPLE_RATE = float(
+        os.getenv("SENTRY_TRACES_SAMPLE_RATE", "0.01")
+    )
+    # Share of write and audit actions traced
+    SENTRY_WRITE_TRACES_SAMPLE_RATE = float(
+        os.getenv("SENTRY_WRITE_TRACES_SAMPLE_RATE", "0.1")
+    )
+    # Share of traced actions also profiled (0 disables profiling)
+    SENTRY_PROFILES_SAMPLE_RATE = float(
+        os.getenv("SENTRY_PROFILES_SAMPLE_RATE", "0")
+    )
+
+    # Audit pipeline (see app/utils/audit.py)
+    AUDIT_LOG_PATH = os.getenv("AUDIT_LOG_PATH", "logs/audit.jsonl")
+    AUDIT_TO_SENTRY = os.getenv("AUDIT_TO_SENTRY", "true").lower() in (
+        "1", "true", "yes"
+    )
+    AUDIT_BATCH_SIZE = int(os.getenv("AUDIT_BATCH_SIZE", "100"))
+    # Seconds a record may wait for its batch to fill
+    AUDIT_FLUSH_INTERVAL = float(os.getenv("AUDIT_FLUSH_INTERVAL", "1.0"))
+    # Records held in memory before new ones are dropped
+    AUDIT_QUEUE_SIZE = int(os.getenv("AUDIT_QUEUE_SIZE", "10000"))
+
+    # Password hashing (see app/utils/auth.py)
+    # Argon2 passes, memory in KiB and lanes; stored hashes created with
+    # other values are rehashed at the next successful login
+    ARGON2_TIME_COST = int(os.getenv("ARGON2_TIME_COST", "3"))
+    ARGON2_MEMORY_COST = int(os.getenv("ARGON2_MEMORY_COST", "65536"))
+    ARGON2_PARALLELISM = int(os.getenv("ARGON2_PARALLELISM", "4"))
+    # Concurrent hash/verify jobs, and jobs allowed to wait for a worker
+    AUTH_WORKERS = int(os.getenv("AUTH_WORKERS", "2"))
+    AUTH_QUEUE_SIZE = int(os.getenv("AUTH_QUEUE_SIZE", "32"))
+
+    # Connection pool and engine tuning (see config/database.py)
+    DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "5"))
+    DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+    DB_POOL_TIMEOUT = int(os.getenv("DB_POOL_TIMEOUT", "30"))
+    # Recycle before MySQL's wait_timeout closes idle connections
+    DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+    DB_POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING", "true").lower() in (
+        "1", "true", "yes"
+    )
+    DB_CONNECT_TIMEOUT = int(os.getenv("DB_CONNECT_TIMEOUT", "10"))
+    # Compiled statement cache size (0 disables caching)
+    DB_STATEMENT_CACHE_SIZE = int(os.getenv("DB_STATEMENT_CACHE_SIZE", "500"))
+    DB_POOL_CHECKOUT_WARN_MS = float(
+        os.getenv("DB_POOL_CHECKOUT_WARN_MS", "100")
+    )
+    # Statements slower than this (ms) become Sentry spans
+    DB_SLOW_QUERY_MS = float(os.getenv("DB_SLOW_QUERY_MS", "200"))
+    # asyncio driver used by the async repositories (pip install aiomysql)
+    DB_ASYNC_DRIVER = os.getenv("DB_ASYNC_DRIVER", "aiomysql")
 
     @classmethod
-    def get_db_url(cls):
-        """Return formatted SQLAlchemy database URL."""
+    def _backend(cls, backend=None):
+        backend = (backend or cls.DB_BACKEND).lower()
+        if backend not in SUPPORTED_BACKENDS:
+            raise ValueError(
+                f"Unsupported DB_BACKEND '{backend}' "
+                f"(expected one of: {', '.join(SUPPORTED_BACKENDS)})"
+            )
+        return backend
+
+    @classmethod
+    def _sqlite_url(cls, driver):
+        if cls.DB_SQLITE_PATH == SQLITE_MEMORY:
+            return f"{driver}://"
+        return f"{driver}:///{cls.DB_SQLITE_PATH}"
+
+    @classmethod
+    def get_db_url(cls, backend=None):
+        """Return formatted SQLAlchemy database URL for the backend."""
+        if cls._backend(backend) == "sqlite":
+            return cls._sqlite_url("sqlite")
         return (
             f"mysql+mysqlconnector://{cls.DB_USER}:{cls.DB_PASSWORD}@"
             f"{cls.DB_HOST}:{cls.DB_PORT}/{cls.DB_NAME}"
-        )
\ No newline at end of file
+        )
+
+    @classmethod
+    def get_async_db_url(cls, backend=None):
+        """Return the SQLAlchemy URL used by the asyncio engine."""
+        if cls._backend(backend) == "sqlite":
+            return cls._sqlite_url("sqlite+aiosqlite")
+        return (
+            f"mysql+{cls.DB_ASYNC_DRIVER}://{cls.DB_USER}:{cls.DB_PASSWORD}@"
+            f"{cls.DB_HOST}:{cls.DB_PORT}/{cls.DB_NAME}"
+        )
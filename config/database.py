@@ -0,0 +1,241 @@
+# config/database.py
+"""
+Central SQLAlchemy engine factory.
+- Builds the engine once per process from Config (pool size, overflow,
+  pre-ping, recycle, connect timeout and compiled statement cache).
+- Times every pool checkout and logs slow ones, so reconnect storms or
+  pool exhaustion show up in the logs (and in Sentry breadcrumbs).
+- Provides the session factory used by the entry points.
+- Builds the asyncio engine and session factory used by the async
+  repositories, with the same pool settings.
+- Configures SQLite (file or in-memory) as a first-class backend:
+  enforced foreign keys, working SAVEPOINTs and a shared in-memory DB.
+"""
+
+import logging
+import threading
+import time
+from typing import Optional
+
+from sqlalchemy import Engine, create_engine, event, make_url
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from config.config import Config
+
+logger = logging.getLogger(__name__)
+
+_engine: Optional[Engine] = None
+_engine_lock = threading.Lock()
+
+
+class CheckoutTimer:
+    """
+    Records how long each connection checkout from an engine's pool takes.
+    Checkouts slower than `warn_ms` are logged as warnings. The timer wraps
+    the engine's public `raw_connection()`, which every `engine.connect()`
+    goes through, so the stock QueuePool is used unchanged.
+    """
+
+    def __init__(self, warn_ms: float = 100.0):
+        self.warn_ms = warn_ms
+        self.checkout_count = 0
+        self.checkout_total_ms = 0.0
+        self.checkout_max_ms = 0.0
+        self._lock = threading.Lock()
+
+    def attach(self, engine: Engine) -> "CheckoutTimer":
+        """Time every checkout of the given engine from now on."""
+        raw_connection = engine.raw_connection
+
+        def timed_raw_connection():
+            start = time.perf_counter()
+            try:
+                return raw_connection()
+            finally:
+                self.record((time.perf_counter() - start) * 1000, engine)
+
+        engine.raw_connection = timed_raw_connection
+        engine.checkout_timer = self
+        return self
+
+    def record(self, elapsed_ms: float, engine: Engine) -> None:
+        """Add one checkout to the statistics and log it."""
+        with self._lock:
+            self.checkout_count += 1
+            self.checkout_total_ms += elapsed_ms
+            self.checkout_max_ms = max(self.checkout_max_ms, elapsed_ms)
+        if elapsed_ms >= self.warn_ms:
+            logger.warning(
+                "Slow DB pool checkout: %.1f ms (%s)",
+                elapsed_ms, engine.pool.status(),
+            )
+        else:
+            logger.debug("DB pool checkout: %.2f ms", elapsed_ms)
+
+    def checkout_stats(self) -> dict:
+        """Return aggregated checkout latency statistics."""
+        with self._lock:
+            count = self.checkout_count
+            return {
+                "checkouts": count,
+                "avg_ms": self.checkout_total_ms / count if count else 0.0,
+                "max_ms": self.checkout_max_ms,
+            }
+
+
+def is_sqlite_memory(url: str) -> bool:
+    """Return True for an in-memory SQLite URL."""
+    return make_url(url).database in (None, "", ":memory:")
+
+
+def _sqlite_options(url: str) -> dict:
+    """
+    Engine options for SQLite: only the busy timeout applies, and an
+    in-memory database lives on one shared connection (StaticPool) so
+    every session sees the same schema and data.
+    """
+    options = {
+        "connect_args": {
+            "timeout": Config.DB_CONNECT_TIMEOUT,
+            "check_same_thread": False,
+        },
+    }
+    if is_sqlite_memory(url):
+        options["poolclass"] = StaticPool
+    return options
+
+
+def _configure_sqlite(engine: Engine, url: str) -> None:
+    """
+    Align SQLite with the MySQL behavior the application relies on.
+    - Foreign keys are enforced (off by default in SQLite).
+    - SQLAlchemy emits BEGIN itself; the driver's implicit transaction
+      handling otherwise breaks SAVEPOINTs.
+    - File databases use WAL so readers do not block the writer.
+    """
+    use_wal = not is_sqlite_memory(url)
+
+    @event.listens_for(engine, "connect")
+    def _on_connect(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA foreign_keys=ON")
+        if use_wal:
+            cursor.execute("PRAGMA journal_mode=WAL")
+            cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.close()
+
+    @event.listens_for(engine, "begin")
+    def _on_begin(connection):
+        connection.exec_driver_sql("BEGIN")
+
+
+def create_db_engine(url: Optional[str] = None, **overrides) -> Engine:
+    """
+    Create a configured engine for the given URL (Config URL by default).
+    Keyword overrides are passed to create_engine as-is.
+    """
+    url = url or Config.get_db_url()
+    options = {
+        "pool_pre_ping": Config.DB_POOL_PRE_PING,
+        "query_cache_size": Config.DB_STATEMENT_CACHE_SIZE,
+    }
+
+    if url.startswith("sqlite"):
+        options.update(_sqlite_options(url))
+    else:
+        options.update(
+            pool_size=Config.DB_POOL_SIZE,
+            max_overflow=Config.DB_MAX_OVERFLOW,
+            pool_timeout=Config.DB_POOL_TIMEOUT,
+            pool_recycle=Config.DB_POOL_RECYCLE,
+            connect_args={"connection_timeout": Config.DB_CONNECT_TIMEOUT},
+        )
+
+    options.update(overrides)
+    engine = create_engine(url, **options)
+    CheckoutTimer(Config.DB_POOL_CHECKOUT_WARN_MS).attach(engine)
+    if url.startswith("sqlite"):
+        _configure_sqlite(engine, url)
+    return engine
+
+
+def create_async_db_engine(
+    url: Optional[str] = None, **overrides
+) -> AsyncEngine:
+    """
+    Create a configured asyncio engine (Config async URL by default).
+    Keyword overrides are passed to create_async_engine as-is.
+    """
+    url = url or Config.get_async_db_url()
+    options = {
+        "pool_pre_ping": Config.DB_POOL_PRE_PING,
+        "query_cache_size": Config.DB_STATEMENT_CACHE_SIZE,
+    }
+
+    if url.startswith("sqlite"):
+        options.update(_sqlite_options(url))
+    else:
+        options.update(
+            pool_size=Config.DB_POOL_SIZE,
+            max_overflow=Config.DB_MAX_OVERFLOW,
+            pool_timeout=Config.DB_POOL_TIMEOUT,
+            pool_recycle=Config.DB_POOL_RECYCLE,
+            connect_args={"connect_timeout": Config.DB_CONNECT_TIMEOUT},
+        )
+
+    options.update(overrides)
+    engine = create_async_engine(url, **options)
+    if url.startswith("sqlite"):
+        _configure_sqlite(engine.sync_engine, url)
+    return engine
+
+
+def get_async_session_factory(engine: AsyncEngine) -> async_sessionmaker:
+    """
+    Return an AsyncSession factory bound to the given engine.
+    Objects are never expired on commit: async sessions cannot lazy-load.
+    """
+    return async_sessionmaker(bind=engine, expire_on_commit=False)
+
+
+def get_engine() -> Engine:
+    """
+    Return the process-wide engine, creating it on first use.
+    Every entry point shares this engine and its connection pool.
+    """
+    global _engine
+    if _engine is None:
+        with _engine_lock:
+            if _engine is None:
+                _engine = create_db_engine()
+    return _engine
+
+
+def get_session_factory(
+    engine: Optional[Engine] = None, expire_on_commit: bool = True
+) -> sessionmaker:
+    """
+    Return a session factory bound to the shared engine.
+    Long-lived interactive sessions keep expire_on_commit so every action
+    sees the writes of other users. Short-lived batch sessions (imports)
+    may disable it so written objects stay usable without a reload.
+    """
+    return sessionmaker(
+        bind=engine or get_engine(), expire_on_commit=expire_on_commit
+    )
+
+
+def dispose_engine() -> None:
+    """Close all pooled connections and forget the shared engine."""
+    global _engine
+    with _engine_lock:
+        if _engine is not None:
+            _engine.dispose()
+            _engine = None
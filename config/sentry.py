@@ -0,0 +1,49 @@
+# config/sentry.py
+"""
+Sentry initialisation with sampling controls.
+- Sentry is not initialised at all when SENTRY_DSN is empty, so no
+  integration hooks are installed.
+- Errors are always reported; performance tracing is sampled per
+  transaction: write and audit actions (op "cli.write" / "cli.audit")
+  at SENTRY_WRITE_TRACES_SAMPLE_RATE, everything else at
+  SENTRY_TRACES_SAMPLE_RATE. Profiling is opt-in.
+"""
+
+import sentry_sdk
+
+from config.config import Config
+
+# Transaction ops sampled at the write rate
+WRITE_OPS = ("cli.write", "cli.audit")
+
+
+def traces_sampler(sampling_context: dict) -> float:
+    """Return the sample rate of a transaction from its op."""
+    parent_sampled = sampling_context.get("parent_sampled")
+    if parent_sampled is not None:
+        # Keep distributed traces whole
+        return float(parent_sampled)
+
+    op = (sampling_context.get("transaction_context") or {}).get("op") or ""
+    if op in WRITE_OPS:
+        return Config.SENTRY_WRITE_TRACES_SAMPLE_RATE
+    return Config.SENTRY_TRACES_SAMPLE_RATE
+
+
+def init_sentry(dsn=None) -> bool:
+    """
+    Initialise Sentry from Config. Returns False (and does nothing)
+    when no DSN is configured.
+    """
+    dsn = dsn or Config.SENTRY_DSN
+    if not dsn:
+        return False
+
+    sentry_sdk.init(
+        dsn=dsn,
+        environment=Config.SENTRY_ENVIRONMENT,
+        traces_sampler=traces_sampler,
+        # Share of sampled transactions that are also profiled
+        profiles_sample_rate=Config.SENTRY_PROFILES_SAMPLE_RATE,
+    )
+    return True
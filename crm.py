@@ -0,0 +1,329 @@
+# crm.py
+"""
+Non-interactive command line for scripts and batch jobs.
+
+Usage:
+    python crm.py login --email alice@epic.com
+    python crm.py clients list --format jsonl
+    python crm.py contracts list --unsigned --format csv
+    python crm.py contracts update 42 --signed
+    python crm.py events assign --support 7 --ids-from ids.txt
+    python crm.py logout
+
+Commands reuse the controllers (and their permission checks) of the
+interactive application and the session saved by `login` (or by
+main.py). Listings stream rows to stdout as they are read; update
+commands accept any number of ids, from the command line and/or a file
+("-" for stdin), and apply them in chunks with one UPDATE per chunk.
+Controller messages go to stderr so stdout stays machine-readable.
+
+Exit codes: 0 success, 1 not logged in, access denied or failure.
+"""
+
+import argparse
+import json
+import os
+import sys
+from contextlib import redirect_stdout
+from getpass import getpass
+from itertools import chain
+
+from app.controllers.auth_controller import AuthController
+from app.utils.lazy import lazy_import
+from app.utils.record_reader import chunked, read_ids
+from app.utils.record_writer import WRITE_FORMATS, write_records
+from app.views.auth_view import AuthView
+from main import build_app
+
+sentry_sdk = lazy_import("sentry_sdk")
+
+# Ids sent per bulk UPDATE
+DEFAULT_ID_CHUNK = 1000
+
+OUTPUT_FORMATS = ("table",) + WRITE_FORMATS
+
+
+def _add_format(parser):
+    parser.add_argument(
+        "--format",
+        choices=OUTPUT_FORMATS,
+        default="table",
+        help="Output format (default: table).",
+    )
+
+
+def _add_ids(parser):
+    parser.add_argument("ids", nargs="*", type=int, help="Record ids.")
+    parser.add_argument(
+        "--ids-from",
+        metavar="FILE",
+        help='File with one id per line ("-" reads stdin).',
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=DEFAULT_ID_CHUNK,
+        help="Ids updated per statement.",
+    )
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="crm", description="Epic Events CRM batch commands."
+    )
+    entities = parser.add_subparsers(dest="entity", required=True)
+
+    login = entities.add_parser(
+        "login",
+        help="Save a session for the next commands.",
+        description="Password is read from CRM_PASSWORD or prompted.",
+    )
+    login.add_argument("--email", help="Employee email (prompted if absent).")
+    login.set_defaults(handler=login_command)
+
+    logout = entities.add_parser("logout", help="Delete the saved session.")
+    logout.set_defaults(handler=logout_command)
+
+    clients = entities.add_parser("clients").add_subparsers(
+        dest="action", required=True
+    )
+    clients_list = clients.add_parser("list", help="List all clients.")
+    _add_format(clients_list)
+    clients_list.set_defaults(handler=list_command)
+
+    contracts = entities.add_parser("contracts").add_subparsers(
+        dest="action", required=True
+    )
+    contracts_list = contracts.add_parser("list", help="List contracts.")
+    _add_format(contracts_list)
+    contract_filter = contracts_list.add_mutually_exclusive_group()
+    contract_filter.add_argument(
+        "--unsigned", dest="only", action="store_const", const="unsigned"
+    )
+    contract_filter.add_argument(
+        "--unpaid", dest="only", action="store_const", const="unpaid"
+    )
+    contracts_list.set_defaults(handler=list_command)
+
+    contracts_update = contracts.add_parser(
+        "update", help="Apply the same changes to many contracts."
+    )
+    _add_ids(contracts_update)
+    signature = contracts_update.add_mutually_exclusive_group()
+    signature.add_argument(
+        "--signed", dest="is_signed", action="store_const", const=True
+    )
+    signature.add_argument(
+        "--unsigned", dest="is_signed", action="store_const", const=False
+    )
+    contracts_update.add_argument("--total-amount", type=float)
+    contracts_update.add_argument("--remaining-amount", type=float)
+    contracts_update.set_defaults(handler=update_contracts_command)
+
+    events = entities.add_parser("events").add_subparsers(
+        dest="action", required=True
+    )
+    events_list = events.add_parser("list", help="List events.")
+    _add_format(events_list)
+    event_filter = events_list.add_mutually_exclusive_group()
+    event_filter.add_argument(
+        "--without-support", dest="only", action="store_const",
+        const="without_support",
+    )
+    event_filter.add_argument(
+        "--mine", dest="only", action="store_const", const="mine"
+    )
+    events_list.set_defaults(handler=list_command)
+
+    events_assign = events.add_parser(
+        "assign", help="Assign a support contact to many events."
+    )
+    _add_ids(events_assign)
+    events_assign.add_argument(
+        "--support", type=int, required=True, help="Support employee id."
+    )
+    events_assign.set_defaults(handler=assign_events_command)
+
+    employees = entities.add_parser("employees").add_subparsers(
+        dest="action", required=True
+    )
+    employees_list = employees.add_parser("list", help="List employees.")
+    _add_format(employees_list)
+    employees_list.set_defaults(handler=list_command)
+
+    args = parser.parse_args(argv)
+    if getattr(args, "chunk_size", 1) < 1:
+        parser.error("--chunk-size must be at least 1")
+    return args
+
+
+def _listing(app, args, user_data):
+    """Return (rows, table display) for a list command."""
+    only = getattr(args, "only", None)
+    if args.entity == "clients":
+        rows = app.client_ctrl.list_all_clients(
+            user_data=user_data, stream=True
+        )
+        return rows, app.client_view.display_clients
+    if args.entity == "contracts":
+        method = {
+            None: app.contract_ctrl.list_all_contracts,
+            "unsigned": app.contract_ctrl.list_unsigned_contracts,
+            "unpaid": app.contract_ctrl.list_unpaid_contracts,
+        }[only]
+        return (
+            method(user_data=user_data, stream=True),
+            app.contract_view.display_contracts,
+        )
+    if args.entity == "events":
+        method = {
+            None: app.event_ctrl.list_all_events,
+            "without_support": app.event_ctrl.list_events_without_support,
+            "mine": app.event_ctrl.list_my_events,
+        }[only]
+        return (
+            method(user_data=user_data, stream=True),
+            app.event_view.display_events,
+        )
+    rows = app.emp_ctrl.list_all_employees(user_data=user_data, stream=True)
+    return rows, app.emp_view.display_employees
+
+
+def list_command(app, args, user_data) -> int:
+    """Stream a listing to stdout."""
+    rows, display = _listing(app, args, user_data)
+    if rows is None:
+        print("Access denied.", file=sys.stderr)
+        return 1
+    if args.format == "table":
+        display(rows)
+    else:
+        write_records(rows, args.format, sys.stdout)
+    return 0
+
+
+def _requested_ids(args):
+    """Ids from the command line followed by the --ids-from file."""
+    if not args.ids_from:
+        return iter(args.ids)
+    if args.ids_from == "-":
+        return chain(args.ids, read_ids(sys.stdin))
+
+    def from_file():
+        with open(args.ids_from, "r", encoding="utf-8") as f:
+            yield from read_ids(f)
+
+    return chain(args.ids, from_file())
+
+
+def _bulk(args, update_chunk) -> int:
+    """
+    Feed the requested ids to `update_chunk` chunk by chunk and print a
+    JSON summary. `update_chunk` returns the updated count, or None when
+    access is denied.
+    """
+    requested = updated = 0
+    for chunk in chunked(_requested_ids(args), args.chunk_size):
+        # Controllers report progress on stdout: keep it for the summary
+        with redirect_stdout(sys.stderr):
+            count = update_chunk(chunk)
+        if count is None:
+            return 1
+        requested += len(chunk)
+        updated += count
+
+    print(json.dumps({
+        "command": f"{args.entity} {args.action}",
+        "requested": requested,
+        "updated": updated,
+    }))
+    return 0
+
+
+def update_contracts_command(app, args, user_data) -> int:
+    """Apply the same field changes to every requested contract."""
+    updates = {
+        field: value
+        for field, value in (
+            ("is_signed", args.is_signed),
+            ("total_amount", args.total_amount),
+            ("remaining_amount", args.remaining_amount),
+        )
+        if value is not None
+    }
+    if not updates:
+        print(
+            "Nothing to update: use --signed, --unsigned, --total-amount "
+            "or --remaining-amount.",
+            file=sys.stderr,
+        )
+        return 1
+    return _bulk(args, lambda chunk: app.contract_ctrl.bulk_update_contracts(
+        user_data=user_data, contract_ids=chunk, updates=updates
+    ))
+
+
+def assign_events_command(app, args, user_data) -> int:
+    """Set the support contact of every requested event."""
+    updates = {"support_contact_id": args.support}
+    return _bulk(args, lambda chunk: app.event_ctrl.bulk_update_events(
+        user_data=user_data, event_ids=chunk, updates=updates
+    ))
+
+
+def login_command(app, args, auth_ctrl) -> int:
+    """Authenticate and save the session token."""
+    auth_view = AuthView()
+    email = args.email or auth_view.ask_input("Email")
+    password = os.getenv("CRM_PASSWORD") or getpass("Password: ")
+    if not auth_ctrl.login(email, password):
+        auth_view.display_login_failure()
+        return 1
+    auth_view.display_login_success()
+    return 0
+
+
+def logout_command(app, args, auth_ctrl) -> int:
+    """Delete the saved session token."""
+    auth_ctrl.logout()
+    return 0
+
+
+def main(argv=None) -> int:
+    """Run one batch command and return its exit code."""
+    args = parse_args(argv)
+    auth_ctrl = AuthController(None)
+    app = build_app(auth_ctrl)
+    try:
+        if args.entity in ("login", "logout"):
+            return args.handler(app, args, auth_ctrl)
+
+        user_data = auth_ctrl.get_logged_in_user()
+        if not user_data:
+            print(
+                "Not logged in: run `python crm.py login` first.",
+                file=sys.stderr,
+            )
+            return 1
+        return args.handler(app, args, user_data)
+    except BrokenPipeError:
+        # The consumer (e.g. `head`) stopped reading: silence the final
+        # flush of stdout at interpreter exit
+        devnull = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(devnull, sys.stdout.fileno())
+        return 1
+    except (OSError, ValueError) as e:
+        # Unreadable id file, malformed id, ...
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    except Exception as e:
+        sentry_sdk.capture_exception(e)
+        print(f"A fatal error occurred: {e}", file=sys.stderr)
+        return 1
+    finally:
+        app.profiler.detach()
+        app.session.close()
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,140 @@
+# generate_data.py
+"""
+Synthetic data command for load testing.
+Appends generated employees, clients, contracts and events to the
+configured database (DB_BACKEND), creating missing tables first.
+
+Usage:
+    python generate_data.py --clients 100000
+    python generate_data.py --clients 10000000 --seed 7 --batch-size 20000
+    python generate_data.py --clients 5000 --contracts-per-client 1.5 --reset
+"""
+
+import argparse
+import time
+
+from app.models import Base
+from app.utils.data_generator import (
+    DEFAULT_BATCH_SIZE,
+    DEFAULT_PASSWORD,
+    DEFAULT_SEED,
+    DataGenerator,
+    DatasetProfile,
+)
+from config.database import get_engine
+
+
+def parse_args(argv=None):
+    defaults = DatasetProfile()
+    parser = argparse.ArgumentParser(
+        description="Bulk-load deterministic synthetic CRM data."
+    )
+    parser.add_argument("--clients", type=int, default=defaults.clients)
+    parser.add_argument("--sales", type=int, default=defaults.sales)
+    parser.add_argument("--support", type=int, default=defaults.support)
+    parser.add_argument(
+        "--management", type=int, default=defaults.management
+    )
+    parser.add_argument(
+        "--contracts-per-client",
+        type=float,
+        default=defaults.contracts_per_client,
+    )
+    parser.add_argument(
+        "--signed-ratio", type=float, default=defaults.signed_ratio
+    )
+    parser.add_argument(
+        "--paid-ratio",
+        type=float,
+        default=defaults.paid_ratio,
+        help="Share of signed contracts fully paid.",
+    )
+    parser.add_argument(
+        "--partial-ratio",
+        type=float,
+        default=defaults.partial_ratio,
+        help="Share of signed contracts partially paid.",
+    )
+    parser.add_argument(
+        "--event-ratio",
+        type=float,
+        default=defaults.event_ratio,
+        help="Share of signed contracts with an event.",
+    )
+    parser.add_argument(
+        "--unassigned-ratio",
+        type=float,
+        default=defaults.unassigned_ratio,
+        help="Share of events without a support contact.",
+    )
+    parser.add_argument(
+        "--skew",
+        type=float,
+        default=defaults.skew,
+        help="Zipf exponent of clients per sales person (0 = even).",
+    )
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=DEFAULT_BATCH_SIZE,
+        help="Clients generated and committed per batch.",
+    )
+    parser.add_argument(
+        "--password",
+        default=DEFAULT_PASSWORD,
+        help="Password of every generated employee.",
+    )
+    parser.add_argument(
+        "--reset",
+        action="store_true",
+        help="Drop and recreate all tables first (destroys existing data).",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    profile = DatasetProfile(
+        clients=args.clients,
+        sales=args.sales,
+        support=args.support,
+        management=args.management,
+        contracts_per_client=args.contracts_per_client,
+        signed_ratio=args.signed_ratio,
+        paid_ratio=args.paid_ratio,
+        partial_ratio=args.partial_ratio,
+        event_ratio=args.event_ratio,
+        unassigned_ratio=args.unassigned_ratio,
+        skew=args.skew,
+    )
+    engine = get_engine()
+    if args.reset:
+        Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+
+    started = time.perf_counter()
+
+    def report(counts):
+        print(f"  {counts['client']:>12,} clients  "
+              f"{counts['contract']:>12,} contracts  "
+              f"{counts['event']:>12,} events")
+
+    counts = DataGenerator(
+        engine,
+        profile,
+        seed=args.seed,
+        batch_size=args.batch_size,
+        password=args.password,
+        progress=report,
+    ).run()
+
+    elapsed = time.perf_counter() - started
+    total = sum(counts.values())
+    print(f"Generated {total:,} rows in {elapsed:.1f}s "
+          f"({total / elapsed:,.0f} rows/s).")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
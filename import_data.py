@@ -0,0 +1,92 @@
+# import_data.py
+"""
+Bulk import command for clients, contracts and events.
+
+Usage:
+    python import_data.py clients clients.csv
+    python import_data.py events events.jsonl --chunk-size 5000
+"""
+
+import argparse
+
+from config.database import get_session_factory
+from config.sentry import init_sentry
+from app.controllers.auth_controller import AuthController
+from app.controllers.import_controller import (
+    DEFAULT_IMPORT_CHUNK,
+    ImportController,
+)
+from app.repositories.client_repository import ClientRepository
+from app.repositories.contract_repository import ContractRepository
+from app.repositories.employee_repository import EmployeeRepository
+from app.repositories.event_repository import EventRepository
+from app.utils.record_reader import SUPPORTED_FORMATS, read_records
+from app.views.auth_view import AuthView
+from app.views.import_view import ImportView
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Bulk import CRM records from CSV or JSONL."
+    )
+    parser.add_argument("entity", choices=("clients", "contracts", "events"))
+    parser.add_argument("path", help="CSV or JSONL file to import.")
+    parser.add_argument(
+        "--format",
+        choices=SUPPORTED_FORMATS,
+        help="Record format (default: inferred from the file extension).",
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=DEFAULT_IMPORT_CHUNK,
+        help="Rows validated and inserted per round-trip.",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    """Authenticate, then stream the file through the import controller."""
+    args = parse_args(argv)
+    init_sentry()
+    # A one-shot batch session: nothing else reads through it meanwhile
+    session = get_session_factory(expire_on_commit=False)()
+
+    auth_ctrl = AuthController(EmployeeRepository(session))
+    import_ctrl = ImportController(
+        ClientRepository(session),
+        ContractRepository(session),
+        EventRepository(session),
+        auth_ctrl,
+    )
+    auth_view = AuthView()
+
+    user_data = auth_ctrl.get_logged_in_user()
+    if not user_data:
+        email, password = auth_view.ask_login_details()
+        user_data = auth_ctrl.login(email, password)
+        if not user_data:
+            auth_view.display_login_failure()
+            return 1
+
+    importer = {
+        "clients": import_ctrl.import_clients,
+        "contracts": import_ctrl.import_contracts,
+        "events": import_ctrl.import_events,
+    }[args.entity]
+
+    report = importer(
+        user_data=user_data,
+        records=read_records(args.path, args.format),
+        chunk_size=args.chunk_size,
+    )
+    session.close()
+    if report is None:
+        return 1
+
+    ImportView().display_report(report)
+    return 0 if not report.failed else 2
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,23 +1,122 @@
 # init_db.py
-from sqlalchemy import create_engine
+import argparse
+
+from sqlalchemy import Engine, Index, inspect
 from app.models import Base
-from config.config import Config
+from config.database import get_engine
+
+
+def _existing_index_columns(inspector, table_name: str) -> list[tuple]:
+    """
+    Return (columns, unique) for every index already on the table,
+    including the ones the database created by itself (MySQL indexes
+    foreign key columns, unique constraints and the primary key).
+    """
+    existing = [
+        (tuple(idx["column_names"]), bool(idx.get("unique")))
+        for idx in inspector.get_indexes(table_name)
+    ]
+    existing.extend(
+        (tuple(constraint["column_names"]), True)
+        for constraint in inspector.get_unique_constraints(table_name)
+    )
+    primary_key = inspector.get_pk_constraint(table_name)["constrained_columns"]
+    if primary_key:
+        existing.append((tuple(primary_key), True))
+    return existing
+
+
+def _is_covered(index: Index, existing: list[tuple]) -> bool:
+    """
+    True when an existing index starts with the columns of `index`
+    (whatever its name), and is unique if `index` is.
+    """
+    columns = tuple(column.name for column in index.columns)
+    return any(
+        existing_columns[:len(columns)] == columns
+        and (unique or not index.unique)
+        for existing_columns, unique in existing
+    )
 
 
-def create_tables():
+def find_missing_indexes(engine: Engine) -> list[Index]:
     """
-    Creates all database tables defined in the models.
+    Return the model-declared indexes absent from existing tables.
+    Indexes are matched by their columns rather than their name, so an
+    index the database already maintains under another name counts.
+    Tables that do not exist yet are skipped (create_all builds them
+    together with their indexes).
     """
-    engine = create_engine(Config.get_db_url())
+    inspector = inspect(engine)
+    existing_tables = set(inspector.get_table_names())
+
+    missing = []
+    for table in Base.metadata.sorted_tables:
+        if table.name not in existing_tables:
+            continue
+        existing = _existing_index_columns(inspector, table.name)
+        missing.extend(
+            index for index in sorted(table.indexes, key=lambda i: i.name)
+            if not _is_covered(index, existing)
+        )
+    return missing
+
+
+def create_missing_indexes(engine: Engine) -> list[Index]:
+    """
+    Create the model-declared indexes missing on an existing database.
+    Returns the indexes that were created.
+    """
+    missing = find_missing_indexes(engine)
+    for index in missing:
+        index.create(engine, checkfirst=True)
+    return missing
+
+
+def report_missing_indexes(missing: list[Index]) -> None:
+    """Print the list of missing indexes."""
+    if not missing:
+        print("Indexes: all declared indexes are present.")
+        return
+    for index in missing:
+        columns = ", ".join(column.name for column in index.columns)
+        print(f"Missing index: {index.name} on {index.table.name}({columns})")
+
+
+def create_tables(check_only: bool = False):
+    """
+    Creates all database tables defined in the models, then reports
+    and creates any declared index missing on pre-existing tables.
+    """
+    engine = get_engine()
 
     print("Connecting to the database...")
     try:
+        if check_only:
+            report_missing_indexes(find_missing_indexes(engine))
+            return
+
+        # Report indexes missing on tables created by earlier versions
+        missing = find_missing_indexes(engine)
+        report_missing_indexes(missing)
+
         # Create all tables stored in the metadata
         Base.metadata.create_all(engine)
         print("Success: All tables created successfully.")
+
+        created = create_missing_indexes(engine)
+        if created:
+            print(f"Success: {len(created)} missing index(es) created.")
     except Exception as e:
         print(f"Error during table creation: {e}")
 
 
 if __name__ == "__main__":
-    create_tables()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Initialize the CRM schema.")
+    parser.add_argument(
+        "--check-indexes",
+        action="store_true",
+        help="Only report indexes missing on the existing database.",
+    )
+    args = parser.parse_args()
+    create_tables(check_only=args.check_indexes)
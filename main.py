@@ -1,79 +1,145 @@
 """
 Entry point for the Epic Events CRM application.
 Manages the main loop and coordinate between controllers and views.
+
+Startup stays short: only the login path (token storage, JWT helpers,
+auth views) is imported up front. Sentry, the database engine,
+repositories and the other controllers are imported and wired by a
+background thread while the session is restored or the user types
+their credentials.
 """
 
+import argparse
 from datetime import datetime
-
-import sentry_sdk
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
-from config.config import Config
-
-from app.repositories.employee_repository import EmployeeRepository
-from app.repositories.client_repository import ClientRepository
-from app.repositories.contract_repository import ContractRepository
-from app.repositories.event_repository import EventRepository
+from types import SimpleNamespace
 
 from app.controllers.auth_controller import AuthController
-from app.controllers.client_controller import ClientController
-from app.controllers.contract_controller import ContractController
-from app.controllers.event_controller import EventController
-from app.controllers.employee_controller import EmployeeController
-
+from app.utils.lazy import lazy_import
+from app.utils.startup import Preloader, StartupReport
+from app.utils.validators import parse_datetime
 from app.views.auth_view import AuthView
 from app.views.main_menu_view import MainMenuView
-from app.views.client_view import ClientView
-from app.views.contract_view import ContractView
-from app.views.event_view import EventView
-from app.views.employee_view import EmployeeView
-
-# Initialize Sentry
-sentry_sdk.init(
-    dsn=Config.SENTRY_DSN,
-    # Set the environment (default to development if not specified in Config)
-    environment=getattr(Config, "ENVIRONMENT", "development"),
-    traces_sample_rate=1.0,
-    profiles_sample_rate=1.0,
-)
-
-
-def main():
+
+sentry_sdk = lazy_import("sentry_sdk")
+
+# Menu choices that write data; traced more often than reads
+WRITE_CHOICES = {"5", "6", "7", "8", "9", "20", "21", "22", "25", "31"}
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Epic Events CRM.")
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Print SQL statement counts and DB time after each action.",
+    )
+    parser.add_argument(
+        "--startup-report",
+        action="store_true",
+        help="Print startup milestones and the modules loaded at startup.",
+    )
+    return parser.parse_args(argv)
+
+
+def build_app(auth_ctrl: AuthController):
+    """
+    Initialise Sentry and wire the database, repositories, controllers
+    and views around `auth_ctrl`. Runs in the background preload thread.
+    """
+    from config.database import get_engine, get_session_factory
+    from config.sentry import init_sentry
+    from app.utils.instrumentation import QueryProfiler
+
+    from app.repositories.employee_repository import EmployeeRepository
+    from app.repositories.client_repository import ClientRepository
+    from app.repositories.contract_repository import ContractRepository
+    from app.repositories.event_repository import EventRepository
+
+    from app.controllers.client_controller import ClientController
+    from app.controllers.contract_controller import ContractController
+    from app.controllers.event_controller import EventController
+    from app.controllers.employee_controller import EmployeeController
+
+    from app.views.client_view import ClientView
+    from app.views.contract_view import ContractView
+    from app.views.event_view import EventView
+    from app.views.employee_view import EmployeeView
+    from app.views.profile_view import ProfileView
+
+    init_sentry()
+
+    # Database Setup (no connection is opened until the first query)
+    session = get_session_factory()()
+
+    # SQL statistics per menu action; slow statements go to Sentry
+    profiler = QueryProfiler(get_engine())
+    profiler.attach()
+
+    # Initialize Repositories
+    emp_repo = EmployeeRepository(session)
+    client_repo = ClientRepository(session)
+    contract_repo = ContractRepository(session)
+    event_repo = EventRepository(session)
+
+    # The auth controller already served the session restore
+    auth_ctrl.repository = emp_repo
+
+    # Initialize Controllers and Views
+    return SimpleNamespace(
+        session=session,
+        profiler=profiler,
+        client_ctrl=ClientController(client_repo, auth_ctrl),
+        contract_ctrl=ContractController(contract_repo, auth_ctrl),
+        event_ctrl=EventController(event_repo, auth_ctrl),
+        emp_ctrl=EmployeeController(emp_repo, auth_ctrl),
+        client_view=ClientView(),
+        contract_view=ContractView(),
+        event_view=EventView(),
+        emp_view=EmployeeView(),
+        profile_view=ProfileView(),
+    )
+
+
+def main(argv=None):
     """Main application execution logic."""
+    args = parse_args(argv)
+    startup = StartupReport()
+    auth_ctrl = AuthController(None)
+    preload = Preloader(lambda: build_app(auth_ctrl)).start()
     try:
-        # Database Setup
-        engine = create_engine(Config.get_db_url())
-        session_factory = sessionmaker(bind=engine)
-        session = session_factory()
-
-        # Initialize Repositories
-        emp_repo = EmployeeRepository(session)
-        client_repo = ClientRepository(session)
-        contract_repo = ContractRepository(session)
-        event_repo = EventRepository(session)
-
-        # Initialize Controllers
-        auth_ctrl = AuthController(emp_repo)
-        client_ctrl = ClientController(client_repo, auth_ctrl)
-        contract_ctrl = ContractController(contract_repo, auth_ctrl)
-        event_ctrl = EventController(event_repo, auth_ctrl)
-        emp_ctrl = EmployeeController(emp_repo, auth_ctrl)
-
-        # Initialize Views
         auth_view = AuthView()
         menu_view = MainMenuView()
-        client_view = ClientView()
-        contract_view = ContractView()
-        event_view = EventView()
-        emp_view = EmployeeView()
 
-        # 1. Authentication Check
+        # 1. Authentication Check: a saved session needs no database
         user_data = auth_ctrl.get_logged_in_user()
-        if not user_data:
+        if user_data:
+            startup.mark("session restored")
+        else:
+            startup.mark("login prompt")
             email, password = auth_view.ask_login_details()
+
+        app = preload.result()
+        startup.mark("application ready")
+        if args.startup_report:
+            app.profile_view.display_startup(startup, preload)
+
+        profiler = app.profiler
+        profile_view = app.profile_view
+        client_ctrl = app.client_ctrl
+        contract_ctrl = app.contract_ctrl
+        event_ctrl = app.event_ctrl
+        emp_ctrl = app.emp_ctrl
+        client_view = app.client_view
+        contract_view = app.contract_view
+        event_view = app.event_view
+        emp_view = app.emp_view
+
+        if not user_data:
+            profiler.start_action("login", op="cli.audit")
             # Capture user_data directly from login()
             user_data = auth_ctrl.login(email, password)
             if not user_data:
+                profiler.end_action()
                 auth_view.display_login_failure()
                 return
 
@@ -81,27 +147,37 @@ def main():
 
         # 2. Application Loop
         while True:
+            finished = profiler.end_action()
+            if args.profile and finished:
+                profile_view.display_action(finished)
 
             menu_view.display_menu(user_data["department"])
             choice = menu_view.ask_menu_option()
+            profiler.start_action(
+                f"menu {choice}",
+                op="cli.write" if choice in WRITE_CHOICES else "cli.read",
+            )
 
             if choice == "1":
-                # Pass user_data to satisfy the @require_auth decorator
-                data = client_ctrl.list_all_clients(user_data=user_data)
-                client_view.display_clients(data)
+                # Keyset pagination: one bounded query per displayed page
+                result = client_ctrl.paginate_clients(user_data=user_data)
+                total, pages = result or (0, [])
+                client_view.display_client_pages(pages, total)
             elif choice == "2":
-                # Pass user_data to satisfy the @require_auth decorator
-                data = contract_ctrl.list_all_contracts(user_data=user_data)
-                contract_view.display_contracts(data)
+                result = contract_ctrl.paginate_contracts(user_data=user_data)
+                total, pages = result or (0, [])
+                contract_view.display_contract_pages(pages, total)
             elif choice == "3":
-                # Pass user_data to satisfy the @require_auth decorator
-                data = event_ctrl.list_all_events(user_data=user_data)
-                event_view.display_events(data)
+                result = event_ctrl.paginate_events(user_data=user_data)
+                total, pages = result or (0, [])
+                event_view.display_event_pages(pages, total)
             elif choice == "4":
                 if user_data["department"] != "MANAGEMENT":
                     print("Invalid option. Please try again.")
                     continue
-                data = emp_ctrl.list_all_employees(user_data=user_data)
+                data = emp_ctrl.list_all_employees(
+                    user_data=user_data, stream=True
+                ) or []
                 emp_view.display_employees(data)
             elif choice == "5":
                 if user_data["department"] != "MANAGEMENT":
@@ -215,7 +291,7 @@ def main():
                     print("Invalid option. Please try again.")
                     continue
                 events = event_ctrl.list_events_without_support(
-                    user_data=user_data
+                    user_data=user_data, stream=True
                 ) or []
                 event_view.display_events(events)
             elif choice == "20":
@@ -320,7 +396,7 @@ def main():
                     print("Invalid option. Please try again.")
                     continue
                 contracts = contract_ctrl.list_unsigned_contracts(
-                    user_data=user_data
+                    user_data=user_data, stream=True
                 ) or []
                 contract_view.display_contracts(contracts)
             elif choice == "24":
@@ -328,7 +404,7 @@ def main():
                     print("Invalid option. Please try again.")
                     continue
                 contracts = contract_ctrl.list_unpaid_contracts(
-                    user_data=user_data
+                    user_data=user_data, stream=True
                 ) or []
                 contract_view.display_contracts(contracts)
             elif choice == "25":
@@ -361,20 +437,9 @@ def main():
 
                 raw = event_view.ask_event_details()
 
-                def parse_dt(value: str):
-                    value = value.strip()
-                    if not value:
-                        return None
-                    # Accept short and full formats
-                    for fmt in ("%Y-%m-%d %H", "%Y-%m-%d %H:%M:%S"):
-                        try:
-                            return datetime.strptime(value, fmt)
-                        except ValueError:
-                            continue
-                    return None
-
-                start_dt = parse_dt(str(raw.get("event_date_start", "")))
-                end_dt = parse_dt(str(raw.get("event_date_end", "")))
+                # Accept short and full formats
+                start_dt = parse_datetime(raw.get("event_date_start"))
+                end_dt = parse_datetime(raw.get("event_date_end"))
 
                 if not start_dt or not end_dt:
                     print(
@@ -415,7 +480,9 @@ def main():
                 if user_data["department"] != "SUPPORT":
                     print("Invalid option. Please try again.")
                     continue
-                events = event_ctrl.list_my_events(user_data=user_data) or []
+                events = event_ctrl.list_my_events(
+                    user_data=user_data, stream=True
+                ) or []
                 event_view.display_events(events)
             elif choice == "31":
                 if user_data["department"] != "SUPPORT":
@@ -458,6 +525,12 @@ def main():
             else:
                 print("Invalid option. Please try again.")
 
+        finished = profiler.end_action()
+        if args.profile:
+            if finished:
+                profile_view.display_action(finished)
+            profile_view.display_summary(profiler.actions)
+
     except Exception as e:
         # Catch and report any fatal application errors
         sentry_sdk.capture_exception(e)
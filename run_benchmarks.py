@@ -0,0 +1,208 @@
+# run_benchmarks.py
+"""
+Benchmark command for the repository and controller hot paths.
+
+Usage:
+    python run_benchmarks.py --sizes 1k 100k --output results.json
+    python run_benchmarks.py --sizes 1m --cases contract. --repeat 3
+    python run_benchmarks.py --compare baseline.json --output new.json
+
+Each dataset size is seeded once into a SQLite file under --data-dir and
+reused by later runs; --db-url benchmarks another database instead
+(its tables are dropped and reseeded). Every case runs inside a
+transaction that is rolled back, so write cases never change the data
+seen by the next case.
+"""
+
+import argparse
+import json
+import platform
+import subprocess
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+
+import sqlalchemy
+from sqlalchemy.orm import Session
+
+from benchmarks.cases import BenchContext, select_cases
+from benchmarks.dataset import SIZES, dataset_size, parse_size, seed_dataset
+from benchmarks.harness import measure
+from config.database import create_db_engine
+
+# Relative p50 slowdown reported as a regression by --compare
+DEFAULT_THRESHOLD = 0.2
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Time repository and controller paths on synthetic data."
+    )
+    parser.add_argument(
+        "--sizes",
+        nargs="+",
+        default=["1k", "100k"],
+        help=f"Dataset sizes: {', '.join(SIZES)} or a row count.",
+    )
+    parser.add_argument(
+        "--cases",
+        nargs="+",
+        help="Only run cases whose name contains one of these strings.",
+    )
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--warmup", type=int, default=1)
+    parser.add_argument(
+        "--data-dir",
+        default=".benchmarks",
+        help="Directory holding the seeded SQLite databases.",
+    )
+    parser.add_argument(
+        "--db-url",
+        help="Benchmark this database instead (tables are recreated).",
+    )
+    parser.add_argument("--output", help="Write the JSON report here.")
+    parser.add_argument(
+        "--compare",
+        help="Baseline JSON report; exit 1 when a case got slower.",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help="Allowed relative p50 slowdown before flagging (0.2 = 20%%).",
+    )
+    return parser.parse_args(argv)
+
+
+def _git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _engine_for(size: int, args):
+    """Return an engine on a database holding exactly `size` clients."""
+    if args.db_url:
+        engine = create_db_engine(args.db_url)
+        seed_dataset(engine, size)
+        return engine
+
+    data_dir = Path(args.data_dir)
+    data_dir.mkdir(parents=True, exist_ok=True)
+    engine = create_db_engine(f"sqlite:///{data_dir / f'crm_{size}.db'}")
+    if dataset_size(engine) != size:
+        print(f"Seeding {size} rows...", file=sys.stderr)
+        seed_dataset(engine, size)
+    return engine
+
+
+def run_size(label: str, size: int, cases, args) -> list:
+    """Run every case against one dataset size."""
+    engine = _engine_for(size, args)
+    results = []
+    try:
+        with engine.connect() as conn:
+            for case in cases:
+                transaction = conn.begin()
+                session = Session(
+                    bind=conn,
+                    join_transaction_mode="create_savepoint",
+                    expire_on_commit=False,
+                )
+                try:
+                    ctx = BenchContext(session)
+                    stats = measure(
+                        engine,
+                        lambda: case.func(ctx),
+                        repeat=args.repeat,
+                        warmup=args.warmup,
+                    )
+                finally:
+                    session.close()
+                    transaction.rollback()
+                results.append({
+                    "size": label,
+                    "rows_seeded": size,
+                    "group": case.group,
+                    "case": case.name,
+                    **stats,
+                })
+                print(
+                    f"[{label}] {case.key:45} p50 {stats['p50_ms']:>10.3f} ms"
+                    f"  p95 {stats['p95_ms']:>10.3f} ms"
+                    f"  {stats['queries']:>4} queries",
+                    file=sys.stderr,
+                )
+    finally:
+        engine.dispose()
+    return results
+
+
+def compare(results: list, baseline: dict, threshold: float) -> list:
+    """
+    Return (key, old_p50, new_p50) for cases whose p50 grew by more
+    than `threshold` relative to the baseline report.
+    """
+    previous = {
+        (r["size"], r["group"], r["case"]): r["p50_ms"]
+        for r in baseline.get("results", [])
+    }
+    regressions = []
+    for r in results:
+        key = (r["size"], r["group"], r["case"])
+        old = previous.get(key)
+        if old and r["p50_ms"] > old * (1 + threshold):
+            regressions.append((key, old, r["p50_ms"]))
+    return regressions
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    cases = select_cases(args.cases)
+    if not cases:
+        print("No benchmark case matches --cases.", file=sys.stderr)
+        return 1
+
+    results = []
+    for label in args.sizes:
+        results.extend(run_size(label, parse_size(label), cases, args))
+
+    report = {
+        "meta": {
+            "commit": _git_commit(),
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "sqlalchemy": sqlalchemy.__version__,
+            "backend": args.db_url.split(":")[0] if args.db_url else "sqlite",
+            "repeat": args.repeat,
+            "warmup": args.warmup,
+        },
+        "results": results,
+    }
+    payload = json.dumps(report, indent=2)
+    if args.output:
+        Path(args.output).write_text(payload + "\n")
+    else:
+        print(payload)
+
+    if args.compare:
+        baseline = json.loads(Path(args.compare).read_text())
+        regressions = compare(results, baseline, args.threshold)
+        for (size, group, name), old, new in regressions:
+            print(
+                f"REGRESSION [{size}] {group}.{name}: "
+                f"{old:.3f} ms -> {new:.3f} ms",
+                file=sys.stderr,
+            )
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
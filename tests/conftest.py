@@ -1,18 +1,25 @@
 # tests/conftest.py
 """
 Pytest configuration and global fixtures.
-Provides database engine and session management for tests.
-Initializes Sentry for error tracking during tests.
+Provides database engine and session management for tests, and SQL
+statement and commit recorders.
+Initializes Sentry for error tracking during tests and sends audit
+records and the session token to temporary files.
 """
 
 import os
+
 import pytest
 import sentry_sdk
-from sqlalchemy import create_engine, text
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import event, text
+from sqlalchemy.orm import Session
 from config.config import Config
+from config.database import create_db_engine
 from app.models import Base
-from app.utils.token_storage import TOKEN_FILE
+from app.utils.audit import AuditPipeline, FileAuditSink, set_audit_pipeline
+from app.utils.instrumentation import CONTROL_PREFIXES, QueryProfiler
+from app.utils import token_storage
+from app.utils.jwt_handler import forget_token
 
 try:
     from dotenv import load_dotenv
@@ -32,11 +39,67 @@ def init_sentry():
     )
 
 
+@pytest.fixture(scope="session", autouse=True)
+def token_file(tmp_path_factory):
+    """
+    Keep the session token of the whole run in a temporary directory,
+    away from the developer's own saved session.
+    """
+    path = tmp_path_factory.mktemp("token") / "token"
+    original = token_storage.storage.path
+    token_storage.storage.path = str(path)
+    yield path
+    token_storage.storage.path = original
+
+
+@pytest.fixture(scope="session", autouse=True)
+def audit_log_path(tmp_path_factory):
+    """
+    Send the audit records of the whole run to a temporary file instead
+    of AUDIT_LOG_PATH (and not to Sentry).
+    """
+    path = tmp_path_factory.mktemp("audit") / "audit.jsonl"
+    set_audit_pipeline(
+        AuditPipeline([FileAuditSink(str(path), fsync=False)],
+                      flush_interval=0.05)
+    )
+    yield path
+    set_audit_pipeline(None)
+
+
+# Tests run on in-memory SQLite unless TEST_DB_BACKEND selects the
+# server configured in .env (e.g. TEST_DB_BACKEND=mysql).
+TEST_DB_BACKEND = os.getenv("TEST_DB_BACKEND", "sqlite").lower()
+
+
+def get_test_db_url() -> str:
+    """Return the database URL used by the test suite."""
+    if TEST_DB_BACKEND == "sqlite":
+        return "sqlite://"
+    return Config.get_db_url(TEST_DB_BACKEND)
+
+
+def recreate_schema(engine) -> None:
+    """
+    Drop and recreate every table.
+    MySQL refuses to drop a table still referenced by a foreign key (for
+    instance from a table left by an older schema), so FOREIGN_KEY_CHECKS
+    is lifted there; other backends drop in dependency order.
+    """
+    with engine.begin() as connection:
+        is_mysql = connection.dialect.name == "mysql"
+        if is_mysql:
+            connection.execute(text("SET FOREIGN_KEY_CHECKS=0;"))
+        Base.metadata.drop_all(connection)
+        if is_mysql:
+            connection.execute(text("SET FOREIGN_KEY_CHECKS=1;"))
+    Base.metadata.create_all(engine)
+
+
 @pytest.fixture(scope="session")
 def db_engine():
-    engine = create_engine(Config.get_db_url())
-    Base.metadata.drop_all(engine)
-    Base.metadata.create_all(engine)
+    engine = create_db_engine(get_test_db_url())
+    recreate_schema(engine)
     yield engine
     engine.dispose()
 
@@ -44,35 +107,66 @@ def db_engine():
 @pytest.fixture(scope="function")
 def db_session(db_engine):
     """
-    Provide a fully clean database for each test.
-    Hard reset using TRUNCATE and AUTO_INCREMENT reset.
-    Also clears TOKEN_FILE to avoid auth leakage.
+    Provide an isolated database session for each test.
+    The test runs inside an outer transaction that is rolled back at the
+    end; the session's own commits and rollbacks become SAVEPOINTs, so
+    repositories behave as usual while nothing leaks between tests.
+    Also clears the token file and the decoded-token cache to avoid auth
+    leakage.
     """
     # Remove persisted token between tests
-    if os.path.exists(TOKEN_FILE):
-        os.remove(TOKEN_FILE)
+    token_storage.delete_token()
+    forget_token()
 
     connection = db_engine.connect()
-    Session = sessionmaker(bind=connection)
-    session = Session()
+    transaction = connection.begin()
+    session = Session(bind=connection, join_transaction_mode="create_savepoint")
 
-    session.execute(text("SET FOREIGN_KEY_CHECKS=0;"))
+    yield session
 
-    tables = [
-        "event",
-        "contract",
-        "client",
-        "employee",
-        "department",
-    ]
+    session.close()
+    transaction.rollback()
+    connection.close()
 
-    for table in tables:
-        session.execute(text(f"TRUNCATE TABLE {table};"))
 
-    session.execute(text("SET FOREIGN_KEY_CHECKS=1;"))
-    session.commit()
+@pytest.fixture
+def query_profiler(db_engine):
+    """
+    Record the SQL issued by a test on the shared engine.
+    Wrap the code under test in `query_profiler.action(name)` to get its
+    statement count, DB time, rows and slowest statements.
+    """
+    with QueryProfiler(db_engine) as profiler:
+        yield profiler
 
-    yield session
 
-    session.close()
-    connection.close()
\ No newline at end of file
+@pytest.fixture
+def statements(db_engine):
+    """
+    Record the leading keyword (SELECT, INSERT, UPDATE...) of every SQL
+    statement issued on the shared engine. Transaction control (BEGIN,
+    SAVEPOINT...) from the db_session fixture is left out.
+    """
+    seen = []
+
+    def listener(conn, cursor, statement, parameters, context, executemany):
+        statement = statement.lstrip().upper()
+        if not statement.startswith(CONTROL_PREFIXES):
+            seen.append(statement.split()[0])
+
+    event.listen(db_engine, "before_cursor_execute", listener)
+    yield seen
+    event.remove(db_engine, "before_cursor_execute", listener)
+
+
+@pytest.fixture
+def commits(db_session):
+    """Record every transaction commit issued by the test session."""
+    seen = []
+
+    def listener(session):
+        seen.append(session)
+
+    event.listen(db_session, "after_commit", listener)
+    yield seen
+    event.remove(db_session, "after_commit", listener)
@@ -0,0 +1,19 @@
+# tests/helpers.py
+"""
+Shared test doubles, imported by test modules (conftest.py only holds
+fixtures).
+"""
+
+
+class DummyAuthController:
+    """
+    Minimal auth controller to drive controller permission branches.
+    Grants the permissions in `allowed`, or every permission when None.
+    """
+
+    def __init__(self, allowed: set[str] | None = None):
+        self.allowed = allowed
+        self.current_user_data: dict | None = None
+
+    def check_user_permission(self, permission: str) -> bool:
+        return self.allowed is None or permission in self.allowed
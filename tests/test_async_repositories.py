@@ -0,0 +1,286 @@
+# tests/test_async_repositories.py
+"""
+Unit tests for the asyncio repository and controller layer (aiosqlite).
+
+Tests included:
+- test_async_crud_roundtrip: add/get/update/get_by_email on AsyncSession.
+- test_async_rows_stream_and_pages: Rows, async streaming and keyset pages.
+- test_async_load_profile_avoids_lazy_loads: Profiles preload relationships.
+- test_async_contract_listing_scoped_to_sales: SALES only see own contracts.
+- test_async_bulk_update_respects_ownership: Support only updates own events.
+- test_async_require_auth_without_user: Unauthenticated calls await to None.
+- test_async_create_employee_hashes_password: Hash computed off the loop.
+- test_async_concurrent_sessions: Several sessions query concurrently.
+"""
+
+import asyncio
+
+import pytest
+
+pytest.importorskip("aiosqlite")
+
+from app.controllers.async_controllers import (  # noqa: E402
+    AsyncContractController,
+    AsyncEmployeeController,
+    AsyncEventController,
+)
+from app.models import Base  # noqa: E402
+from app.models.client import Client  # noqa: E402
+from app.models.contract import Contract  # noqa: E402
+from app.models.department import Department  # noqa: E402
+from app.models.employee import Employee  # noqa: E402
+from app.models.event import Event  # noqa: E402
+from app.repositories.async_repositories import (  # noqa: E402
+    AsyncClientRepository,
+    AsyncContractRepository,
+    AsyncDepartmentRepository,
+    AsyncEmployeeRepository,
+    AsyncEventRepository,
+)
+from app.repositories.rows import ClientRow, ContractRow  # noqa: E402
+from app.utils import decorators  # noqa: E402
+from config.database import (  # noqa: E402
+    create_async_db_engine,
+    get_async_session_factory,
+)
+from tests.helpers import DummyAuthController  # noqa: E402
+
+
+@pytest.fixture
+def async_db(tmp_path):
+    """
+    Return a coroutine runner bound to a fresh aiosqlite database seeded
+    with two sales people, their clients, contracts and events.
+    """
+    engine = create_async_db_engine(f"sqlite+aiosqlite:///{tmp_path}/async.db")
+    factory = get_async_session_factory(engine)
+
+    async def seed():
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        async with factory() as session:
+            dept = Department(name="SALES")
+            session.add(dept)
+            await session.flush()
+            staff = [
+                Employee(
+                    full_name=f"Sales {i}",
+                    email=f"sales{i}@t.com",
+                    password="h",
+                    employee_number=f"A{i}",
+                    department_id=dept.id,
+                )
+                for i in range(2)
+            ]
+            session.add_all(staff)
+            await session.flush()
+            for i in range(6):
+                owner = staff[i % 2]
+                client = Client(
+                    full_name=f"Client {i}",
+                    email=f"client{i}@t.com",
+                    phone="0",
+                    company_name="C",
+                    sales_contact_id=owner.id,
+                )
+                session.add(client)
+                await session.flush()
+                contract = Contract(
+                    total_amount=100,
+                    remaining_amount=50,
+                    is_signed=i >= 3,
+                    client_id=client.id,
+                    sales_contact_id=owner.id,
+                )
+                session.add(contract)
+                await session.flush()
+                session.add(Event(
+                    name=f"Event {i}",
+                    location="L",
+                    attendees=5,
+                    notes="",
+                    client_id=client.id,
+                    contract_id=contract.id,
+                    support_contact_id=owner.id,
+                ))
+            await session.commit()
+            return [s.id for s in staff]
+
+    def run(scenario):
+        async def main():
+            staff_ids = await seed()
+            try:
+                return await scenario(factory, staff_ids)
+            finally:
+                await engine.dispose()
+
+        return asyncio.run(main())
+
+    return run
+
+
+def test_async_crud_roundtrip(async_db):
+    async def scenario(factory, staff_ids):
+        async with factory() as session:
+            repo = AsyncClientRepository(session)
+            client = await repo.add(Client(
+                full_name="Async",
+                email="async@t.com",
+                phone="1",
+                company_name="A",
+                sales_contact_id=staff_ids[0],
+            ))
+            assert client.creation_date is not None
+
+            updated = await repo.update(client.id, {"phone": "2"})
+            assert updated.phone == "2"
+
+            found = await repo.get_by_email("async@t.com")
+            assert found.id == client.id
+            assert await repo.get_by_id(999) is None
+            assert (await AsyncDepartmentRepository(session).get_by_name(
+                "SALES"
+            )).name == "SALES"
+
+    async_db(scenario)
+
+
+def test_async_rows_stream_and_pages(async_db):
+    async def scenario(factory, staff_ids):
+        async with factory() as session:
+            repo = AsyncClientRepository(session)
+
+            rows = await repo.get_all_clients(rows=True)
+            assert len(rows) == 6
+            assert all(isinstance(r, ClientRow) for r in rows)
+
+            streamed = [
+                r.id async for r in repo.stream_all_clients(rows=True)
+            ]
+            assert streamed == [r.id for r in rows]
+
+            pages = [
+                [r.id for r in page]
+                async for page in repo.iter_pages(page_size=4, rows=True)
+            ]
+            assert pages == [streamed[:4], streamed[4:]]
+            assert await repo.count() == 6
+
+    async_db(scenario)
+
+
+def test_async_load_profile_avoids_lazy_loads(async_db):
+    async def scenario(factory, staff_ids):
+        async with factory() as session:
+            repo = AsyncContractRepository(session)
+            contracts = await repo.get_all_contracts(profile="contract_list")
+            names = {c.client.full_name for c in contracts}
+            assert len(names) == 6
+
+            with pytest.raises(ValueError):
+                await repo.get_all(profile="unknown")
+
+    async_db(scenario)
+
+
+def test_async_contract_listing_scoped_to_sales(async_db):
+    async def scenario(factory, staff_ids):
+        async with factory() as session:
+            ctrl = AsyncContractController(
+                AsyncContractRepository(session),
+                DummyAuthController({"read_contract"}),
+            )
+            user = {"id": staff_ids[0], "department": "SALES"}
+
+            unsigned = await ctrl.list_unsigned_contracts(user_data=user)
+            assert all(isinstance(c, ContractRow) for c in unsigned)
+            assert {c.sales_contact_id for c in unsigned} == {staff_ids[0]}
+
+            stream = await ctrl.list_unpaid_contracts(user_data=user, stream=True)
+            owners = {c.sales_contact_id async for c in stream}
+            assert owners == {staff_ids[0]}
+
+    async_db(scenario)
+
+
+def test_async_bulk_update_respects_ownership(async_db):
+    async def scenario(factory, staff_ids):
+        async with factory() as session:
+            ctrl = AsyncEventController(
+                AsyncEventRepository(session),
+                DummyAuthController({"update_event", "read_event"}),
+            )
+            user = {"id": staff_ids[1], "department": "SUPPORT"}
+            events = await ctrl.repository.get_all_events()
+
+            count = await ctrl.bulk_update_events(
+                user_data=user,
+                event_ids=[e.id for e in events],
+                updates={"notes": "done"},
+            )
+            assert count == 3
+
+            mine = await ctrl.list_my_events(user_data=user)
+            assert {e.notes for e in mine} == {"done"}
+
+    async_db(scenario)
+
+
+def test_async_require_auth_without_user(async_db, monkeypatch):
+    monkeypatch.setattr(decorators, "get_token", lambda: None)
+
+    async def scenario(factory, staff_ids):
+        async with factory() as session:
+            ctrl = AsyncEventController(
+                AsyncEventRepository(session), DummyAuthController(set())
+            )
+            assert await ctrl.list_all_events() is None
+
+    async_db(scenario)
+
+
+def test_async_create_employee_hashes_password(async_db):
+    async def scenario(factory, staff_ids):
+        async with factory() as session:
+            ctrl = AsyncEmployeeController(
+                AsyncEmployeeRepository(session),
+                DummyAuthController({"create_employee"}),
+            )
+            user = {"id": staff_ids[0], "department": "MANAGEMENT"}
+            dept_id = (await AsyncDepartmentRepository(session).get_by_name(
+                "SALES"
+            )).id
+
+            employee = await ctrl.create_employee(
+                user_data=user,
+                employee_data={
+                    "full_name": "New Hire",
+                    "email": "hire@t.com",
+                    "password": "secret",
+                    "employee_number": "H1",
+                    "department_id": dept_id,
+                },
+            )
+            assert employee.password.startswith("$argon2")
+
+            loaded = await ctrl.repository.get_by_email("hire@t.com")
+            assert loaded.department.name == "SALES"
+
+    async_db(scenario)
+
+
+def test_async_concurrent_sessions(async_db):
+    async def scenario(factory, staff_ids):
+        async def count_contracts(owner_id):
+            async with factory() as session:
+                repo = AsyncContractRepository(session)
+                return len(await repo.get_unpaid_contracts(
+                    rows=True, owner_id=owner_id
+                ))
+
+        results = await asyncio.gather(
+            *(count_contracts(staff_ids[i % 2]) for i in range(10))
+        )
+        assert results == [3] * 10
+
+    async_db(scenario)
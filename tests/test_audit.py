@@ -0,0 +1,205 @@
+# tests/test_audit.py
+"""
+Unit tests for the asynchronous audit pipeline in app/utils/audit.py.
+
+Tests included:
+- test_records_are_written_in_batches: Batches never exceed batch_size.
+- test_file_sink_appends_json_lines: One JSON object per line, appended.
+- test_sentry_outage_keeps_file_records: A failing sink loses nothing on disk.
+- test_emit_does_not_wait_for_sinks: Slow sinks and a full queue never block.
+- test_emit_racing_close_loses_nothing: Records sent during close() are kept.
+- test_sentry_sink_uses_isolated_scope: Audit tags stay off the global scope.
+- test_controllers_queue_audit_records: Employee and contract actions audited.
+"""
+
+import json
+import queue
+import threading
+import time
+import uuid
+
+import pytest
+import sentry_sdk
+
+import app.utils.audit as audit_module
+from app.controllers.contract_controller import ContractController
+from app.controllers.employee_controller import EmployeeController
+from app.models.department import Department
+from app.models.employee import Employee
+from app.repositories.employee_repository import EmployeeRepository
+from app.utils.audit import (
+    AuditPipeline,
+    AuditRecord,
+    FileAuditSink,
+    SentryAuditSink,
+)
+from tests.helpers import DummyAuthController
+
+
+class RecordingSink:
+    """Keep every batch it receives."""
+
+    def __init__(self):
+        self.batches = []
+
+    def write(self, records):
+        self.batches.append([record.event for record in records])
+
+    @property
+    def events(self):
+        return [event for batch in self.batches for event in batch]
+
+
+class BrokenSink:
+    """Simulate an unreachable telemetry backend."""
+
+    def write(self, records):
+        raise ConnectionError("telemetry down")
+
+
+def _read_lines(path):
+    with open(path, encoding="utf-8") as handle:
+        return [json.loads(line) for line in handle]
+
+
+def test_records_are_written_in_batches():
+    sink = RecordingSink()
+    pipeline = AuditPipeline([sink], batch_size=3, flush_interval=5)
+
+    for i in range(7):
+        pipeline.emit(AuditRecord(f"test.{i}"))
+    pipeline.close()
+
+    assert sink.events == [f"test.{i}" for i in range(7)]
+    assert all(len(batch) <= 3 for batch in sink.batches)
+    assert len(sink.batches) >= 3
+
+
+def test_file_sink_appends_json_lines(tmp_path):
+    path = tmp_path / "nested" / "audit.jsonl"
+    sink = FileAuditSink(str(path))
+
+    sink.write([AuditRecord("contract.signed", 1, {"contract_id": 7})])
+    sink.write([AuditRecord("employee.created", 2, {"target_employee_id": 3})])
+
+    lines = _read_lines(path)
+    assert [line["event"] for line in lines] == [
+        "contract.signed", "employee.created"
+    ]
+    assert lines[0]["actor_id"] == 1
+    assert lines[0]["details"] == {"contract_id": 7}
+    assert lines[0]["timestamp"]
+
+
+def test_sentry_outage_keeps_file_records(tmp_path):
+    path = tmp_path / "audit.jsonl"
+    pipeline = AuditPipeline(
+        [FileAuditSink(str(path)), BrokenSink()], flush_interval=0.01
+    )
+
+    pipeline.emit(AuditRecord("employee.updated", 1))
+    pipeline.emit(AuditRecord("contract.signed", 1))
+    pipeline.close()
+
+    assert [line["event"] for line in _read_lines(path)] == [
+        "employee.updated", "contract.signed"
+    ]
+    assert pipeline.failures >= 1
+
+
+def test_emit_does_not_wait_for_sinks():
+    release = threading.Event()
+
+    class SlowSink(RecordingSink):
+        def write(self, records):
+            release.wait(5)
+            super().write(records)
+
+    sink = SlowSink()
+    pipeline = AuditPipeline([sink], batch_size=1, max_queue=1)
+
+    started = time.perf_counter()
+    for i in range(5):
+        pipeline.emit(AuditRecord(f"test.{i}"))
+    elapsed = time.perf_counter() - started
+
+    assert elapsed < 1
+    assert pipeline.dropped >= 1
+
+    release.set()
+    pipeline.close()
+    assert len(sink.events) == 5 - pipeline.dropped
+
+
+def test_emit_racing_close_loses_nothing():
+    sink = RecordingSink()
+    pipeline = AuditPipeline([sink], flush_interval=0.01)
+    closer = threading.Thread(target=pipeline.close)
+
+    class ClosingQueue(queue.Queue):
+        # close() runs between emit's closed check and its put
+        def put_nowait(self, item):
+            if not closer.is_alive() and item is not audit_module._STOP:
+                closer.start()
+                closer.join(0.2)
+            super().put_nowait(item)
+
+    pipeline._queue = ClosingQueue()
+    pipeline.emit(AuditRecord("test.late"))
+    closer.join()
+
+    assert sink.events == ["test.late"]
+
+
+def test_sentry_sink_uses_isolated_scope(monkeypatch):
+    captured = []
+
+    def fake_capture(scope, message, level=None, **kwargs):
+        captured.append((message, level, dict(scope._tags)))
+
+    monkeypatch.setattr(sentry_sdk.Scope, "capture_message", fake_capture)
+
+    SentryAuditSink().write([AuditRecord("contract.signed", 1)])
+
+    assert captured == [("contract.signed", "info", {"audit": "contract"})]
+    assert "audit" not in sentry_sdk.get_current_scope()._tags
+    assert "audit" not in sentry_sdk.get_isolation_scope()._tags
+
+
+@pytest.fixture
+def recording_pipeline(monkeypatch):
+    """Replace the process-wide pipeline for one test."""
+    sink = RecordingSink()
+    pipeline = AuditPipeline([sink], flush_interval=0.01)
+    monkeypatch.setattr(audit_module, "_pipeline", pipeline)
+    yield sink
+    pipeline.close()
+
+
+def test_controllers_queue_audit_records(db_session, recording_pipeline):
+    dept = Department(name=f"AUDIT_{uuid.uuid4().hex[:6]}")
+    db_session.add(dept)
+    db_session.flush()
+    employee = Employee(
+        full_name="Target",
+        email=f"audit_{uuid.uuid4().hex[:6]}@t.com",
+        password="h",
+        employee_number=f"A{uuid.uuid4().hex[:6]}",
+        department_id=dept.id,
+    )
+    db_session.add(employee)
+    db_session.commit()
+
+    auth = DummyAuthController({"update_employee"})
+    controller = EmployeeController(EmployeeRepository(db_session), auth)
+    user = {"id": employee.id, "department": "MANAGEMENT"}
+
+    controller.update_employee(
+        user_data=user,
+        emp_id=employee.id,
+        update_data={"full_name": "Renamed"},
+    )
+    ContractController._audit_signed(user, contract_id=5, client_id=9)
+    audit_module.get_audit_pipeline().flush()
+
+    assert recording_pipeline.events == ["employee.updated", "contract.signed"]
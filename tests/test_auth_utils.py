@@ -6,11 +6,26 @@ Tests included:
 - test_password_hashing: Verify Argon2 hashing and verification.
 - test_password_verification_fail: Ensure incorrect passwords are rejected.
 - test_token_lifecycle: Save, retrieve, and delete token from storage.
+- test_token_file_is_private: Owner-only file, no temporary file left.
+- test_token_mirror_follows_file: Unchanged file not re-read, a token
+  saved by another process is picked up.
+- test_concurrent_token_writes_are_atomic: Readers never see a torn file.
 """
 
 import os
+import stat
+import threading
+
+import pytest
+
+from app.utils import token_storage
 from app.utils.auth import hash_password, verify_password
-from app.utils.token_storage import save_token, get_token, delete_token, TOKEN_FILE
+from app.utils.token_storage import (
+    TokenStorage,
+    delete_token,
+    get_token,
+    save_token,
+)
 
 
 def test_password_hashing():
@@ -28,17 +43,17 @@ def test_password_verification_fail():
     assert verify_password("wrong_one", hashed) is False
 
 
-def test_token_lifecycle():
+def test_token_lifecycle(token_file):
     """Test the full lifecycle: saving, getting, and deleting a token."""
     # Ensure a clean state
-    if os.path.exists(TOKEN_FILE):
-        os.remove(TOKEN_FILE)
+    if os.path.exists(token_file):
+        os.remove(token_file)
 
     test_token = "abc.123.jwt.token"
 
     # Save
     save_token(test_token)
-    assert os.path.exists(TOKEN_FILE)
+    assert os.path.exists(token_file)
 
     # Get
     retrieved = get_token()
@@ -46,5 +61,75 @@ def test_token_lifecycle():
 
     # Delete
     delete_token()
-    assert not os.path.exists(TOKEN_FILE)
-    assert get_token() is None
\ No newline at end of file
+    assert not os.path.exists(token_file)
+    assert get_token() is None
+
+
+@pytest.mark.skipif(os.name == "nt", reason="POSIX permissions")
+def test_token_file_is_private(tmp_path):
+    """The token is only readable by its owner and replaced in place."""
+    store = TokenStorage(str(tmp_path / "nested" / "token"))
+    store.save("first")
+    store.save("second")
+
+    mode = stat.S_IMODE(os.stat(store.path).st_mode)
+    assert mode == 0o600
+    assert os.listdir(tmp_path / "nested") == ["token"]
+
+
+def test_token_mirror_follows_file(tmp_path, monkeypatch):
+    """get_token serves the mirror until the file is replaced."""
+    path = str(tmp_path / "token")
+    store = TokenStorage(path)
+    other_process = TokenStorage(path)
+    opened = []
+    real_open = open
+
+    def counting_open(*args, **kwargs):
+        opened.append(args[0])
+        return real_open(*args, **kwargs)
+
+    monkeypatch.setattr(token_storage, "open", counting_open, raising=False)
+
+    store.save("first")
+    assert [store.load() for _ in range(3)] == ["first"] * 3
+    assert opened == []
+
+    other_process.save("second")
+    assert store.load() == "second"
+    assert store.load() == "second"
+    assert opened == [path]
+
+    other_process.delete()
+    assert store.load() is None
+
+
+def test_concurrent_token_writes_are_atomic(tmp_path):
+    """Concurrent writers and readers only ever see whole tokens."""
+    path = str(tmp_path / "token")
+    tokens = [f"{i}." + "x" * 2000 for i in range(5)]
+    TokenStorage(path).save(tokens[0])
+    seen = set()
+    stop = threading.Event()
+
+    def writer(token):
+        store = TokenStorage(path)
+        for _ in range(50):
+            store.save(token)
+
+    def reader():
+        store = TokenStorage(path)
+        while not stop.is_set():
+            seen.add(store.load())
+
+    readers = [threading.Thread(target=reader) for _ in range(3)]
+    writers = [threading.Thread(target=writer, args=(t,)) for t in tokens]
+    for thread in readers + writers:
+        thread.start()
+    for thread in writers:
+        thread.join()
+    stop.set()
+    for thread in readers:
+        thread.join()
+
+    assert seen <= set(tokens)
@@ -0,0 +1,111 @@
+# tests/test_benchmarks.py
+"""
+Unit tests for the benchmark suite (benchmarks/ and run_benchmarks.py).
+
+Tests included:
+- test_parse_size: Named and numeric dataset sizes.
+- test_percentile_nearest_rank: p50/p95 on a small sample.
+- test_seed_dataset_shapes: One client and contract per row, some events.
+- test_run_writes_json_report: All metrics are reported per case.
+- test_write_cases_are_rolled_back: Benchmarks leave the dataset intact.
+- test_compare_flags_regressions: Slower p50 beyond the threshold fails.
+"""
+
+import json
+
+import pytest
+from sqlalchemy import func, select
+
+import run_benchmarks
+from app.models.client import Client
+from app.models.contract import Contract
+from app.models.event import Event
+from benchmarks.dataset import dataset_size, parse_size, seed_dataset
+from benchmarks.harness import percentile
+from config.database import create_db_engine
+
+METRICS = {
+    "p50_ms", "p95_ms", "mean_ms", "rows", "rows_per_sec",
+    "peak_memory_kb", "queries", "db_ms",
+}
+
+
+def test_parse_size():
+    assert parse_size("1k") == 1_000
+    assert parse_size("1M") == 1_000_000
+    assert parse_size("250") == 250
+    with pytest.raises(ValueError):
+        parse_size("huge")
+
+
+def test_percentile_nearest_rank():
+    samples = [5.0, 1.0, 4.0, 2.0, 3.0]
+    assert percentile(samples, 0.5) == 3.0
+    assert percentile(samples, 0.95) == 5.0
+
+
+def test_seed_dataset_shapes(tmp_path):
+    engine = create_db_engine(f"sqlite:///{tmp_path}/seed.db")
+    seed_dataset(engine, 120)
+
+    with engine.connect() as conn:
+        for model in (Client, Contract):
+            assert conn.execute(select(func.count(model.id))).scalar() == 120
+        signed = conn.execute(
+            select(func.count(Contract.id)).where(Contract.is_signed)
+        ).scalar()
+        events = conn.execute(select(func.count(Event.id))).scalar()
+    assert 0 < events <= signed < 120
+    assert dataset_size(engine) == 120
+    engine.dispose()
+
+
+def test_run_writes_json_report(tmp_path):
+    output = tmp_path / "report.json"
+    code = run_benchmarks.main([
+        "--sizes", "60",
+        "--cases", "client.get_all_rows", "clients.list_all",
+        "--repeat", "2",
+        "--data-dir", str(tmp_path),
+        "--output", str(output),
+    ])
+
+    assert code == 0
+    report = json.loads(output.read_text())
+    assert report["meta"]["backend"] == "sqlite"
+    cases = {r["case"]: r for r in report["results"]}
+    assert set(cases) == {"client.get_all_rows", "clients.list_all"}
+    for result in cases.values():
+        assert METRICS <= set(result)
+        assert result["rows"] == 60
+        assert result["queries"] == 1
+
+
+def test_write_cases_are_rolled_back(tmp_path):
+    run_benchmarks.main([
+        "--sizes", "40",
+        "--cases", "client.add", "client.bulk_insert", "clients.create",
+        "--repeat", "1",
+        "--data-dir", str(tmp_path),
+        "--output", str(tmp_path / "report.json"),
+    ])
+
+    engine = create_db_engine(f"sqlite:///{tmp_path}/crm_40.db")
+    assert dataset_size(engine) == 40
+    engine.dispose()
+
+
+def test_compare_flags_regressions():
+    baseline = {"results": [
+        {"size": "1k", "group": "repository", "case": "a", "p50_ms": 10.0},
+        {"size": "1k", "group": "repository", "case": "b", "p50_ms": 10.0},
+    ]}
+    results = [
+        {"size": "1k", "group": "repository", "case": "a", "p50_ms": 11.0},
+        {"size": "1k", "group": "repository", "case": "b", "p50_ms": 15.0},
+        {"size": "1k", "group": "repository", "case": "new", "p50_ms": 1.0},
+    ]
+
+    regressions = run_benchmarks.compare(results, baseline, 0.2)
+
+    assert regressions == [(("1k", "repository", "b"), 10.0, 15.0)]
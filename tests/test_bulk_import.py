@@ -0,0 +1,283 @@
+# tests/test_bulk_import.py
+"""
+Unit tests for the bulk import pipeline (reader -> controller -> repository).
+
+Tests included:
+- test_read_records_csv_and_jsonl: Both formats yield line-numbered dicts.
+- test_read_records_reports_bad_json_line: Bad lines surface as errors.
+- test_detect_format_rejects_unknown_extension: Unsupported files fail early.
+- test_import_clients_chunked_with_row_errors: Valid rows land, bad rows reported.
+- test_import_clients_skips_existing_emails: Database duplicates are rejected.
+- test_import_contracts_inherit_client_sales_contact: Ownership comes from client.
+- test_import_events_enforce_owner_and_signature: Event rules match create_event.
+- test_import_denied_returns_none: Permission check happens before reading.
+- test_bulk_insert_falls_back_to_single_rows: One bad row does not lose a chunk.
+"""
+
+import json
+import uuid
+
+import pytest
+
+from app.controllers.import_controller import ImportController
+from app.models.client import Client
+from app.models.contract import Contract
+from app.models.department import Department
+from app.models.employee import Employee
+from app.models.event import Event
+from app.repositories.client_repository import ClientRepository
+from app.repositories.contract_repository import ContractRepository
+from app.repositories.event_repository import EventRepository
+from app.utils.record_reader import detect_format, read_records
+from tests.helpers import DummyAuthController
+
+
+@pytest.fixture
+def import_setup(db_session):
+    """Two sales people; one client each, with a signed and unsigned contract."""
+    dept = Department(name=f"IMPORT_{uuid.uuid4().hex[:6]}")
+    db_session.add(dept)
+    db_session.flush()
+
+    sales = [
+        Employee(
+            full_name=f"Sales {i}",
+            email=f"sales{i}_{uuid.uuid4().hex[:6]}@t.com",
+            password="h",
+            employee_number=f"S{i}{uuid.uuid4().hex[:4]}",
+            department_id=dept.id,
+        )
+        for i in range(2)
+    ]
+    db_session.add_all(sales)
+    db_session.flush()
+
+    clients = [
+        Client(
+            full_name=f"Client {i}",
+            email=f"client{i}_{uuid.uuid4().hex[:6]}@t.com",
+            phone="0",
+            company_name="C",
+            sales_contact_id=sales[i].id,
+        )
+        for i in range(2)
+    ]
+    db_session.add_all(clients)
+    db_session.flush()
+
+    signed = Contract(
+        total_amount=100, remaining_amount=0, is_signed=True,
+        client_id=clients[0].id, sales_contact_id=sales[0].id,
+    )
+    unsigned = Contract(
+        total_amount=100, remaining_amount=100, is_signed=False,
+        client_id=clients[0].id, sales_contact_id=sales[0].id,
+    )
+    foreign = Contract(
+        total_amount=100, remaining_amount=0, is_signed=True,
+        client_id=clients[1].id, sales_contact_id=sales[1].id,
+    )
+    db_session.add_all([signed, unsigned, foreign])
+    db_session.commit()
+
+    ctrl = ImportController(
+        ClientRepository(db_session),
+        ContractRepository(db_session),
+        EventRepository(db_session),
+        DummyAuthController({"create_client", "create_contract", "create_event"}),
+    )
+    return {
+        "db": db_session,
+        "ctrl": ctrl,
+        "sales": sales,
+        "clients": clients,
+        "contracts": {"signed": signed, "unsigned": unsigned, "foreign": foreign},
+    }
+
+
+def _numbered(records):
+    return list(enumerate(records, start=2))
+
+
+def test_read_records_csv_and_jsonl(tmp_path):
+    csv_file = tmp_path / "clients.csv"
+    csv_file.write_text("full_name,email\nA,a@t.com\nB,b@t.com\n")
+    jsonl_file = tmp_path / "clients.jsonl"
+    jsonl_file.write_text('{"full_name": "A"}\n\n{"full_name": "B"}\n')
+
+    assert list(read_records(str(csv_file))) == [
+        (2, {"full_name": "A", "email": "a@t.com"}),
+        (3, {"full_name": "B", "email": "b@t.com"}),
+    ]
+    assert list(read_records(str(jsonl_file))) == [
+        (1, {"full_name": "A"}),
+        (3, {"full_name": "B"}),
+    ]
+
+
+def test_read_records_reports_bad_json_line(tmp_path):
+    path = tmp_path / "bad.jsonl"
+    path.write_text('{"a": 1}\nnot json\n[1, 2]\n')
+
+    records = list(read_records(str(path)))
+
+    assert records[0] == (1, {"a": 1})
+    assert isinstance(records[1][1], ValueError)
+    assert isinstance(records[2][1], ValueError)
+
+
+def test_detect_format_rejects_unknown_extension():
+    assert detect_format("data.JSON") == "jsonl"
+    with pytest.raises(ValueError):
+        detect_format("data.xlsx")
+
+
+def test_import_clients_chunked_with_row_errors(import_setup):
+    ctrl = import_setup["ctrl"]
+    user = {"id": import_setup["sales"][0].id, "department": "SALES"}
+    records = [
+        {"full_name": f"New {i}", "email": f"new{i}@t.com",
+         "phone": "1", "company_name": "N"}
+        for i in range(5)
+    ]
+    records += [
+        {"full_name": "No Mail", "email": "", "phone": "1", "company_name": "N"},
+        {"full_name": "Bad", "email": "bad-email", "phone": "1", "company_name": "N"},
+        {"full_name": "Dup", "email": "new0@t.com", "phone": "1", "company_name": "N"},
+    ]
+
+    report = ctrl.import_clients(
+        user_data=user, records=_numbered(records), chunk_size=2
+    )
+
+    assert report.processed == 8
+    assert report.inserted == 5
+    assert [line for line, _ in report.errors] == [7, 8, 9]
+
+    db = import_setup["db"]
+    imported = db.query(Client).filter(Client.email.like("new%@t.com")).all()
+    assert len(imported) == 5
+    assert {c.sales_contact_id for c in imported} == {user["id"]}
+    assert all(c.last_contact is not None for c in imported)
+
+
+def test_import_clients_skips_existing_emails(import_setup):
+    ctrl = import_setup["ctrl"]
+    existing = import_setup["clients"][0].email
+    user = {"id": import_setup["sales"][0].id, "department": "SALES"}
+
+    report = ctrl.import_clients(
+        user_data=user,
+        records=_numbered([
+            {"full_name": "X", "email": existing, "phone": "1", "company_name": "X"},
+        ]),
+    )
+
+    assert report.inserted == 0
+    assert report.errors == [(2, "A client with this email already exists.")]
+
+
+def test_import_contracts_inherit_client_sales_contact(import_setup):
+    ctrl = import_setup["ctrl"]
+    client = import_setup["clients"][1]
+    user = {"id": import_setup["sales"][0].id, "department": "MANAGEMENT"}
+
+    report = ctrl.import_contracts(
+        user_data=user,
+        records=_numbered([
+            {"client_id": str(client.id), "total_amount": "500",
+             "remaining_amount": "250", "is_signed": "yes"},
+            {"client_id": "999999", "total_amount": "1", "remaining_amount": "1"},
+            {"client_id": str(client.id), "total_amount": "-3",
+             "remaining_amount": "1"},
+        ]),
+    )
+
+    assert report.inserted == 1
+    assert [msg for _, msg in report.errors] == [
+        "Client not found.",
+        "Amount must be a positive value.",
+    ]
+
+    db = import_setup["db"]
+    contract = db.query(Contract).filter(Contract.total_amount == 500).one()
+    assert contract.sales_contact_id == client.sales_contact_id
+    assert contract.is_signed is True
+
+
+def test_import_events_enforce_owner_and_signature(import_setup):
+    ctrl = import_setup["ctrl"]
+    contracts = import_setup["contracts"]
+    user = {"id": import_setup["sales"][0].id, "department": "SALES"}
+    base = {
+        "name": "Launch", "location": "Paris", "attendees": "10",
+        "event_date_start": "2030-01-01 10", "event_date_end": "2030-01-01 12",
+    }
+
+    report = ctrl.import_events(
+        user_data=user,
+        records=_numbered([
+            {**base, "contract_id": str(contracts["signed"].id)},
+            {**base, "contract_id": str(contracts["unsigned"].id)},
+            {**base, "contract_id": str(contracts["foreign"].id)},
+            {**base, "contract_id": str(contracts["signed"].id),
+             "event_date_end": "2029-12-31 10"},
+            {**base, "contract_id": str(contracts["signed"].id),
+             "attendees": "many"},
+        ]),
+    )
+
+    assert report.inserted == 1
+    assert [line for line, _ in report.errors] == [3, 4, 5, 6]
+
+    event = import_setup["db"].query(Event).one()
+    assert event.client_id == import_setup["clients"][0].id
+    assert event.support_contact_id is None
+
+
+def test_import_denied_returns_none(import_setup, capsys):
+    db = import_setup["db"]
+    ctrl = ImportController(
+        ClientRepository(db),
+        ContractRepository(db),
+        EventRepository(db),
+        DummyAuthController(set()),
+    )
+
+    def records():
+        raise AssertionError("records must not be read when access is denied")
+        yield  # pragma: no cover
+
+    report = ctrl.import_clients(user_data={"id": 1}, records=records())
+
+    assert report is None
+    assert "Access denied" in capsys.readouterr().out
+
+
+def test_bulk_insert_falls_back_to_single_rows(import_setup, monkeypatch):
+    ctrl = import_setup["ctrl"]
+    repo = ctrl.client_repository
+    user = {"id": import_setup["sales"][0].id, "department": "SALES"}
+    original = repo.bulk_insert
+
+    def flaky_bulk_insert(rows):
+        # Simulate a NOT NULL violation on one row of the chunk
+        return original([
+            dict(r, full_name=None) if r["email"] == "boom@t.com" else r
+            for r in rows
+        ])
+
+    monkeypatch.setattr(repo, "bulk_insert", flaky_bulk_insert)
+
+    report = ctrl.import_clients(
+        user_data=user,
+        records=_numbered([
+            {"full_name": "Ok", "email": "ok@t.com", "phone": "1", "company_name": "O"},
+            {"full_name": "Boom", "email": "boom@t.com", "phone": "1", "company_name": "B"},
+        ]),
+    )
+
+    assert report.inserted == 1
+    assert report.errors[0][0] == 3
+    assert report.errors[0][1].startswith("Database error")
+    assert import_setup["db"].query(Client).filter_by(email="ok@t.com").count() == 1
@@ -0,0 +1,234 @@
+# tests/test_bulk_update.py
+"""
+Unit tests for set-based bulk updates (repository and controllers).
+
+Tests included:
+- test_bulk_update_single_statement: One UPDATE for many ids, rowcount returned.
+- test_bulk_update_ignores_unknown_and_pk_columns: Only mapped columns are set.
+- test_bulk_update_mappings_groups_by_columns: One executemany per column set.
+- test_bulk_update_events_respects_support_ownership: Support only hits own events.
+- test_bulk_update_events_management_updates_all: Management is unrestricted.
+- test_bulk_update_contracts_audits_new_signatures: Only transitions are audited.
+- test_bulk_update_contract_mappings_respects_sales_ownership: Sales scope.
+- test_bulk_update_denied_returns_none: Permission check before any query.
+"""
+
+import uuid
+
+import pytest
+
+from app.controllers.contract_controller import ContractController
+from app.controllers.event_controller import EventController
+from app.models.client import Client
+from app.models.contract import Contract
+from app.models.department import Department
+from app.models.employee import Employee
+from app.models.event import Event
+from app.repositories.contract_repository import ContractRepository
+from app.repositories.event_repository import EventRepository
+from tests.helpers import DummyAuthController
+
+
+@pytest.fixture
+def update_setup(db_session):
+    """Two supports and two sales people, each owning a few records."""
+    dept = Department(name=f"BULK_{uuid.uuid4().hex[:6]}")
+    db_session.add(dept)
+    db_session.flush()
+
+    staff = [
+        Employee(
+            full_name=f"Staff {i}",
+            email=f"staff{i}_{uuid.uuid4().hex[:6]}@t.com",
+            password="h",
+            employee_number=f"B{i}{uuid.uuid4().hex[:4]}",
+            department_id=dept.id,
+        )
+        for i in range(3)
+    ]
+    db_session.add_all(staff)
+    db_session.flush()
+
+    client = Client(
+        full_name="Bulk",
+        email=f"bulk_{uuid.uuid4().hex[:6]}@t.com",
+        phone="0",
+        company_name="B",
+        sales_contact_id=staff[0].id,
+    )
+    db_session.add(client)
+    db_session.flush()
+
+    contracts = [
+        Contract(
+            total_amount=100,
+            remaining_amount=100,
+            is_signed=i == 0,
+            client_id=client.id,
+            sales_contact_id=staff[i % 2].id,
+        )
+        for i in range(4)
+    ]
+    db_session.add_all(contracts)
+    db_session.flush()
+
+    events = [
+        Event(
+            name=f"Event {i}",
+            location="L",
+            attendees=10,
+            notes="",
+            client_id=client.id,
+            contract_id=contracts[0].id,
+            support_contact_id=staff[i % 2].id,
+        )
+        for i in range(6)
+    ]
+    db_session.add_all(events)
+    db_session.commit()
+
+    return {
+        "db": db_session,
+        "staff": staff,
+        "contracts": contracts,
+        "events": events,
+    }
+
+
+def test_bulk_update_single_statement(update_setup, statements):
+    repo = EventRepository(update_setup["db"])
+    ids = [e.id for e in update_setup["events"]]
+    target = update_setup["staff"][2].id
+
+    count = repo.bulk_update(ids, {"support_contact_id": target})
+
+    assert count == 6
+    assert statements.count("UPDATE") == 1
+    db = update_setup["db"]
+    assert {e.support_contact_id for e in db.query(Event)} == {target}
+
+
+def test_bulk_update_ignores_unknown_and_pk_columns(update_setup):
+    repo = EventRepository(update_setup["db"])
+    first = update_setup["events"][0]
+
+    assert repo.bulk_update([first.id], {"id": 999, "unknown": 1}) == 0
+    assert repo.bulk_update([], {"notes": "x"}) == 0
+
+    count = repo.bulk_update([first.id], {"id": 999, "notes": "moved"})
+    assert count == 1
+    assert repo.get_by_id(first.id).notes == "moved"
+
+
+def test_bulk_update_mappings_groups_by_columns(update_setup, statements):
+    repo = ContractRepository(update_setup["db"])
+    contracts = update_setup["contracts"]
+
+    count = repo.bulk_update_mappings([
+        {"id": contracts[0].id, "remaining_amount": 0},
+        {"id": contracts[1].id, "remaining_amount": 10},
+        {"id": contracts[2].id, "remaining_amount": 0, "is_signed": True},
+        {"remaining_amount": 5},
+    ])
+
+    assert count == 3
+    assert statements.count("UPDATE") == 2
+    amounts = {c.id: c.remaining_amount for c in repo.get_all()}
+    assert amounts[contracts[1].id] == 10
+    assert amounts[contracts[3].id] == 100
+    assert repo.get_by_id(contracts[2].id).is_signed is True
+
+
+def test_bulk_update_events_respects_support_ownership(update_setup):
+    staff = update_setup["staff"]
+    ctrl = EventController(
+        EventRepository(update_setup["db"]),
+        DummyAuthController({"update_event"}),
+    )
+    user = {"id": staff[0].id, "department": "SUPPORT"}
+    ids = [e.id for e in update_setup["events"]]
+
+    count = ctrl.bulk_update_events(
+        user_data=user, event_ids=ids, updates={"notes": "checked"}
+    )
+
+    assert count == 3
+    db = update_setup["db"]
+    for ev in db.query(Event):
+        expected = "checked" if ev.support_contact_id == staff[0].id else ""
+        assert ev.notes == expected
+
+
+def test_bulk_update_events_management_updates_all(update_setup):
+    ctrl = EventController(
+        EventRepository(update_setup["db"]),
+        DummyAuthController({"update_event"}),
+    )
+    user = {"id": update_setup["staff"][2].id, "department": "MANAGEMENT"}
+
+    count = ctrl.bulk_update_event_mappings(
+        user_data=user,
+        rows=[{"id": e.id, "attendees": 50} for e in update_setup["events"]],
+    )
+
+    assert count == 6
+
+
+def test_bulk_update_contracts_audits_new_signatures(update_setup, monkeypatch):
+    audited = []
+    monkeypatch.setattr(
+        ContractController,
+        "_audit_signed",
+        staticmethod(lambda user, contract_id, client_id: audited.append(contract_id)),
+    )
+    ctrl = ContractController(
+        ContractRepository(update_setup["db"]),
+        DummyAuthController({"update_contract"}),
+    )
+    contracts = update_setup["contracts"]
+    user = {"id": update_setup["staff"][0].id, "department": "SALES"}
+
+    count = ctrl.bulk_update_contracts(
+        user_data=user,
+        contract_ids=[c.id for c in contracts],
+        updates={"is_signed": True},
+    )
+
+    # staff[0] owns contracts 0 (already signed) and 2
+    assert count == 2
+    assert audited == [contracts[2].id]
+
+
+def test_bulk_update_contract_mappings_respects_sales_ownership(update_setup):
+    ctrl = ContractController(
+        ContractRepository(update_setup["db"]),
+        DummyAuthController({"update_contract"}),
+    )
+    contracts = update_setup["contracts"]
+    user = {"id": update_setup["staff"][1].id, "department": "SALES"}
+
+    count = ctrl.bulk_update_contract_mappings(
+        user_data=user,
+        rows=[{"id": c.id, "remaining_amount": 0} for c in contracts],
+    )
+
+    assert count == 2
+    db = update_setup["db"]
+    paid = {c.id for c in db.query(Contract).filter(Contract.remaining_amount == 0)}
+    assert paid == {contracts[1].id, contracts[3].id}
+
+
+def test_bulk_update_denied_returns_none(update_setup, statements, capsys):
+    ctrl = EventController(
+        EventRepository(update_setup["db"]),
+        DummyAuthController(set()),
+    )
+    user = {"id": update_setup["staff"][0].id, "department": "SUPPORT"}
+
+    result = ctrl.bulk_update_events(
+        user_data=user, event_ids=[1], updates={"notes": "x"}
+    )
+
+    assert result is None
+    assert "UPDATE" not in statements
+    assert "Access denied" in capsys.readouterr().out
@@ -0,0 +1,243 @@
+# tests/test_crm_cli.py
+"""
+Unit tests for the batch command line (crm.py) and its I/O helpers.
+
+Tests included:
+- test_parse_args_subcommands: Entities, actions, flags and required options.
+- test_read_ids_and_chunked: Comments and blanks skipped, bad ids reported.
+- test_write_records_jsonl_and_csv: Rows streamed as JSONL or CSV.
+- test_clients_list_streams_jsonl: A listing is written one line per row.
+- test_contracts_update_in_chunks: One UPDATE per chunk, JSON summary only
+  on stdout.
+- test_events_assign_reads_ids_from_file: Ids from argv and a file.
+- test_denied_commands_exit_with_1: Permission checks still apply.
+- test_denied_employees_list_exits_with_1: Same for the employees listing.
+"""
+
+import io
+import json
+import uuid
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+
+import crm
+from app.controllers.client_controller import ClientController
+from app.controllers.contract_controller import ContractController
+from app.controllers.employee_controller import EmployeeController
+from app.controllers.event_controller import EventController
+from app.models.client import Client
+from app.models.contract import Contract
+from app.models.department import Department
+from app.models.employee import Employee
+from app.models.event import Event
+from app.repositories.client_repository import ClientRepository
+from app.repositories.contract_repository import ContractRepository
+from app.repositories.employee_repository import EmployeeRepository
+from app.repositories.event_repository import EventRepository
+from app.repositories.rows import ClientRow
+from app.utils.record_reader import chunked, read_ids
+from app.utils.record_writer import write_records
+from app.views.client_view import ClientView
+from app.views.contract_view import ContractView
+from app.views.employee_view import EmployeeView
+from app.views.event_view import EventView
+from tests.helpers import DummyAuthController
+
+
+def _app(db, allowed):
+    auth = DummyAuthController(allowed)
+    return SimpleNamespace(
+        client_ctrl=ClientController(ClientRepository(db), auth),
+        contract_ctrl=ContractController(ContractRepository(db), auth),
+        event_ctrl=EventController(EventRepository(db), auth),
+        emp_ctrl=EmployeeController(EmployeeRepository(db), auth),
+        client_view=ClientView(),
+        contract_view=ContractView(),
+        event_view=EventView(),
+        emp_view=EmployeeView(),
+    )
+
+
+@pytest.fixture
+def cli_setup(db_session):
+    """A manager, a support person, one client, five contracts and events."""
+    dept = Department(name=f"CLI_{uuid.uuid4().hex[:6]}")
+    db_session.add(dept)
+    db_session.flush()
+    manager, support = [
+        Employee(
+            full_name=name,
+            email=f"{name}_{uuid.uuid4().hex[:6]}@t.com",
+            password="h",
+            employee_number=f"C{uuid.uuid4().hex[:6]}",
+            department_id=dept.id,
+        )
+        for name in ("manager", "support")
+    ]
+    db_session.add_all([manager, support])
+    db_session.flush()
+    client = Client(
+        full_name="Batch Client",
+        email=f"cli_{uuid.uuid4().hex[:6]}@t.com",
+        phone="0",
+        company_name="B",
+        sales_contact_id=manager.id,
+    )
+    db_session.add(client)
+    db_session.flush()
+    contracts = [
+        Contract(
+            total_amount=100,
+            remaining_amount=100,
+            is_signed=False,
+            client_id=client.id,
+            sales_contact_id=manager.id,
+        )
+        for _ in range(5)
+    ]
+    db_session.add_all(contracts)
+    db_session.flush()
+    events = [
+        Event(
+            name=f"Event {i}",
+            location="L",
+            attendees=10,
+            notes="",
+            client_id=client.id,
+            contract_id=contracts[0].id,
+        )
+        for i in range(3)
+    ]
+    db_session.add_all(events)
+    db_session.commit()
+    return {
+        "db": db_session,
+        "user": {"id": manager.id, "department": "MANAGEMENT"},
+        "support": support,
+        "client": client,
+        "contracts": contracts,
+        "events": events,
+    }
+
+
+def test_parse_args_subcommands():
+    args = crm.parse_args(["contracts", "update", "42", "43", "--signed"])
+    assert (args.entity, args.action) == ("contracts", "update")
+    assert args.ids == [42, 43]
+    assert args.is_signed is True
+    assert args.handler is crm.update_contracts_command
+
+    args = crm.parse_args(["events", "list", "--without-support",
+                           "--format", "csv"])
+    assert (args.only, args.format) == ("without_support", "csv")
+
+    with pytest.raises(SystemExit):
+        crm.parse_args(["events", "assign", "1"])
+    with pytest.raises(SystemExit):
+        crm.parse_args(["clients", "update"])
+
+
+def test_read_ids_and_chunked():
+    source = io.StringIO("1\n\n# header\n 2 \n3\n")
+    assert list(chunked(read_ids(source), 2)) == [[1, 2], [3]]
+
+    with pytest.raises(ValueError, match="Line 2"):
+        list(read_ids(io.StringIO("1\nabc\n")))
+
+
+def test_write_records_jsonl_and_csv():
+    rows = [
+        ClientRow(1, "A", "a@t.com", "0", "Co", datetime(2025, 1, 2), 7),
+        {"id": 2, "full_name": "B"},
+    ]
+
+    out = io.StringIO()
+    assert write_records(rows, "jsonl", out) == 2
+    first, second = [json.loads(line) for line in out.getvalue().splitlines()]
+    assert first["last_contact"] == "2025-01-02T00:00:00"
+    assert second == {"id": 2, "full_name": "B"}
+
+    out = io.StringIO()
+    write_records(rows[:1], "csv", out)
+    header, line = out.getvalue().splitlines()
+    assert header.startswith("id,full_name,email")
+    assert line.startswith("1,A,a@t.com")
+
+    with pytest.raises(ValueError, match="Unsupported output format"):
+        write_records(rows, "xml", io.StringIO())
+
+
+def test_clients_list_streams_jsonl(cli_setup, capsys):
+    app = _app(cli_setup["db"], {"read_client"})
+    args = crm.parse_args(["clients", "list", "--format", "jsonl"])
+
+    assert crm.list_command(app, args, cli_setup["user"]) == 0
+
+    lines = capsys.readouterr().out.splitlines()
+    assert [json.loads(line)["id"] for line in lines] == [
+        cli_setup["client"].id
+    ]
+
+
+def test_contracts_update_in_chunks(cli_setup, statements, capsys):
+    app = _app(cli_setup["db"], {"update_contract"})
+    ids = [str(c.id) for c in cli_setup["contracts"]]
+    args = crm.parse_args(
+        ["contracts", "update", *ids, "--signed", "--chunk-size", "2"]
+    )
+
+    assert crm.update_contracts_command(app, args, cli_setup["user"]) == 0
+
+    out = capsys.readouterr()
+    assert json.loads(out.out) == {
+        "command": "contracts update", "requested": 5, "updated": 5
+    }
+    assert "contract(s) updated" in out.err
+    assert statements.count("UPDATE") == 3
+    db = cli_setup["db"]
+    assert all(c.is_signed for c in db.query(Contract))
+
+
+def test_events_assign_reads_ids_from_file(cli_setup, capsys, tmp_path):
+    app = _app(cli_setup["db"], {"update_event"})
+    first, *rest = cli_setup["events"]
+    path = tmp_path / "ids.txt"
+    path.write_text("".join(f"{e.id}\n" for e in rest))
+    support_id = cli_setup["support"].id
+    args = crm.parse_args([
+        "events", "assign", str(first.id),
+        "--support", str(support_id), "--ids-from", str(path),
+    ])
+
+    assert crm.assign_events_command(app, args, cli_setup["user"]) == 0
+
+    summary = json.loads(capsys.readouterr().out)
+    assert summary["requested"] == summary["updated"] == 3
+    db = cli_setup["db"]
+    assert {e.support_contact_id for e in db.query(Event)} == {support_id}
+
+
+def test_denied_commands_exit_with_1(cli_setup, capsys):
+    app = _app(cli_setup["db"], set())
+    user = cli_setup["user"]
+
+    listing = crm.parse_args(["contracts", "list", "--format", "jsonl"])
+    update = crm.parse_args(
+        ["contracts", "update", str(cli_setup["contracts"][0].id), "--signed"]
+    )
+
+    assert crm.list_command(app, listing, user) == 1
+    assert crm.update_contracts_command(app, update, user) == 1
+    assert capsys.readouterr().out == ""
+
+
+def test_denied_employees_list_exits_with_1(cli_setup, capsys):
+    app = _app(cli_setup["db"], {"read_client"})
+    listing = crm.parse_args(["employees", "list", "--format", "jsonl"])
+
+    assert crm.list_command(app, listing, cli_setup["user"]) == 1
+    captured = capsys.readouterr()
+    assert captured.out == ""
+    assert "Access denied." in captured.err
@@ -0,0 +1,123 @@
+# tests/test_data_generator.py
+"""
+Unit tests for the synthetic data generator (app/utils/data_generator.py).
+
+Tests included:
+- test_same_seed_same_rows: Generation is deterministic per seed.
+- test_distributions_follow_profile: Skew, signed and payment mixes.
+- test_events_only_for_signed_contracts: Dates inside the window, ordered.
+- test_runs_append_after_existing_rows: A second run grows the dataset.
+- test_generated_employees_can_log_in: Shared password is hashed once.
+"""
+
+from collections import Counter
+from datetime import timedelta
+
+import pytest
+from sqlalchemy import func, select
+
+from app.models import Base
+from app.models.client import Client
+from app.models.contract import Contract
+from app.models.employee import Employee
+from app.models.event import Event
+from app.utils.auth import verify_password
+from app.utils.data_generator import DataGenerator, DatasetProfile
+from config.database import create_db_engine
+
+
+@pytest.fixture
+def engine():
+    """Fresh in-memory database with the CRM schema."""
+    engine = create_db_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+def _rows(engine, model):
+    with engine.connect() as conn:
+        return conn.execute(
+            select(model.__table__).order_by(model.id)
+        ).all()
+
+
+def test_same_seed_same_rows(engine):
+    other = create_db_engine("sqlite://")
+    Base.metadata.create_all(other)
+    profile = DatasetProfile(clients=150)
+
+    DataGenerator(engine, profile, seed=3, batch_size=40).run()
+    DataGenerator(other, profile, seed=3, batch_size=40).run()
+
+    # Every column, audit timestamps and password hashes included
+    for table in Base.metadata.sorted_tables:
+        with engine.connect() as conn, other.connect() as other_conn:
+            query = select(table).order_by(table.c.id)
+            assert conn.execute(query).all() == other_conn.execute(query).all()
+    other.dispose()
+
+
+def test_distributions_follow_profile(engine):
+    profile = DatasetProfile(
+        clients=3000, sales=10, contracts_per_client=1.5, signed_ratio=0.6
+    )
+    counts = DataGenerator(engine, profile, batch_size=700).run()
+
+    assert counts["client"] == 3000
+    assert 4200 < counts["contract"] < 4800
+
+    clients = _rows(engine, Client)
+    per_owner = Counter(c.sales_contact_id for c in clients)
+    ranked = [per_owner[owner] for owner in sorted(per_owner)]
+    assert ranked[0] > 3 * ranked[-1]
+
+    contracts = _rows(engine, Contract)
+    signed = [c for c in contracts if c.is_signed]
+    assert 0.55 < len(signed) / len(contracts) < 0.65
+    assert all(c.remaining_amount == c.total_amount
+               for c in contracts if not c.is_signed)
+    paid = sum(1 for c in signed if c.remaining_amount == 0)
+    partial = sum(
+        1 for c in signed if 0 < c.remaining_amount < c.total_amount
+    )
+    assert 0.35 < paid / len(signed) < 0.45
+    assert 0.35 < partial / len(signed) < 0.45
+
+
+def test_events_only_for_signed_contracts(engine):
+    profile = DatasetProfile(clients=500, span_days=90)
+    counts = DataGenerator(engine, profile).run()
+
+    signed = {c.id for c in _rows(engine, Contract) if c.is_signed}
+    events = _rows(engine, Event)
+    assert len(events) == counts["event"] > 0
+    assert {e.contract_id for e in events} <= signed
+
+    window_end = profile.start + timedelta(days=profile.span_days)
+    for event in events:
+        assert profile.start <= event.event_date_start <= window_end
+        assert event.event_date_end > event.event_date_start
+    unassigned = sum(1 for e in events if e.support_contact_id is None)
+    assert 0 < unassigned < len(events) / 2
+
+
+def test_runs_append_after_existing_rows(engine):
+    DataGenerator(engine, DatasetProfile(clients=50)).run()
+    DataGenerator(engine, DatasetProfile(clients=30), seed=99).run()
+
+    with engine.connect() as conn:
+        assert conn.execute(select(func.count(Client.id))).scalar() == 80
+        assert conn.execute(select(func.max(Client.id))).scalar() == 80
+        staff = conn.execute(select(func.count(Employee.id))).scalar()
+    assert staff == 2 * (20 + 10 + 2)
+
+
+def test_generated_employees_can_log_in(engine):
+    DataGenerator(
+        engine, DatasetProfile(clients=5, sales=3), password="pw-123"
+    ).run()
+
+    hashes = {e.password for e in _rows(engine, Employee)}
+    assert len(hashes) == 1
+    assert verify_password(hashes.pop(), "pw-123")
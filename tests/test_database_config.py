@@ -0,0 +1,136 @@
+# tests/test_database_config.py
+"""
+Unit tests for the central engine factory in config/database.py.
+
+Tests included:
+- test_mysql_engine_uses_configured_pool: Pool knobs come from Config.
+- test_overrides_take_precedence: Keyword overrides reach create_engine.
+- test_timed_pool_records_checkout_latency: Checkout stats and slow log,
+  also after the pool is recreated by dispose().
+- test_get_engine_is_shared: One engine per process until disposed.
+- test_backend_urls: DB_BACKEND selects MySQL, SQLite file or in-memory.
+- test_unknown_backend_is_rejected: Typos in DB_BACKEND fail loudly.
+- test_sqlite_memory_engine_is_shared_and_enforces_fks: One DB, FKs on.
+- test_sqlite_file_engine_uses_wal_and_savepoints: WAL and nested rollback.
+"""
+
+import logging
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.pool import QueuePool, StaticPool
+
+import config.database as database
+from config.config import Config
+from config.database import CheckoutTimer, create_db_engine
+
+MYSQL_URL = "mysql+mysqlconnector://user:pw@localhost:3306/crm"
+
+
+def test_mysql_engine_uses_configured_pool():
+    engine = create_db_engine(MYSQL_URL)
+
+    assert type(engine.pool) is QueuePool
+    assert engine.pool.size() == Config.DB_POOL_SIZE
+    assert engine.pool._max_overflow == Config.DB_MAX_OVERFLOW
+    assert engine.pool._recycle == Config.DB_POOL_RECYCLE
+    assert engine.pool._pre_ping == Config.DB_POOL_PRE_PING
+    assert engine.checkout_timer.warn_ms == Config.DB_POOL_CHECKOUT_WARN_MS
+    engine.dispose()
+
+
+def test_overrides_take_precedence():
+    engine = create_db_engine(MYSQL_URL, pool_size=2, pool_recycle=60)
+
+    assert engine.pool.size() == 2
+    assert engine.pool._recycle == 60
+    engine.dispose()
+
+
+def test_timed_pool_records_checkout_latency(caplog):
+    engine = create_engine("sqlite://", poolclass=QueuePool)
+    timer = CheckoutTimer(warn_ms=0).attach(engine)
+
+    with caplog.at_level(logging.WARNING, logger="config.database"):
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+        engine.dispose()
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+
+    stats = timer.checkout_stats()
+    assert stats["checkouts"] == 2
+    assert stats["max_ms"] >= stats["avg_ms"] >= 0
+    assert "Slow DB pool checkout" in caplog.text
+    engine.dispose()
+
+
+def test_get_engine_is_shared(monkeypatch):
+    created = []
+
+    def fake_factory():
+        engine = create_engine("sqlite://")
+        created.append(engine)
+        return engine
+
+    monkeypatch.setattr(database, "_engine", None)
+    monkeypatch.setattr(database, "create_db_engine", fake_factory)
+
+    first = database.get_engine()
+    assert database.get_engine() is first
+    assert len(created) == 1
+
+    database.dispose_engine()
+    assert database.get_engine() is not first
+    assert len(created) == 2
+
+
+def test_backend_urls(monkeypatch):
+    monkeypatch.setattr(Config, "DB_SQLITE_PATH", "/tmp/crm.db")
+    assert Config.get_db_url("sqlite") == "sqlite:////tmp/crm.db"
+    assert Config.get_async_db_url("sqlite") == "sqlite+aiosqlite:////tmp/crm.db"
+    assert Config.get_db_url("MySQL").startswith("mysql+mysqlconnector://")
+
+    monkeypatch.setattr(Config, "DB_SQLITE_PATH", ":memory:")
+    monkeypatch.setattr(Config, "DB_BACKEND", "sqlite")
+    assert Config.get_db_url() == "sqlite://"
+
+
+def test_unknown_backend_is_rejected():
+    with pytest.raises(ValueError, match="Unsupported DB_BACKEND"):
+        Config.get_db_url("oracle")
+
+
+def test_sqlite_memory_engine_is_shared_and_enforces_fks():
+    engine = create_db_engine("sqlite://")
+    assert isinstance(engine.pool, StaticPool)
+
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE parent (id INTEGER PRIMARY KEY)"))
+        conn.execute(text(
+            "CREATE TABLE child (id INTEGER PRIMARY KEY, "
+            "parent_id INTEGER REFERENCES parent(id))"
+        ))
+
+    # A second connection sees the same in-memory database
+    with engine.connect() as conn:
+        with pytest.raises(IntegrityError):
+            conn.execute(text("INSERT INTO child (parent_id) VALUES (42)"))
+    engine.dispose()
+
+
+def test_sqlite_file_engine_uses_wal_and_savepoints(tmp_path):
+    engine = create_db_engine(f"sqlite:///{tmp_path}/crm.db")
+
+    with engine.begin() as conn:
+        assert conn.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+        conn.execute(text("CREATE TABLE t (v INTEGER)"))
+        conn.execute(text("INSERT INTO t VALUES (1)"))
+        nested = conn.begin_nested()
+        conn.execute(text("INSERT INTO t VALUES (2)"))
+        nested.rollback()
+
+    with engine.connect() as conn:
+        assert conn.execute(text("SELECT v FROM t")).scalars().all() == [1]
+    engine.dispose()
@@ -0,0 +1,205 @@
+# tests/test_eager_loading.py
+"""
+Query-count tests for relationship load profiles and list views.
+Controller listings read column-projection rows; load profiles serve
+the ORM fetches (login, benchmarks of the ORM listing path).
+
+Tests included:
+- test_unknown_profile_raises: Invalid profile names are rejected.
+- test_contract_profile_query_count_is_constant: Relationships eager loaded.
+- test_event_profile_query_count_is_constant: Support contact eager loaded.
+- test_login_profile_loads_department: Login issues a single SELECT.
+- test_contract_listing_query_count_is_constant: 10k contract rows, one query.
+- test_event_listing_query_count_is_constant: 10k event rows, one query.
+- test_employee_listing_query_count_is_constant: Department name, one query.
+"""
+
+from datetime import datetime
+
+import pytest
+from sqlalchemy import insert
+
+from app.controllers.auth_controller import AuthController
+from app.controllers.contract_controller import ContractController
+from app.controllers.employee_controller import EmployeeController
+from app.controllers.event_controller import EventController
+from app.models.client import Client
+from app.models.contract import Contract
+from app.models.department import Department
+from app.models.employee import Employee
+from app.models.event import Event
+from app.repositories.contract_repository import ContractRepository
+from app.repositories.employee_repository import EmployeeRepository
+from app.repositories.event_repository import EventRepository
+from app.utils.auth import hash_password
+from app.views.contract_view import ContractView
+from app.views.employee_view import EmployeeView
+from app.views.event_view import EventView
+from tests.helpers import DummyAuthController
+
+ROW_COUNT = 10_000
+
+
+@pytest.fixture
+def bulk_data(db_session):
+    """Seed 10k contracts and 10k events spread over several owners."""
+    dept = Department(name="BULK")
+    db_session.add(dept)
+    db_session.flush()
+
+    staff = [
+        Employee(
+            full_name=f"Staff {i}",
+            email=f"staff{i}@bulk.com",
+            password="h",
+            employee_number=f"B{i}",
+            department_id=dept.id,
+        )
+        for i in range(20)
+    ]
+    db_session.add_all(staff)
+    db_session.flush()
+
+    clients = [
+        Client(
+            full_name=f"Client {i}",
+            email=f"client{i}@bulk.com",
+            phone="0",
+            company_name="Bulk",
+            sales_contact_id=staff[i % len(staff)].id,
+        )
+        for i in range(50)
+    ]
+    db_session.add_all(clients)
+    db_session.flush()
+
+    contract_rows = [
+        {
+            "total_amount": 100,
+            "remaining_amount": i % 2,
+            "is_signed": bool(i % 3),
+            "client_id": clients[i % len(clients)].id,
+            "sales_contact_id": staff[i % len(staff)].id,
+        }
+        for i in range(ROW_COUNT)
+    ]
+    db_session.execute(insert(Contract), contract_rows)
+    first_contract_id = db_session.query(Contract.id).order_by(
+        Contract.id
+    ).limit(1).scalar()
+
+    now = datetime.now()
+    event_rows = [
+        {
+            "name": f"Event {i}",
+            "event_date_start": now,
+            "event_date_end": now,
+            "location": "L",
+            "attendees": 10,
+            "notes": "N",
+            "client_id": clients[i % len(clients)].id,
+            "contract_id": first_contract_id,
+            "support_contact_id": staff[i % len(staff)].id,
+        }
+        for i in range(ROW_COUNT)
+    ]
+    db_session.execute(insert(Event), event_rows)
+    db_session.commit()
+
+    # Start from an empty identity map so lazy loads would hit the DB
+    db_session.expunge_all()
+    return db_session
+
+
+def test_unknown_profile_raises(db_session):
+    repo = ContractRepository(db_session)
+    with pytest.raises(ValueError):
+        repo.get_all_contracts(profile="does_not_exist")
+
+
+def test_contract_profile_query_count_is_constant(bulk_data, query_profiler):
+    repo = ContractRepository(bulk_data)
+
+    with query_profiler.action("listing") as stats:
+        contracts = repo.get_all_contracts(profile="contract_list")
+        names = [
+            (c.client.full_name, c.sales_contact.full_name)
+            for c in contracts
+        ]
+
+    assert len(names) == ROW_COUNT
+    assert stats.statements == 1
+
+
+def test_event_profile_query_count_is_constant(bulk_data, query_profiler):
+    repo = EventRepository(bulk_data)
+
+    with query_profiler.action("listing") as stats:
+        events = repo.get_all_events(profile="event_list")
+        names = [e.support_contact.full_name for e in events]
+
+    assert len(names) == ROW_COUNT
+    assert stats.statements == 1
+
+
+def test_login_profile_loads_department(db_session, query_profiler):
+    dept = Department(name="LOGIN_PROFILE")
+    db_session.add(dept)
+    db_session.flush()
+    db_session.add(Employee(
+        full_name="Login",
+        email="login@profile.com",
+        password=hash_password("secret123"),
+        employee_number="LP1",
+        department_id=dept.id,
+    ))
+    db_session.commit()
+    auth = AuthController(EmployeeRepository(db_session))
+
+    with query_profiler.action("login") as stats:
+        context = auth.login("login@profile.com", "secret123")
+
+    assert context["department"] == "LOGIN_PROFILE"
+    assert stats.statements == 1
+
+
+def test_contract_listing_query_count_is_constant(bulk_data, query_profiler):
+    ctrl = ContractController(
+        ContractRepository(bulk_data), DummyAuthController()
+    )
+    view = ContractView()
+    user_data = {"id": 1, "department": "MANAGEMENT"}
+
+    with query_profiler.action("listing") as stats:
+        contracts = ctrl.list_all_contracts(user_data=user_data)
+        lines = [view.format_contract(c) for c in contracts]
+
+    assert len(lines) == ROW_COUNT
+    assert stats.statements == 1
+
+
+def test_event_listing_query_count_is_constant(bulk_data, query_profiler):
+    ctrl = EventController(EventRepository(bulk_data), DummyAuthController())
+    view = EventView()
+    user_data = {"id": 1, "department": "MANAGEMENT"}
+
+    with query_profiler.action("listing") as stats:
+        events = ctrl.list_all_events(user_data=user_data)
+        lines = [view.format_event(e) for e in events]
+
+    assert len(lines) == ROW_COUNT
+    assert stats.statements == 1
+
+
+def test_employee_listing_query_count_is_constant(bulk_data, query_profiler, capsys):
+    ctrl = EmployeeController(
+        EmployeeRepository(bulk_data), DummyAuthController()
+    )
+    user_data = {"id": 1, "department": "MANAGEMENT"}
+
+    with query_profiler.action("listing") as stats:
+        employees = ctrl.list_all_employees(user_data=user_data)
+        EmployeeView().display_employees(employees)
+
+    assert "Dept: BULK" in capsys.readouterr().out
+    assert stats.statements == 1
@@ -0,0 +1,123 @@
+# tests/test_indexes.py
+"""
+Unit tests for model-declared indexes and the init_db index report.
+
+Tests included:
+- test_contract_declares_ownership_indexes: Composite sales indexes exist.
+- test_event_declares_support_date_index: (support_contact_id, start) index.
+- test_no_missing_indexes_on_fresh_schema: create_all builds every index.
+- test_missing_index_is_reported_and_created: Drift is detected and fixed.
+- test_index_under_another_name_is_not_missing: Matched by columns.
+- test_wider_index_covers_its_leading_columns: Leading columns suffice.
+"""
+
+from sqlalchemy import Index, MetaData, Table, inspect
+
+from app.models.contract import Contract
+from app.models.event import Event
+from init_db import (
+    create_missing_indexes,
+    find_missing_indexes,
+    report_missing_indexes,
+)
+
+
+def _index_columns(model) -> dict:
+    return {
+        index.name: [column.name for column in index.columns]
+        for index in model.__table__.indexes
+    }
+
+
+def test_contract_declares_ownership_indexes():
+    indexes = _index_columns(Contract)
+
+    assert indexes["ix_contract_sales_signed"] == [
+        "sales_contact_id", "is_signed"
+    ]
+    assert indexes["ix_contract_sales_remaining"] == [
+        "sales_contact_id", "remaining_amount"
+    ]
+
+
+def test_event_declares_support_date_index():
+    indexes = _index_columns(Event)
+
+    assert indexes["ix_event_support_start"] == [
+        "support_contact_id", "event_date_start"
+    ]
+
+
+def test_no_missing_indexes_on_fresh_schema(db_engine):
+    assert find_missing_indexes(db_engine) == []
+
+
+def test_missing_index_is_reported_and_created(db_engine, capsys):
+    index = next(
+        i for i in Contract.__table__.indexes
+        if i.name == "ix_contract_is_signed"
+    )
+    index.drop(db_engine)
+
+    missing = find_missing_indexes(db_engine)
+    report_missing_indexes(missing)
+    assert [i.name for i in missing] == ["ix_contract_is_signed"]
+    assert "Missing index: ix_contract_is_signed" in capsys.readouterr().out
+
+    created = create_missing_indexes(db_engine)
+    names = {i["name"] for i in inspect(db_engine).get_indexes("contract")}
+
+    assert [i.name for i in created] == ["ix_contract_is_signed"]
+    assert "ix_contract_is_signed" in names
+
+
+
+def _swap_for_unnamed_index(db_engine, name, columns):
+    """
+    Drop a model index and build another index, under a name the models
+    do not know (like the ones MySQL creates for foreign keys).
+    Returns a callable restoring the original index.
+    """
+    index = next(i for i in Contract.__table__.indexes if i.name == name)
+    index.drop(db_engine)
+    # Built on a reflected copy so the model table does not declare it
+    reflected = Table("contract", MetaData(), autoload_with=db_engine)
+    unnamed = Index(
+        "fk_contract_auto", *(reflected.c[column] for column in columns)
+    )
+    unnamed.create(db_engine)
+
+    def restore():
+        unnamed.drop(db_engine)
+        index.create(db_engine)
+
+    return restore
+
+
+def test_index_under_another_name_is_not_missing(db_engine):
+    restore = _swap_for_unnamed_index(
+        db_engine, "ix_contract_is_signed", ["is_signed"]
+    )
+    try:
+        assert find_missing_indexes(db_engine) == []
+    finally:
+        restore()
+
+
+def test_wider_index_covers_its_leading_columns(db_engine):
+    restore = _swap_for_unnamed_index(
+        db_engine, "ix_contract_is_signed", ["is_signed", "client_id"]
+    )
+    try:
+        assert find_missing_indexes(db_engine) == []
+    finally:
+        restore()
+
+    restore = _swap_for_unnamed_index(
+        db_engine, "ix_contract_is_signed", ["client_id", "is_signed"]
+    )
+    try:
+        missing = find_missing_indexes(db_engine)
+        assert [i.name for i in missing] == ["ix_contract_is_signed"]
+    finally:
+        restore()
@@ -0,0 +1,202 @@
+# tests/test_instrumentation.py
+"""
+Unit tests for the SQL instrumentation hooks (app/utils/instrumentation.py).
+
+Tests included:
+- test_action_counts_statements_and_rows: One SELECT, no cursor swap.
+- test_buffered_select_rows_are_counted: SELECT rows from the rowcount.
+- test_writes_count_affected_rows: DML rowcounts; BEGIN/SAVEPOINT ignored.
+- test_statements_outside_actions_are_idle: Unscoped SQL has its bucket.
+- test_slowest_statements_are_kept: Top N statements, slowest first.
+- test_slow_statements_become_sentry_spans: Threshold creates spans.
+- test_detach_stops_recording: Listeners are removed on exit.
+- test_profilers_share_an_engine: Two attached profilers both record.
+- test_profile_view_prints_action_and_summary: --profile output.
+"""
+
+import uuid
+from types import SimpleNamespace
+
+from sqlalchemy import select, text
+
+from app.models.client import Client
+from app.models.department import Department
+from app.models.employee import Employee
+from app.repositories.client_repository import ClientRepository
+from app.utils import instrumentation
+from app.utils.instrumentation import IDLE_ACTION, QueryProfiler
+from app.views.profile_view import ProfileView
+
+
+def _seed_clients(db_session, count):
+    dept = Department(name=f"INS_{uuid.uuid4().hex[:6]}")
+    db_session.add(dept)
+    db_session.flush()
+    sales = Employee(
+        full_name="Sales",
+        email=f"ins_{uuid.uuid4().hex[:6]}@t.com",
+        password="h",
+        employee_number=f"I{uuid.uuid4().hex[:6]}",
+        department_id=dept.id,
+    )
+    db_session.add(sales)
+    db_session.flush()
+    db_session.add_all(
+        Client(
+            full_name=f"Client {i}",
+            email=f"ins{i}_{uuid.uuid4().hex[:6]}@t.com",
+            phone="0",
+            company_name="C",
+            sales_contact_id=sales.id,
+        )
+        for i in range(count)
+    )
+    db_session.commit()
+    return sales
+
+
+def test_action_counts_statements_and_rows(db_session, query_profiler):
+    _seed_clients(db_session, 25)
+    repo = ClientRepository(db_session)
+
+    with query_profiler.action("list clients") as stats:
+        rows = repo.get_all_clients(rows=True)
+
+    assert len(rows) == 25
+    assert stats.statements == 1
+    # SQLite does not report a rowcount for SELECTs
+    assert stats.rows == 0
+    assert stats.total_ms > 0
+    assert query_profiler.actions == [stats]
+
+
+def test_buffered_select_rows_are_counted(db_engine):
+    # mysql-connector's buffered cursor knows its row count on execute
+    cursor = SimpleNamespace(rowcount=25, description=(("id",),))
+    conn = SimpleNamespace(info={})
+    statement = "SELECT id FROM clients"
+
+    with QueryProfiler(db_engine) as profiler:
+        with profiler.action("list clients") as stats:
+            profiler._before(conn, cursor, statement, (), None, False)
+            profiler._after(conn, cursor, statement, (), None, False)
+
+    assert stats.statements == 1
+    assert stats.rows == 25
+
+
+def test_writes_count_affected_rows(db_session, query_profiler):
+    _seed_clients(db_session, 5)
+    repo = ClientRepository(db_session)
+    ids = [c.id for c in db_session.query(Client)]
+
+    with query_profiler.action("bulk update") as stats:
+        repo.bulk_update(ids, {"phone": "1"})
+
+    assert stats.statements == 1
+    assert stats.rows == 5
+
+
+def test_statements_outside_actions_are_idle(db_session, query_profiler):
+    db_session.execute(select(Client.id)).all()
+
+    assert query_profiler.actions == []
+    assert query_profiler.idle.name == IDLE_ACTION
+    assert query_profiler.idle.statements == 1
+
+
+def test_slowest_statements_are_kept(db_engine):
+    with QueryProfiler(db_engine, keep_slowest=2) as profiler:
+        with db_engine.connect() as conn, profiler.action("many") as stats:
+            for i in range(5):
+                conn.execute(text(f"SELECT {i}"))
+
+    assert stats.statements == 5
+    slowest = stats.slowest
+    assert len(slowest) == 2
+    assert slowest[0][0] >= slowest[1][0]
+    assert all(statement.startswith("SELECT") for _, statement in slowest)
+
+
+def test_slow_statements_become_sentry_spans(db_engine, monkeypatch):
+    recorded = []
+
+    class RecordingSpan:
+        # Sentry's own SQLAlchemy integration also opens spans
+        def __init__(self, **kwargs):
+            self.kwargs = kwargs
+            self.data = {}
+            recorded.append(self)
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc):
+            return False
+
+        def __getattr__(self, name):
+            return lambda *args, **kwargs: None
+
+        def set_data(self, key, value):
+            self.data[key] = value
+
+        def finish(self, *args, **kwargs):
+            self.finished = True
+
+    monkeypatch.setattr(
+        instrumentation.sentry_sdk, "start_span", RecordingSpan
+    )
+
+    with QueryProfiler(db_engine, slow_ms=0) as profiler:
+        with db_engine.connect() as conn, profiler.action("slow"):
+            conn.execute(text("SELECT 1"))
+    with QueryProfiler(db_engine, slow_ms=60_000) as profiler:
+        with db_engine.connect() as conn, profiler.action("fast"):
+            conn.execute(text("SELECT 2"))
+
+    spans = [s for s in recorded if s.kwargs.get("op") == "db.sql.slow"]
+    assert len(spans) == 1
+    assert spans[0].kwargs["op"] == "db.sql.slow"
+    assert spans[0].kwargs["name"] == "SELECT 1"
+    assert "db.duration_ms" in spans[0].data
+    assert spans[0].finished
+
+
+def test_detach_stops_recording(db_engine):
+    profiler = QueryProfiler(db_engine)
+    with profiler:
+        pass
+
+    with db_engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+
+    assert profiler.idle.statements == 0
+
+
+def test_profilers_share_an_engine(db_engine):
+    with QueryProfiler(db_engine) as outer, QueryProfiler(db_engine) as inner:
+        with db_engine.connect() as conn:
+            with outer.action("outer") as outer_stats:
+                with inner.action("inner") as inner_stats:
+                    conn.execute(text("SELECT 1")).all()
+                    conn.execute(text("SELECT 2")).all()
+
+    assert outer_stats.statements == 2
+    assert inner_stats.statements == 2
+    assert inner_stats.rows == outer_stats.rows
+
+
+def test_profile_view_prints_action_and_summary(db_engine, capsys):
+    with QueryProfiler(db_engine) as profiler:
+        with db_engine.connect() as conn, profiler.action("menu 1") as stats:
+            conn.execute(text("SELECT 1")).all()
+
+    view = ProfileView()
+    view.display_action(stats)
+    view.display_summary(profiler.actions)
+
+    out = capsys.readouterr().out
+    assert "menu 1: 1 statement(s)" in out
+    assert f"{stats.rows} row(s)" in out
+    assert "SELECT 1" in out
+    assert "1 action(s): 1 statement(s)" in out
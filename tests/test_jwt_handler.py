@@ -6,11 +6,25 @@ Tests included:
 - test_create_and_decode_valid_token: Verify generation and decoding.
 - test_decode_invalid_token: Ensure invalid strings return None.
 - test_expired_token: Verify expiration logic returns None.
+- test_decoded_token_is_cached: Signature verified once per token.
+- test_token_cache_expiry_and_lru: Strict eviction at exp and LRU bound.
+- test_logout_evicts_cached_token: Logout drops the cached claims.
+- test_token_cache_is_thread_safe: Concurrent decodes stay consistent.
 """
 
 import datetime
+from concurrent.futures import ThreadPoolExecutor
+
 import jwt
-from app.utils.jwt_handler import create_token, decode_token, SECRET_KEY, ALGORITHM
+from app.utils.jwt_handler import (
+    ALGORITHM,
+    SECRET_KEY,
+    TokenCache,
+    create_token,
+    decode_token,
+    token_cache,
+)
+from app.utils.token_storage import save_token
 
 
 def test_create_and_decode_valid_token():
@@ -39,4 +53,76 @@ def test_expired_token():
     expired_token = jwt.encode(payload, SECRET_KEY, algorithm=ALGORITHM)
 
     decoded = decode_token(expired_token)
-    assert decoded is None
\ No newline at end of file
+    assert decoded is None
+
+def test_decoded_token_is_cached(monkeypatch):
+    """A valid token is verified once, and callers get their own copy."""
+    from app.utils import jwt_handler
+
+    token_cache.clear()
+    token = create_token(1, "Management")
+    calls = []
+    real_decode = jwt_handler.jwt.decode
+
+    def counting_decode(*args, **kwargs):
+        calls.append(args[0])
+        return real_decode(*args, **kwargs)
+
+    monkeypatch.setattr(jwt_handler.jwt, "decode", counting_decode)
+
+    first = decode_token(token)
+    first["department"] = "Tampered"
+    second = decode_token(token)
+
+    assert len(calls) == 1
+    assert second["department"] == "Management"
+
+
+def test_token_cache_expiry_and_lru(monkeypatch):
+    """Entries are evicted at `exp` and beyond maxsize, oldest first."""
+    from app.utils import jwt_handler
+
+    now = {"t": 1000.0}
+    monkeypatch.setattr(jwt_handler.time, "time", lambda: now["t"])
+    cache = TokenCache(maxsize=2)
+
+    cache.put("a", {"id": 1, "exp": 1010})
+    cache.put("b", {"id": 2, "exp": 2000})
+    cache.put("no-exp", {"id": 3})
+    assert cache.get("a") == {"id": 1, "exp": 1010}
+
+    cache.put("c", {"id": 4, "exp": 2000})
+    assert cache.get("b") is None
+    assert len(cache) == 2
+
+    now["t"] = 1010.0
+    assert cache.get("a") is None
+    assert cache.get("c") is not None
+    assert len(cache) == 1
+
+
+def test_logout_evicts_cached_token(monkeypatch):
+    """After logout the stored token is verified again."""
+    from app.controllers.auth_controller import AuthController
+
+    token = create_token(1, "Management")
+    save_token(token)
+    decode_token(token)
+    assert token_cache.get(token) is not None
+
+    AuthController(None).logout()
+
+    assert token_cache.get(token) is None
+
+
+def test_token_cache_is_thread_safe():
+    """Concurrent decodes of many tokens return consistent claims."""
+    tokens = [create_token(i, "Sales") for i in range(20)]
+
+    def decode_all(_):
+        return [decode_token(t)["id"] for t in tokens * 5]
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(decode_all, range(8)))
+
+    assert all(ids == list(range(20)) * 5 for ids in results)
@@ -0,0 +1,112 @@
+# tests/test_keyset_pagination.py
+"""
+Unit tests for keyset (cursor) pagination.
+
+Tests included:
+- test_iter_pages_returns_every_row_once_in_order: Pages cover the table.
+- test_get_page_starts_after_cursor: Only ids greater than after_id are returned.
+- test_count_with_criteria: Total-count hint honours filter criteria.
+- test_paginate_clients_denied_returns_none: Permission check is enforced.
+- test_paginate_clients_allowed_returns_total_and_pages: Controller output.
+- test_display_pages_stops_when_user_quits: View only pulls requested pages.
+"""
+
+import pytest
+
+from app.controllers.client_controller import ClientController
+from app.models.client import Client
+from app.repositories.client_repository import ClientRepository
+from app.views.client_view import ClientView
+from tests.helpers import DummyAuthController
+
+
+@pytest.fixture
+def seeded_clients(db_session):
+    """Insert a handful of clients for pagination tests."""
+    clients = [
+        Client(
+            full_name=f"Client {i}",
+            email=f"page{i}@test.com",
+            phone=f"0600{i}",
+            company_name="Paged" if i % 2 else "Other",
+        )
+        for i in range(7)
+    ]
+    db_session.add_all(clients)
+    db_session.commit()
+    return clients
+
+
+def test_iter_pages_returns_every_row_once_in_order(db_session, seeded_clients):
+    """Pages are contiguous, ordered by id and never overlap."""
+    repo = ClientRepository(db_session)
+
+    pages = list(repo.iter_pages(page_size=3))
+    ids = [c.id for page in pages for c in page]
+
+    assert [len(page) for page in pages] == [3, 3, 1]
+    assert ids == sorted(c.id for c in seeded_clients)
+
+
+def test_get_page_starts_after_cursor(db_session, seeded_clients):
+    """A page only contains rows strictly after the given cursor."""
+    repo = ClientRepository(db_session)
+    cursor = seeded_clients[2].id
+
+    page = repo.get_page(after_id=cursor, page_size=2)
+
+    assert [c.id for c in page] == [
+        seeded_clients[3].id,
+        seeded_clients[4].id,
+    ]
+
+
+def test_count_with_criteria(db_session, seeded_clients):
+    """count() applies the same criteria as the paginated query."""
+    repo = ClientRepository(db_session)
+
+    assert repo.count() == 7
+    assert repo.count((Client.company_name == "Paged",)) == 3
+
+
+def test_paginate_clients_denied_returns_none(db_session):
+    auth = DummyAuthController(allowed=set())
+    ctrl = ClientController(ClientRepository(db_session), auth)
+
+    out = ctrl.paginate_clients(user_data={"id": 1, "department": "SUPPORT"})
+    assert out is None
+
+
+def test_paginate_clients_allowed_returns_total_and_pages(
+    db_session, seeded_clients
+):
+    auth = DummyAuthController(allowed={"read_client"})
+    ctrl = ClientController(ClientRepository(db_session), auth)
+
+    total, pages = ctrl.paginate_clients(
+        user_data={"id": 1, "department": "SALES"}, page_size=5
+    )
+
+    assert total == 7
+    assert [len(page) for page in pages] == [5, 2]
+
+
+def test_display_pages_stops_when_user_quits(
+    db_session, seeded_clients, monkeypatch, capsys
+):
+    """Quitting after the first page prevents further page queries."""
+    repo = ClientRepository(db_session)
+    fetched = []
+
+    def tracked_pages():
+        for page in repo.iter_pages(page_size=2):
+            fetched.append(page)
+            yield page
+
+    monkeypatch.setattr("builtins.input", lambda _prompt: "q")
+    ClientView().display_client_pages(tracked_pages(), total=7)
+
+    out = capsys.readouterr().out
+    assert "Total: 7" in out
+    assert len(fetched) == 1
+    assert out.count("ID: ") == 2
@@ -0,0 +1,141 @@
+# tests/test_listing_rows.py
+"""
+Unit tests for column-projection listing rows.
+
+Tests included:
+- test_rows_use_slots: Row types carry no instance __dict__.
+- test_contract_rows_include_related_names: Joined names are flattened.
+- test_event_rows_without_support: Missing support contact yields None.
+- test_employee_rows_exclude_password: Password hash is never projected.
+- test_row_pages_and_stream_match_list: All row access paths agree.
+- test_controller_listing_returns_rows: Controllers do not hydrate models.
+"""
+
+import uuid
+from datetime import datetime
+
+import pytest
+
+from app.controllers.contract_controller import ContractController
+from app.models.client import Client
+from app.models.contract import Contract
+from app.models.department import Department
+from app.models.employee import Employee
+from app.models.event import Event
+from app.repositories.contract_repository import ContractRepository
+from app.repositories.employee_repository import EmployeeRepository
+from app.repositories.event_repository import EventRepository
+from app.repositories.rows import ClientRow, ContractRow, EmployeeRow
+from tests.helpers import DummyAuthController
+
+
+@pytest.fixture
+def rows_setup(db_session):
+    """One sales person, one client, several contracts and an event."""
+    dept = Department(name=f"ROWS_{uuid.uuid4().hex[:6]}")
+    db_session.add(dept)
+    db_session.flush()
+
+    sales = Employee(
+        full_name="Row Sales",
+        email=f"rows_{uuid.uuid4().hex[:6]}@t.com",
+        password="secret-hash",
+        employee_number=f"R{uuid.uuid4().hex[:6]}",
+        department_id=dept.id,
+    )
+    db_session.add(sales)
+    db_session.flush()
+
+    client = Client(
+        full_name="Row Client",
+        email=f"rowc_{uuid.uuid4().hex[:6]}@t.com",
+        phone="0",
+        company_name="Rows",
+        sales_contact_id=sales.id,
+    )
+    db_session.add(client)
+    db_session.flush()
+
+    contracts = [
+        Contract(
+            total_amount=100 * (i + 1),
+            remaining_amount=10,
+            is_signed=True,
+            client_id=client.id,
+            sales_contact_id=sales.id,
+        )
+        for i in range(5)
+    ]
+    db_session.add_all(contracts)
+    db_session.flush()
+
+    db_session.add(Event(
+        name="Unassigned",
+        event_date_start=datetime.now(),
+        event_date_end=datetime.now(),
+        location="L",
+        attendees=5,
+        notes="N",
+        client_id=client.id,
+        contract_id=contracts[0].id,
+        support_contact_id=None,
+    ))
+    db_session.commit()
+
+    return {"db": db_session, "sales": sales, "dept": dept}
+
+
+def test_rows_use_slots():
+    row = ClientRow(1, "A", "a@t.com", "0", "C", None, None)
+
+    assert not hasattr(row, "__dict__")
+    assert row.as_dict()["full_name"] == "A"
+
+
+def test_contract_rows_include_related_names(rows_setup):
+    rows = ContractRepository(rows_setup["db"]).get_all_contracts(rows=True)
+
+    assert len(rows) == 5
+    assert all(isinstance(r, ContractRow) for r in rows)
+    assert rows[0].client_name == "Row Client"
+    assert rows[0].sales_contact_name == "Row Sales"
+
+
+def test_event_rows_without_support(rows_setup):
+    rows = EventRepository(rows_setup["db"]).get_events_without_support(
+        rows=True
+    )
+
+    assert [r.name for r in rows] == ["Unassigned"]
+    assert rows[0].support_name is None
+
+
+def test_employee_rows_exclude_password(rows_setup):
+    rows = EmployeeRepository(rows_setup["db"]).get_all_employees(rows=True)
+
+    assert isinstance(rows[0], EmployeeRow)
+    assert rows[0].department_name == rows_setup["dept"].name
+    assert "password" not in rows[0].as_dict()
+
+
+def test_row_pages_and_stream_match_list(rows_setup):
+    repo = ContractRepository(rows_setup["db"])
+
+    listed = repo.get_all_contracts(rows=True)
+    paged = [r for page in repo.iter_pages(page_size=2, rows=True) for r in page]
+    streamed = list(repo.stream_all_contracts(rows=True))
+
+    assert listed == paged == streamed
+
+
+def test_controller_listing_returns_rows(rows_setup):
+    sales = rows_setup["sales"]
+    auth = DummyAuthController(allowed={"read_contract"})
+    ctrl = ContractController(ContractRepository(rows_setup["db"]), auth)
+
+    rows = ctrl.list_unpaid_contracts(
+        user_data={"id": sales.id, "department": "SALES"}
+    )
+
+    assert len(rows) == 5
+    assert all(isinstance(r, ContractRow) for r in rows)
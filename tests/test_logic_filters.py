@@ -7,6 +7,9 @@ Tests included:
 - test_filter_events_without_support: Verify events with support_contact_id=None are returned.
 - test_filter_unsigned_contracts: Verify only is_signed=False contracts are returned.
 - test_filter_my_events: Verify support agents only see their assigned events.
+- test_filter_contracts_by_owner: Verify owner_id scoping runs in SQL.
+- test_filter_contracts_by_department: Verify department scoping.
+- test_filter_contracts_ordering: Verify named orderings and validation.
 """
 
 import uuid
@@ -149,4 +152,75 @@ def test_filter_my_events(filter_setup):
     ))
 
     my_events = repo.get_my_events(support_id)
-    assert all(e.support_contact_id == support_id for e in my_events)
\ No newline at end of file
+    assert all(e.support_contact_id == support_id for e in my_events)
+
+
+@pytest.fixture
+def owned_contracts(filter_setup):
+    """Add a second sales person from another department with contracts."""
+    db = filter_setup["db"]
+    other_dept = Department(name=f"OTHER_{uuid.uuid4().hex[:6]}")
+    db.add(other_dept)
+    db.flush()
+    other_sales = Employee(
+        full_name="Other Sales",
+        email=f"o_{uuid.uuid4().hex[:6]}@test.com",
+        password="h",
+        employee_number=f"O{uuid.uuid4().hex[:4]}",
+        department_id=other_dept.id
+    )
+    db.add(other_sales)
+    db.flush()
+
+    repo = filter_setup["contract_repo"]
+    client_id = filter_setup["client"].id
+    for owner, remaining in (
+        (filter_setup["sales"], 300),
+        (filter_setup["sales"], 100),
+        (other_sales, 200),
+    ):
+        repo.add(Contract(
+            total_amount=1000, remaining_amount=remaining, is_signed=False,
+            client_id=client_id, sales_contact_id=owner.id
+        ))
+
+    filter_setup["other_sales"] = other_sales
+    filter_setup["other_dept"] = other_dept
+    return filter_setup
+
+
+def test_filter_contracts_by_owner(owned_contracts):
+    """Verify only the owner's unsigned contracts are returned."""
+    repo = owned_contracts["contract_repo"]
+    sales_id = owned_contracts["sales"].id
+
+    unsigned = repo.get_unsigned_contracts(owner_id=sales_id)
+    streamed = list(repo.stream_unsigned_contracts(owner_id=sales_id))
+
+    assert len(unsigned) == 2
+    assert all(c.sales_contact_id == sales_id for c in unsigned)
+    assert [c.id for c in streamed] == [c.id for c in unsigned]
+
+
+def test_filter_contracts_by_department(owned_contracts):
+    """Verify department scoping keeps only that department's contracts."""
+    repo = owned_contracts["contract_repo"]
+    other_id = owned_contracts["other_sales"].id
+
+    unpaid = repo.get_unpaid_contracts(
+        rows=True, department_id=owned_contracts["other_dept"].id
+    )
+
+    assert [c.sales_contact_id for c in unpaid] == [other_id]
+
+
+def test_filter_contracts_ordering(owned_contracts):
+    """Verify named orderings and rejection of unknown ones."""
+    repo = owned_contracts["contract_repo"]
+
+    ordered = repo.get_unpaid_contracts(rows=True, order_by="remaining_desc")
+    amounts = [c.remaining_amount for c in ordered]
+    assert amounts == sorted(amounts, reverse=True)
+
+    with pytest.raises(ValueError):
+        repo.get_unpaid_contracts(order_by="random")
@@ -0,0 +1,141 @@
+# tests/test_password_service.py
+"""
+Unit tests for the bounded Argon2 PasswordService.
+
+Tests included:
+- test_hash_and_verify_on_pool: Jobs run on the pool and are counted.
+- test_workers_bound_running_jobs: Extra jobs wait, waits are measured.
+- test_pending_jobs_are_bounded: Callers block when the queue is full.
+- test_verify_and_update_detects_old_parameters: check_needs_rehash.
+- test_login_migrates_outdated_hash: The new hash is stored at login.
+- test_hash_async: Hashing from a coroutine.
+"""
+
+import asyncio
+import threading
+import uuid
+
+import pytest
+from argon2 import PasswordHasher
+
+from app.controllers import auth_controller as auth_mod
+from app.controllers.auth_controller import AuthController
+from app.models.department import Department
+from app.models.employee import Employee
+from app.repositories.employee_repository import EmployeeRepository
+from app.utils.auth import PasswordService, set_password_service
+
+
+def _cheap_hasher(time_cost: int = 1) -> PasswordHasher:
+    return PasswordHasher(time_cost=time_cost, memory_cost=8192, parallelism=1)
+
+
+@pytest.fixture
+def service():
+    svc = PasswordService(_cheap_hasher(), workers=2, max_pending=4)
+    yield svc
+    svc.close()
+
+
+def test_hash_and_verify_on_pool(service):
+    hashed = service.hash("secret")
+
+    assert service.verify_and_update(hashed, "secret") == (True, None)
+    assert service.verify_and_update(hashed, "wrong") == (False, None)
+    assert service.verify_and_update("not-a-hash", "secret") == (False, None)
+
+    metrics = service.metrics()
+    assert metrics["submitted"] == metrics["completed"] == 4
+    assert metrics["queued"] == metrics["running"] == 0
+    assert metrics["workers"] == 2
+
+
+def test_workers_bound_running_jobs(service):
+    release = threading.Event()
+    futures = [service._submit(release.wait) for _ in range(4)]
+
+    try:
+        for _ in range(100):
+            if service.metrics()["running"] == 2:
+                break
+            threading.Event().wait(0.01)
+        metrics = service.metrics()
+        assert (metrics["running"], metrics["queued"]) == (2, 2)
+        assert metrics["peak_queued"] >= 2
+    finally:
+        release.set()
+
+    for future in futures:
+        future.result(timeout=5)
+    metrics = service.metrics()
+    assert metrics["completed"] == 4
+    assert metrics["max_wait_ms"] > 0
+
+
+def test_pending_jobs_are_bounded():
+    svc = PasswordService(_cheap_hasher(), workers=1, max_pending=1)
+    release = threading.Event()
+    svc._submit(release.wait)
+    svc._submit(release.wait)
+
+    third = threading.Thread(target=svc._submit, args=(release.wait,))
+    third.start()
+    third.join(timeout=0.2)
+    assert third.is_alive()
+
+    release.set()
+    third.join(timeout=5)
+    assert not third.is_alive()
+    svc.close()
+    assert svc.metrics()["completed"] == 3
+
+
+def test_verify_and_update_detects_old_parameters():
+    old_hash = _cheap_hasher(time_cost=1).hash("secret")
+    svc = PasswordService(_cheap_hasher(time_cost=2), workers=1)
+
+    valid, new_hash = svc.verify_and_update(old_hash, "secret")
+    assert valid is True
+    assert new_hash is not None
+    assert not svc.hasher.check_needs_rehash(new_hash)
+    assert svc.verify_and_update(new_hash, "secret") == (True, None)
+    assert svc.metrics()["rehashed"] == 1
+    svc.close()
+
+
+def test_login_migrates_outdated_hash(db_session, monkeypatch):
+    monkeypatch.setattr(auth_mod, "save_token", lambda _t: None)
+    set_password_service(
+        PasswordService(_cheap_hasher(time_cost=2), workers=1)
+    )
+    try:
+        dept = Department(name=f"PWD_{uuid.uuid4().hex[:6]}")
+        db_session.add(dept)
+        db_session.flush()
+        emp = Employee(
+            full_name="Rehash User",
+            email=f"rehash_{uuid.uuid4().hex[:6]}@t.com",
+            password=_cheap_hasher(time_cost=1).hash("secret123"),
+            employee_number=f"R{uuid.uuid4().hex[:6]}",
+            department_id=dept.id,
+        )
+        db_session.add(emp)
+        db_session.commit()
+        old_hash = emp.password
+
+        auth = AuthController(EmployeeRepository(db_session))
+        assert auth.login(emp.email, "secret123") is not None
+
+        db_session.refresh(emp)
+        assert emp.password != old_hash
+        assert "t=2" in emp.password
+        assert auth.login(emp.email, "wrong") is None
+        assert auth.login(emp.email, "secret123") is not None
+    finally:
+        set_password_service(None)
+
+
+def test_hash_async(service):
+    hashed = asyncio.run(service.hash_async("secret"))
+
+    assert service.verify_and_update(hashed, "secret") == (True, None)
@@ -7,11 +7,31 @@ Tests included:
 - test_sales_permissions: Validate allowed and restricted actions for SALES.
 - test_support_permissions: Validate allowed and restricted actions for SUPPORT.
 - test_unknown_department_permissions: Ensure unknown departments have no access.
+- test_permissions_compiled_to_frozensets: Tables are immutable sets.
+- test_repeated_denials_are_rate_limited: One Sentry report per window.
+- test_denial_report_counts_suppressed_repeats: Next report has the count.
 """
 
+import pytest
+
+from app.utils import permissions
 from app.utils.permissions import has_permission
 
 
+@pytest.fixture
+def captured_messages(monkeypatch):
+    """Capture Sentry denial messages and start with a clean rate limit."""
+    messages = []
+    permissions.reset_denial_reports()
+    monkeypatch.setattr(
+        permissions.sentry_sdk,
+        "capture_message",
+        lambda message, level=None: messages.append(message),
+    )
+    yield messages
+    permissions.reset_denial_reports()
+
+
 def test_management_permissions():
     """Verify that MANAGEMENT has all its assigned permissions."""
     dept = "MANAGEMENT"
@@ -44,4 +64,39 @@ def test_support_permissions():
 
 def test_unknown_department_permissions():
     """Ensure that a non-existent department has no permissions."""
-    assert has_permission("read_client", "GHOST_DEPT") is False
\ No newline at end of file
+    assert has_permission("read_client", "GHOST_DEPT") is False
+
+
+def test_permissions_compiled_to_frozensets():
+    """Verify compiled tables mirror PERMISSIONS as frozensets."""
+    for dept, actions in permissions.PERMISSIONS.items():
+        compiled = permissions.permissions_for(dept)
+        assert isinstance(compiled, frozenset)
+        assert compiled == set(actions)
+    assert permissions.permissions_for("GHOST_DEPT") == frozenset()
+
+
+def test_repeated_denials_are_rate_limited(captured_messages):
+    """Verify a burst of identical denials produces a single report."""
+    for _ in range(1000):
+        assert has_permission("delete_employee", "SUPPORT") is False
+
+    assert len(captured_messages) == 1
+    assert "SUPPORT" in captured_messages[0]
+
+
+def test_denial_report_counts_suppressed_repeats(
+    captured_messages, monkeypatch
+):
+    """Verify the next report after the window mentions suppressed ones."""
+    has_permission("create_client", "SUPPORT")
+    has_permission("create_client", "SUPPORT")
+    has_permission("create_client", "SUPPORT")
+    # A different pair is reported independently
+    has_permission("create_client", "MANAGEMENT")
+
+    monkeypatch.setattr(permissions, "DENIAL_REPORT_INTERVAL", 0.0)
+    has_permission("create_client", "SUPPORT")
+
+    assert len(captured_messages) == 3
+    assert "(2 similar denials suppressed)" in captured_messages[-1]
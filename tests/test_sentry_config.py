@@ -0,0 +1,91 @@
+# tests/test_sentry_config.py
+"""
+Unit tests for the Sentry initialisation and sampling (config/sentry.py).
+
+Tests included:
+- test_no_dsn_skips_init: Without a DSN, sentry_sdk.init is never called.
+- test_init_uses_sampler_and_profile_rate: Configured rates are passed.
+- test_sampler_prefers_writes_and_audit: Write ops use the higher rate.
+- test_sampler_follows_parent_decision: Distributed traces stay whole.
+- test_profiler_actions_carry_op: Action ops reach the transaction.
+"""
+
+from sqlalchemy import text
+
+import config.sentry as sentry_config
+from app.utils import instrumentation
+from app.utils.instrumentation import QueryProfiler
+from config.config import Config
+
+
+def _context(op, parent_sampled=None):
+    return {
+        "transaction_context": {"op": op, "name": "menu 1"},
+        "parent_sampled": parent_sampled,
+    }
+
+
+def test_no_dsn_skips_init(monkeypatch):
+    calls = []
+    monkeypatch.setattr(Config, "SENTRY_DSN", None)
+    monkeypatch.setattr(
+        sentry_config.sentry_sdk, "init", lambda **kw: calls.append(kw)
+    )
+
+    assert sentry_config.init_sentry() is False
+    assert calls == []
+
+
+def test_init_uses_sampler_and_profile_rate(monkeypatch):
+    calls = []
+    monkeypatch.setattr(Config, "SENTRY_PROFILES_SAMPLE_RATE", 0.25)
+    monkeypatch.setattr(Config, "SENTRY_ENVIRONMENT", "production")
+    monkeypatch.setattr(
+        sentry_config.sentry_sdk, "init", lambda **kw: calls.append(kw)
+    )
+
+    assert sentry_config.init_sentry("https://key@example.com/1") is True
+
+    options = calls[0]
+    assert options["traces_sampler"] is sentry_config.traces_sampler
+    assert options["profiles_sample_rate"] == 0.25
+    assert options["environment"] == "production"
+    assert "traces_sample_rate" not in options
+
+
+def test_sampler_prefers_writes_and_audit(monkeypatch):
+    monkeypatch.setattr(Config, "SENTRY_TRACES_SAMPLE_RATE", 0.01)
+    monkeypatch.setattr(Config, "SENTRY_WRITE_TRACES_SAMPLE_RATE", 0.2)
+    sampler = sentry_config.traces_sampler
+
+    assert sampler(_context("cli.read")) == 0.01
+    assert sampler(_context("cli.write")) == 0.2
+    assert sampler(_context("cli.audit")) == 0.2
+    assert sampler({}) == 0.01
+
+
+def test_sampler_follows_parent_decision():
+    sampler = sentry_config.traces_sampler
+
+    assert sampler(_context("cli.read", parent_sampled=True)) == 1.0
+    assert sampler(_context("cli.write", parent_sampled=False)) == 0.0
+
+
+def test_profiler_actions_carry_op(db_engine, monkeypatch):
+    started = []
+    real_start = instrumentation.sentry_sdk.start_transaction
+
+    def recording_start(**kwargs):
+        started.append(kwargs)
+        return real_start(**kwargs)
+
+    monkeypatch.setattr(
+        instrumentation.sentry_sdk, "start_transaction", recording_start
+    )
+
+    with QueryProfiler(db_engine) as profiler:
+        with db_engine.connect() as conn:
+            with profiler.action("menu 20", op="cli.write"):
+                conn.execute(text("SELECT 1"))
+
+    assert started == [{"op": "cli.write", "name": "menu 20"}]
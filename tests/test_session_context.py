@@ -0,0 +1,139 @@
+# tests/test_session_context.py
+"""
+Unit tests for the SessionContext built at login and session restore.
+
+Tests included:
+- test_session_context_is_user_data: Same dict content, resolved
+  permissions, unknown department allowed nothing.
+- test_login_builds_context_with_employee: The logged-in employee is kept.
+- test_restored_context_loads_employee_once: Lazy, single repository call.
+- test_permission_checks_use_context: No token access, denials reported.
+- test_controller_call_never_reads_token: Authenticated actions do no
+  token I/O and no JWT verification.
+"""
+
+import uuid
+
+import pytest
+
+from app.controllers import auth_controller as auth_mod
+from app.controllers.auth_controller import AuthController
+from app.controllers.client_controller import ClientController
+from app.models.department import Department
+from app.models.employee import Employee
+from app.repositories.client_repository import ClientRepository
+from app.repositories.employee_repository import EmployeeRepository
+from app.utils import decorators
+from app.utils.auth import hash_password
+from app.utils.permissions import permissions_for
+from app.utils.session import SessionContext
+
+
+def _forbid(*_args, **_kwargs):
+    raise AssertionError("the token must not be read or verified")
+
+
+@pytest.fixture
+def employee(db_session):
+    dept = db_session.query(Department).filter_by(name="SALES").first()
+    if dept is None:
+        dept = Department(name="SALES")
+        db_session.add(dept)
+        db_session.flush()
+    emp = Employee(
+        full_name="Session User",
+        email=f"session_{uuid.uuid4().hex[:6]}@t.com",
+        password=hash_password("secret123"),
+        employee_number=f"S{uuid.uuid4().hex[:6]}",
+        department_id=dept.id,
+    )
+    db_session.add(emp)
+    db_session.commit()
+    return emp
+
+
+def test_session_context_is_user_data():
+    ctx = SessionContext({"id": 3, "department": "SUPPORT"})
+
+    assert ctx == {"id": 3, "department": "SUPPORT"}
+    assert (ctx.user_id, ctx.department) == (3, "SUPPORT")
+    assert ctx.claims == {"id": 3, "department": "SUPPORT"}
+    assert ctx.permissions == permissions_for("SUPPORT")
+    assert ctx.can("update_event") is True
+    assert ctx.can("create_client") is False
+
+    nobody = SessionContext({"id": 4, "department": "UNKNOWN"})
+    assert nobody.permissions == frozenset()
+    assert nobody.employee is None
+
+
+def test_login_builds_context_with_employee(db_session, employee, monkeypatch):
+    monkeypatch.setattr(auth_mod, "save_token", lambda _t: None)
+    auth = AuthController(EmployeeRepository(db_session))
+
+    ctx = auth.login(employee.email, "secret123")
+
+    assert isinstance(ctx, SessionContext)
+    assert auth.session is ctx
+    assert ctx.employee is employee
+    assert ctx.can("create_client") is True
+
+
+def test_restored_context_loads_employee_once(db_session, employee,
+                                              monkeypatch):
+    calls = []
+    repo = EmployeeRepository(db_session)
+    original = repo.get_by_id
+
+    def counting_get_by_id(emp_id):
+        calls.append(emp_id)
+        return original(emp_id)
+
+    monkeypatch.setattr(repo, "get_by_id", counting_get_by_id)
+    monkeypatch.setattr(auth_mod, "get_token", lambda: "dummy.jwt.token")
+    monkeypatch.setattr(
+        auth_mod,
+        "decode_token",
+        lambda _t: {"id": employee.id, "department": "SALES", "exp": 1},
+    )
+    # The repository may be attached after the session is restored
+    auth = AuthController(None)
+    ctx = auth.get_logged_in_user()
+    auth.repository = repo
+
+    assert calls == []
+    assert ctx.claims["exp"] == 1
+    assert ctx.employee is employee
+    assert ctx.employee is employee
+    assert calls == [employee.id]
+
+
+def test_permission_checks_use_context(monkeypatch):
+    denials = []
+    monkeypatch.setattr(auth_mod, "get_token", _forbid)
+    monkeypatch.setattr(auth_mod, "decode_token", _forbid)
+    monkeypatch.setattr(
+        auth_mod, "report_denial",
+        lambda action, dept: denials.append((action, dept)),
+    )
+    auth = AuthController(None)
+    auth.current_user_data = SessionContext({"id": 1, "department": "SUPPORT"})
+
+    assert auth.check_user_permission("update_event") is True
+    assert auth.check_user_permission("create_contract") is False
+    assert denials == [("create_contract", "SUPPORT")]
+
+
+def test_controller_call_never_reads_token(db_session, employee, monkeypatch):
+    monkeypatch.setattr(auth_mod, "save_token", lambda _t: None)
+    auth = AuthController(EmployeeRepository(db_session))
+    ctx = auth.login(employee.email, "secret123")
+
+    for module in (decorators, auth_mod):
+        monkeypatch.setattr(module, "get_token", _forbid)
+        monkeypatch.setattr(module, "decode_token", _forbid)
+
+    ctrl = ClientController(ClientRepository(db_session), auth)
+    assert ctrl.list_all_clients(user_data=ctx) is not None
+    assert ctrl.list_all_clients() is not None
+    assert auth.current_user_data is ctx
@@ -0,0 +1,98 @@
+# tests/test_startup.py
+"""
+Unit tests for the lazy imports and startup helpers behind main.py.
+
+Tests included:
+- test_lazy_import_defers_execution: Module code runs on first attribute use.
+- test_lazy_import_reuses_loaded_module: Loaded modules are returned as is.
+- test_preloader_returns_result_or_raises: Background build result and error.
+- test_startup_report_marks_milestones: Milestones are ordered in time.
+- test_login_path_skips_heavy_imports: Reaching the login prompt loads
+  neither SQLAlchemy, argon2, sentry_sdk nor jwt.
+"""
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from app.utils.lazy import is_loaded, lazy_import
+from app.utils.startup import Preloader, StartupReport
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def test_lazy_import_defers_execution(tmp_path, monkeypatch):
+    (tmp_path / "slow_module_probe.py").write_text(
+        "import builtins\n"
+        "builtins.slow_module_probe_runs = "
+        "getattr(builtins, 'slow_module_probe_runs', 0) + 1\n"
+        "VALUE = 42\n"
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.delitem(sys.modules, "slow_module_probe", raising=False)
+    import builtins
+
+    module = lazy_import("slow_module_probe")
+    assert not is_loaded("slow_module_probe")
+    assert getattr(builtins, "slow_module_probe_runs", 0) == 0
+
+    assert module.VALUE == 42
+    assert is_loaded("slow_module_probe")
+    assert builtins.slow_module_probe_runs == 1
+    del builtins.slow_module_probe_runs
+
+
+def test_lazy_import_reuses_loaded_module():
+    assert lazy_import("json") is json
+    assert is_loaded("json")
+    with pytest.raises(ModuleNotFoundError):
+        lazy_import("no_such_module_for_crm")
+
+
+def test_preloader_returns_result_or_raises():
+    assert Preloader(lambda: 7).start().result() == 7
+
+    def fail():
+        raise RuntimeError("database unreachable")
+
+    preload = Preloader(fail).start()
+    with pytest.raises(RuntimeError, match="unreachable"):
+        preload.result()
+    assert preload.elapsed_ms is not None
+
+
+def test_startup_report_marks_milestones():
+    report = StartupReport()
+    first = report.mark("login prompt")
+    second = report.mark("application ready")
+
+    assert 0 <= first <= second
+    assert [name for name, _, _ in report.marks] == [
+        "login prompt", "application ready"
+    ]
+
+
+def test_login_path_skips_heavy_imports(tmp_path):
+    code = (
+        "import json, main\n"
+        "from app.utils.lazy import is_loaded\n"
+        "main.AuthController(None).get_logged_in_user()\n"
+        "print(json.dumps({name: is_loaded(name) for name in "
+        "('sqlalchemy', 'argon2', 'sentry_sdk', 'jwt')}))\n"
+    )
+    # Run from an empty directory: no saved token, so the login prompt
+    out = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=tmp_path, capture_output=True, text=True, check=True,
+        env={**os.environ, "PYTHONPATH": str(ROOT)},
+    ).stdout
+
+    loaded = json.loads(out.strip().splitlines()[-1])
+    assert loaded == {
+        "sqlalchemy": False, "argon2": False, "sentry_sdk": False,
+        "jwt": False,
+    }
@@ -0,0 +1,128 @@
+# tests/test_streaming.py
+"""
+Unit tests for the streaming listing pipeline (repository -> view).
+
+Tests included:
+- test_repository_stream_is_lazy: stream() returns an iterator, not a list.
+- test_stream_unpaid_contracts_filters_in_order: Criteria and ordering apply.
+- test_controller_stream_keeps_sales_ownership: SALES only see own rows.
+- test_controller_stream_denied_returns_none: Permission check is eager.
+- test_display_rows_with_generator: Views print streamed rows.
+- test_display_rows_with_empty_generator: Empty message on empty stream.
+"""
+
+import types
+import uuid
+
+import pytest
+
+from app.controllers.contract_controller import ContractController
+from app.models.client import Client
+from app.models.contract import Contract
+from app.models.department import Department
+from app.models.employee import Employee
+from app.repositories.client_repository import ClientRepository
+from app.repositories.contract_repository import ContractRepository
+from app.views.client_view import ClientView
+from tests.helpers import DummyAuthController
+
+
+@pytest.fixture
+def stream_setup(db_session):
+    """Two sales people, each owning paid and unpaid contracts."""
+    dept = Department(name=f"STREAM_{uuid.uuid4().hex[:6]}")
+    db_session.add(dept)
+    db_session.flush()
+
+    owners = [
+        Employee(
+            full_name=f"Owner {i}",
+            email=f"owner{i}_{uuid.uuid4().hex[:6]}@t.com",
+            password="h",
+            employee_number=f"O{i}{uuid.uuid4().hex[:4]}",
+            department_id=dept.id,
+        )
+        for i in range(2)
+    ]
+    db_session.add_all(owners)
+    db_session.flush()
+
+    client = Client(
+        full_name="Streamed",
+        email=f"stream_{uuid.uuid4().hex[:6]}@t.com",
+        phone="0",
+        company_name="S",
+        sales_contact_id=owners[0].id,
+    )
+    db_session.add(client)
+    db_session.flush()
+
+    for i in range(6):
+        db_session.add(Contract(
+            total_amount=100,
+            remaining_amount=50 if i % 2 else 0,
+            is_signed=True,
+            client_id=client.id,
+            sales_contact_id=owners[i % 2].id,
+        ))
+    db_session.commit()
+
+    return {"db": db_session, "owners": owners}
+
+
+def test_repository_stream_is_lazy(stream_setup):
+    repo = ClientRepository(stream_setup["db"])
+
+    rows = repo.stream_all_clients()
+
+    assert isinstance(rows, types.GeneratorType)
+    assert next(rows).full_name == "Streamed"
+
+
+def test_stream_unpaid_contracts_filters_in_order(stream_setup):
+    repo = ContractRepository(stream_setup["db"])
+
+    contracts = list(repo.stream_unpaid_contracts(profile="contract_list"))
+    ids = [c.id for c in contracts]
+
+    assert len(contracts) == 3
+    assert ids == sorted(ids)
+    assert all(c.remaining_amount > 0 for c in contracts)
+
+
+def test_controller_stream_keeps_sales_ownership(stream_setup):
+    owner = stream_setup["owners"][1]
+    auth = DummyAuthController(allowed={"read_contract"})
+    ctrl = ContractController(ContractRepository(stream_setup["db"]), auth)
+
+    rows = ctrl.list_unpaid_contracts(
+        user_data={"id": owner.id, "department": "SALES"}, stream=True
+    )
+
+    assert not isinstance(rows, list)
+    assert [c.sales_contact_id for c in rows] == [owner.id] * 3
+
+
+def test_controller_stream_denied_returns_none(stream_setup):
+    auth = DummyAuthController(allowed=set())
+    ctrl = ContractController(ContractRepository(stream_setup["db"]), auth)
+
+    rows = ctrl.list_unsigned_contracts(
+        user_data={"id": 1, "department": "SALES"}, stream=True
+    )
+    assert rows is None
+
+
+def test_display_rows_with_generator(stream_setup, capsys):
+    repo = ClientRepository(stream_setup["db"])
+
+    ClientView().display_clients(repo.stream_all_clients())
+
+    out = capsys.readouterr().out
+    assert "=== Clients List ===" in out
+    assert "Name: Streamed" in out
+
+
+def test_display_rows_with_empty_generator(capsys):
+    ClientView().display_clients(c for c in [])
+    assert "No clients found." in capsys.readouterr().out
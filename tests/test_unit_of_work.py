@@ -0,0 +1,274 @@
+# tests/test_unit_of_work.py
+"""
+Unit tests for the UnitOfWork transaction context.
+
+Tests included:
+- test_workflow_commits_once: Contract, signature and event share one commit.
+- test_error_rolls_back_whole_unit: Nothing persists when the block fails.
+- test_savepoint_keeps_earlier_steps: A failed step only undoes itself.
+- test_nested_unit_joins_outer: Only the outermost unit commits.
+- test_single_action_still_commits: Repository calls outside a unit commit.
+- test_controller_workflow_commits_once: Create, sign, plan in one commit.
+- test_failed_workflow_step_saves_nothing: A refused step rolls all back.
+- test_workflow_event_needs_controller: event_data alone is rejected.
+- test_cancel_discards_after_commit_callbacks: Side effects wait for commit.
+"""
+
+import uuid
+
+import pytest
+from sqlalchemy.exc import IntegrityError
+
+from app.controllers.contract_controller import ContractController
+from app.controllers.event_controller import EventController
+from app.models.client import Client
+from app.models.contract import Contract
+from app.models.department import Department
+from app.models.employee import Employee
+from app.models.event import Event
+from app.repositories.client_repository import ClientRepository
+from app.repositories.contract_repository import ContractRepository
+from app.repositories.event_repository import EventRepository
+from app.repositories.unit_of_work import (
+    UnitOfWork,
+    after_commit,
+    in_unit_of_work,
+)
+from tests.helpers import DummyAuthController
+
+
+@pytest.fixture
+def uow_setup(db_session):
+    """One sales person with one client."""
+    dept = Department(name=f"UOW_{uuid.uuid4().hex[:6]}")
+    db_session.add(dept)
+    db_session.flush()
+    sales = Employee(
+        full_name="Sales",
+        email=f"uow_{uuid.uuid4().hex[:6]}@t.com",
+        password="h",
+        employee_number=f"U{uuid.uuid4().hex[:6]}",
+        department_id=dept.id,
+    )
+    db_session.add(sales)
+    db_session.flush()
+    client = Client(
+        full_name="Client",
+        email=f"uowc_{uuid.uuid4().hex[:6]}@t.com",
+        phone="0",
+        company_name="C",
+        sales_contact_id=sales.id,
+    )
+    db_session.add(client)
+    db_session.commit()
+    return {"db": db_session, "sales": sales, "client": client}
+
+
+def _new_client(email, sales_contact_id):
+    return Client(
+        full_name="New",
+        email=email,
+        phone="0",
+        company_name="N",
+        sales_contact_id=sales_contact_id,
+    )
+
+
+def test_workflow_commits_once(uow_setup, commits):
+    db = uow_setup["db"]
+    auth = DummyAuthController(
+        {"create_contract", "update_contract", "create_event"}
+    )
+    contract_ctrl = ContractController(ContractRepository(db), auth)
+    event_ctrl = EventController(EventRepository(db), auth)
+    user = {"id": uow_setup["sales"].id, "department": "SALES"}
+
+    with contract_ctrl.repository.unit_of_work():
+        contract = contract_ctrl.create_contract(
+            user_data=user,
+            contract_data={
+                "client_id": uow_setup["client"].id,
+                "total_amount": 100,
+                "remaining_amount": 100,
+            },
+        )
+        contract = contract_ctrl.update_contract(
+            user_data=user, contract_id=contract.id, updates={"is_signed": True}
+        )
+        event_ctrl.create_event(
+            user_data=user,
+            event_data={
+                "name": "Kickoff",
+                "location": "L",
+                "attendees": 5,
+                "notes": "",
+                "client_id": uow_setup["client"].id,
+                "contract_id": contract.id,
+            },
+            contract=contract,
+        )
+        assert commits == []
+
+    assert len(commits) == 1
+    assert not in_unit_of_work(db)
+    assert db.query(Contract).one().is_signed is True
+    assert db.query(Event).count() == 1
+
+
+def test_error_rolls_back_whole_unit(uow_setup):
+    db = uow_setup["db"]
+    repo = ClientRepository(db)
+    sales_id = uow_setup["sales"].id
+
+    with pytest.raises(RuntimeError):
+        with repo.unit_of_work():
+            repo.add(_new_client("first@t.com", sales_id))
+            raise RuntimeError("abort workflow")
+
+    assert repo.get_by_email("first@t.com") is None
+    assert not in_unit_of_work(db)
+
+
+def test_savepoint_keeps_earlier_steps(uow_setup):
+    db = uow_setup["db"]
+    repo = ClientRepository(db)
+    sales_id = uow_setup["sales"].id
+    duplicate = uow_setup["client"].email
+
+    with repo.unit_of_work() as uow:
+        repo.add(_new_client("kept@t.com", sales_id))
+        with pytest.raises(IntegrityError):
+            with uow.savepoint():
+                repo.add(_new_client(duplicate, sales_id))
+        repo.add(_new_client("after@t.com", sales_id))
+
+    emails = {c.email for c in db.query(Client)}
+    assert {"kept@t.com", "after@t.com"} <= emails
+    assert len(emails) == 3
+
+
+def test_nested_unit_joins_outer(uow_setup, commits):
+    db = uow_setup["db"]
+    repo = ClientRepository(db)
+    sales_id = uow_setup["sales"].id
+
+    with UnitOfWork(db):
+        with UnitOfWork(db):
+            repo.add(_new_client("inner@t.com", sales_id))
+        assert commits == []
+        assert in_unit_of_work(db)
+
+    assert len(commits) == 1
+
+
+def test_single_action_still_commits(uow_setup, commits):
+    repo = ClientRepository(uow_setup["db"])
+
+    repo.add(_new_client("solo@t.com", uow_setup["sales"].id))
+
+    assert len(commits) == 1
+
+
+@pytest.fixture
+def signatures(monkeypatch):
+    """Record the contract.signed audit calls."""
+    audited = []
+    monkeypatch.setattr(
+        ContractController,
+        "_audit_signed",
+        staticmethod(
+            lambda user, contract_id, client_id: audited.append(contract_id)
+        ),
+    )
+    return audited
+
+
+def _workflow(uow_setup, allowed):
+    db = uow_setup["db"]
+    auth = DummyAuthController(allowed)
+    contract_ctrl = ContractController(ContractRepository(db), auth)
+    event_ctrl = EventController(EventRepository(db), auth)
+    user = {"id": uow_setup["sales"].id, "department": "SALES"}
+    return contract_ctrl.create_signed_contract(
+        user_data=user,
+        contract_data={
+            "client_id": uow_setup["client"].id,
+            "total_amount": 100,
+            "remaining_amount": 100,
+        },
+        event_data={
+            "name": "Kickoff",
+            "location": "L",
+            "attendees": 5,
+            "notes": "",
+        },
+        event_controller=event_ctrl,
+    )
+
+
+def test_controller_workflow_commits_once(uow_setup, commits, signatures):
+    contract = _workflow(
+        uow_setup, {"create_contract", "update_contract", "create_event"}
+    )
+
+    db = uow_setup["db"]
+    assert len(commits) == 1
+    assert db.query(Contract).one().is_signed is True
+    assert db.query(Event).one().contract_id == contract.id
+    assert signatures == [contract.id]
+
+
+def test_failed_workflow_step_saves_nothing(
+    uow_setup, commits, signatures, capsys
+):
+    # The event step is refused after the contract was created and signed
+    contract = _workflow(uow_setup, {"create_contract", "update_contract"})
+
+    db = uow_setup["db"]
+    assert contract is None
+    assert commits == []
+    assert db.query(Contract).count() == 0
+    assert db.query(Event).count() == 0
+    assert signatures == []
+    assert not in_unit_of_work(db)
+    assert "Contract not saved." in capsys.readouterr().out
+
+
+def test_workflow_event_needs_controller(uow_setup, commits):
+    db = uow_setup["db"]
+    ctrl = ContractController(
+        ContractRepository(db), DummyAuthController({"create_contract"})
+    )
+    user = {"id": uow_setup["sales"].id, "department": "SALES"}
+
+    with pytest.raises(ValueError):
+        ctrl.create_signed_contract(
+            user_data=user,
+            contract_data={"client_id": uow_setup["client"].id},
+            event_data={"name": "Kickoff"},
+        )
+
+    assert commits == []
+    assert not in_unit_of_work(db)
+    assert db.query(Contract).count() == 0
+
+
+def test_cancel_discards_after_commit_callbacks(uow_setup):
+    db = uow_setup["db"]
+    repo = ClientRepository(db)
+    sales_id = uow_setup["sales"].id
+    calls = []
+
+    with UnitOfWork(db) as uow:
+        repo.add(_new_client("cancel@t.com", sales_id))
+        after_commit(db, lambda: calls.append("cancelled"))
+        uow.cancel()
+    with UnitOfWork(db) as uow:
+        with pytest.raises(RuntimeError):
+            with uow.savepoint():
+                after_commit(db, lambda: calls.append("savepoint"))
+                raise RuntimeError("step failed")
+        after_commit(db, lambda: calls.append("committed"))
+
+    assert calls == ["committed"]
+    assert repo.get_by_email("cancel@t.com") is None
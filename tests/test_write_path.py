@@ -0,0 +1,259 @@
+# tests/test_write_path.py
+"""
+Unit tests for the refresh-free write path of BaseRepository.
+
+Tests included:
+- test_add_default_reloads_lazily_after_commit: No SELECT until a read.
+- test_add_without_refresh_fetches_nothing: refresh=False, INSERT only;
+  only the written object is kept loaded.
+- test_add_with_refresh_rereads_row: refresh=True keeps the old behavior.
+- test_update_default_reloads_lazily_after_commit: No SELECT until a read.
+- test_update_without_refresh_fetches_nothing: refresh=False, UPDATE only.
+- test_create_client_controller_reads_nothing_back: INSERT only.
+- test_update_contract_controller_reads_nothing_back: One SELECT (the
+  ownership check) and the UPDATE.
+- test_update_reloads_moved_relationship: Changing a FK refreshes the relation.
+- test_bulk_update_expires_stale_instances: Loaded objects see bulk changes.
+- test_session_sees_writes_committed_by_others: No stale reads after commit.
+- test_session_factory_expires_on_commit_by_default: Interactive sessions.
+- test_session_factory_can_keep_objects_after_commit: Batch sessions.
+"""
+
+import uuid
+
+import pytest
+from sqlalchemy import inspect
+from sqlalchemy.orm import Session
+
+from app.controllers.client_controller import ClientController
+from app.controllers.contract_controller import ContractController
+from app.models.client import Client
+from app.models.contract import Contract
+from app.models.department import Department
+from app.models.employee import Employee
+from app.repositories.client_repository import ClientRepository
+from app.repositories.contract_repository import ContractRepository
+from config.database import get_session_factory
+from tests.helpers import DummyAuthController
+
+
+@pytest.fixture
+def session(db_session):
+    """Session configured like the application's session factory."""
+    assert db_session.expire_on_commit is True
+    return db_session
+
+
+@pytest.fixture
+def sales_people(session):
+    dept = Department(name=f"WRITE_{uuid.uuid4().hex[:6]}")
+    session.add(dept)
+    session.flush()
+    people = [
+        Employee(
+            full_name=f"Sales {i}",
+            email=f"w{i}_{uuid.uuid4().hex[:6]}@t.com",
+            password="h",
+            employee_number=f"W{i}{uuid.uuid4().hex[:4]}",
+            department_id=dept.id,
+        )
+        for i in range(2)
+    ]
+    session.add_all(people)
+    session.commit()
+    return people
+
+
+def _new_client(sales_contact_id):
+    return Client(
+        full_name="Writer",
+        email=f"writer_{uuid.uuid4().hex[:6]}@t.com",
+        phone="0",
+        company_name="W",
+        sales_contact_id=sales_contact_id,
+    )
+
+
+def test_add_default_reloads_lazily_after_commit(
+    session, sales_people, statements
+):
+    repo = ClientRepository(session)
+    owner_id = sales_people[0].id
+    statements.clear()
+
+    client = repo.add(_new_client(owner_id))
+    assert statements == ["INSERT"]
+    statements.clear()
+
+    # Expired on commit: the first read goes back to the database
+    assert client.full_name == "Writer"
+    assert client.creation_date is not None
+    assert statements == ["SELECT"]
+
+
+def test_add_without_refresh_fetches_nothing(
+    session, sales_people, statements
+):
+    repo = ClientRepository(session)
+    owner_id = sales_people[0].id
+    statements.clear()
+
+    client = repo.add(_new_client(owner_id), refresh=False)
+    assert statements == ["INSERT"]
+    statements.clear()
+
+    assert client.id is not None
+    assert client.full_name == "Writer"
+    if session.get_bind().dialect.insert_returning:
+        # Server defaults came back with the INSERT
+        assert client.creation_date is not None
+    assert statements == []
+    # Only the object written is kept; the others still expire on commit
+    assert "full_name" in inspect(sales_people[1]).expired_attributes
+
+
+def test_add_with_refresh_rereads_row(session, sales_people, statements):
+    repo = ClientRepository(session)
+    owner_id = sales_people[0].id
+    statements.clear()
+
+    repo.add(_new_client(owner_id), refresh=True)
+
+    assert statements == ["INSERT", "SELECT"]
+
+
+def test_update_default_reloads_lazily_after_commit(
+    session, sales_people, statements
+):
+    repo = ClientRepository(session)
+    client = repo.add(_new_client(sales_people[0].id), refresh=False)
+    statements.clear()
+
+    # The client is still loaded: only the UPDATE is sent
+    updated = repo.update(client.id, {"phone": "1234"})
+    assert statements == ["UPDATE"]
+    statements.clear()
+
+    assert updated.phone == "1234"
+    assert updated.last_update is not None
+    assert statements == ["SELECT"]
+
+
+def test_update_without_refresh_fetches_nothing(
+    session, sales_people, statements
+):
+    repo = ClientRepository(session)
+    client = repo.add(_new_client(sales_people[0].id), refresh=False)
+    statements.clear()
+
+    updated = repo.update(client.id, {"phone": "1234"}, refresh=False)
+    assert updated.phone == "1234"
+    assert updated.full_name == "Writer"
+
+    assert statements == ["UPDATE"]
+
+
+def test_create_client_controller_reads_nothing_back(
+    session, sales_people, statements, capsys
+):
+    ctrl = ClientController(
+        ClientRepository(session), DummyAuthController({"create_client"})
+    )
+    user = {"id": sales_people[0].id, "department": "SALES"}
+    statements.clear()
+
+    # The controller reads the new client back to print its name
+    created = ctrl.create_client(
+        user_data=user,
+        client_data={
+            "full_name": "Controller",
+            "email": f"ctrl_{uuid.uuid4().hex[:6]}@t.com",
+            "phone": "0",
+            "company_name": "C",
+        },
+    )
+    assert created.id is not None
+    assert created.sales_contact_id == user["id"]
+
+    assert "Client 'Controller' created." in capsys.readouterr().out
+    assert statements == ["INSERT"]
+
+
+def test_update_contract_controller_reads_nothing_back(
+    session, sales_people, statements, capsys
+):
+    client = ClientRepository(session).add(
+        _new_client(sales_people[0].id), refresh=False
+    )
+    contract = Contract(
+        total_amount=100,
+        remaining_amount=100,
+        is_signed=False,
+        client_id=client.id,
+        sales_contact_id=sales_people[0].id,
+    )
+    ContractRepository(session).add(contract, refresh=False)
+    ctrl = ContractController(
+        ContractRepository(session), DummyAuthController({"update_contract"})
+    )
+    user = {"id": sales_people[0].id, "department": "SALES"}
+    contract_id, client_id = contract.id, client.id
+    statements.clear()
+
+    # The controller reads the contract back to print and audit it
+    updated = ctrl.update_contract(
+        user_data=user, contract_id=contract_id, updates={"is_signed": True}
+    )
+    assert updated.is_signed is True
+    assert updated.client_id == client_id
+
+    assert f"Contract {contract_id} updated." in capsys.readouterr().out
+    # The ownership check loads the contract, update() reuses it
+    assert statements == ["SELECT", "UPDATE"]
+
+
+def test_update_reloads_moved_relationship(session, sales_people):
+    repo = ClientRepository(session)
+    client = repo.add(_new_client(sales_people[0].id))
+    assert client.sales_contact.id == sales_people[0].id
+
+    repo.update(client.id, {"sales_contact_id": sales_people[1].id})
+
+    assert client.sales_contact.id == sales_people[1].id
+
+
+def test_bulk_update_expires_stale_instances(session, sales_people):
+    repo = ClientRepository(session)
+    client = repo.add(_new_client(sales_people[0].id))
+
+    repo.bulk_update([client.id], {"phone": "999"})
+
+    assert client.phone == "999"
+
+
+def test_session_sees_writes_committed_by_others(session, sales_people):
+    repo = ClientRepository(session)
+    client = repo.add(_new_client(sales_people[0].id))
+    other = Session(
+        bind=session.get_bind(), join_transaction_mode="create_savepoint"
+    )
+    try:
+        ClientRepository(other).update(client.id, {"phone": "other"})
+        repo.update(client.id, {"company_name": "A"})
+
+        assert repo.get_by_id(client.id).phone == "other"
+    finally:
+        other.close()
+
+
+def test_session_factory_expires_on_commit_by_default(db_engine):
+    factory = get_session_factory(db_engine)
+
+    assert factory.kw["expire_on_commit"] is True
+    assert factory.kw["bind"] is db_engine
+
+
+def test_session_factory_can_keep_objects_after_commit(db_engine):
+    factory = get_session_factory(db_engine, expire_on_commit=False)
+
+    assert factory.kw["expire_on_commit"] is False